@@ -1,10 +1,23 @@
 import os
+import statistics
 import pytest
-import datetime
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from tests.utils.browser import RecyclableDriver, start_chrome_driver
+from tests.utils.browser_events import BrowserEventMonitor, BrowserEventWarning
+from tests.utils.cassette import CassetteRecorder
+from tests.utils.commands import CommandAccounting
+from tests.utils.diagnostics import DiagnosticsRecorder
+from tests.utils.fingerprint import IncrementalRun, NAppFingerprinter
+from tests.utils.interception import ApiInterceptor
+from tests.utils.journal import JOURNAL
+from tests.utils.memory import MemoryTracker, napp_from_module, sample_memory
+from tests.utils.perf_history import PerfHistory, compare, report_lines
+from tests.utils.profiling import HarnessProfiler
+from tests.utils.readiness import COMPONENT_LOADS
+from tests.utils.scenarios import SCENARIOS_DIR, build_window, load_scenarios
+from tests.utils.throttling import NO_THROTTLING, Throttler, load_profiles
+from tests.utils.timing import PHASES, SLOWarning, slo_violations
+from tests.utils.topology import TopologySnapshot
 
 # --- Environment Variable Loading ---
 try:
@@ -18,6 +31,149 @@ except ImportError:
 except Exception as e:
     print(f"Error loading .env file: {e}")
 
+# --- Session-wide harness state ---
+
+memory_tracker_key = pytest.StashKey[MemoryTracker]()
+diagnostics_key = pytest.StashKey[DiagnosticsRecorder]()
+incremental_key = pytest.StashKey[IncrementalRun]()
+perf_history_key = pytest.StashKey[PerfHistory]()
+interactive_key = pytest.StashKey[dict]()
+cassette_key = pytest.StashKey[CassetteRecorder]()
+interceptor_key = pytest.StashKey[ApiInterceptor]()
+throttler_key = pytest.StashKey[Throttler]()
+throttle_timings_key = pytest.StashKey[dict]()
+throttle_profile_key = pytest.StashKey[str]()
+profiler_key = pytest.StashKey[HarnessProfiler]()
+commands_key = pytest.StashKey[CommandAccounting]()
+browser_events_key = pytest.StashKey[BrowserEventMonitor]()
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--incremental", action="store_true", default=False,
+        help="Skip test modules whose NApp fingerprint and test code are unchanged since their last green run."
+    )
+    parser.addoption(
+        "--cassette", choices=("record", "replay"), default=None,
+        help="Record the HTTP requests of each test to a cassette, or replay them without a controller."
+    )
+    parser.addoption(
+        "--cassette-dir", default=os.getenv("CASSETTE_DIR", "tests/cassettes"),
+        help="Directory of the cassettes (default: tests/cassettes)."
+    )
+    parser.addoption(
+        "--intercept", metavar="PROFILE", default=os.getenv("INTERCEPT_PROFILE"),
+        help="Serve API routes to the browser from the fixtures of an interception profile "
+             "(tests/scenarios/interception.yaml)."
+    )
+    parser.addoption(
+        "--throttle", metavar="PROFILES", default=os.getenv("THROTTLE_PROFILES"),
+        help="Comma separated network/CPU throttling profiles (tests/scenarios/throttling.yaml, 'none' for "
+             "unthrottled). With several profiles, every UI test runs once under each of them."
+    )
+    parser.addoption(
+        "--profile-harness", action="store_true", default=False,
+        help="Sample the Python side of each test and split its time between page-object methods, WebDriver, "
+             "HTTP and sleeps. Folded stacks are written to HARNESS_PROFILE_DIR (default: reports/profiles)."
+    )
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "slo(strict=True, **budgets): fail (or only warn with strict=False) when a page-object phase "
+        "(navigate, interactive, component_fetch, component_compile, fill, submit, submit_to_visible, verify, list, ...) takes longer than its budget in seconds"
+    )
+    config.addinivalue_line("markers", "api: browser-free test, set on every test that does not request the driver")
+    config.addinivalue_line("markers", "ui: test driving the browser, set on every test that requests the driver")
+    config.addinivalue_line(
+        "markers",
+        "throttle(profile): run the test under a throttling profile of tests/scenarios/throttling.yaml, "
+        "whatever --throttle says"
+    )
+    config.addinivalue_line(
+        "markers",
+        "webdriver_budget(commands=None, seconds=None, strict=True): fail (or only warn with strict=False) when "
+        "the test issues more WebDriver commands, or spends more seconds in them, than its budget"
+    )
+    config.addinivalue_line(
+        "markers",
+        "browser_events(allow_status=(), allow_console=False): API response statuses (e.g. 404 or '4xx') "
+        "and console errors the UI is expected to produce in this test"
+    )
+    config.stash[memory_tracker_key] = MemoryTracker.from_env()
+    config.stash[diagnostics_key] = DiagnosticsRecorder.from_env()
+    config.stash[commands_key] = CommandAccounting.from_env()
+    # The failure diagnostics buffer the console and network events streamed by the monitor
+    config.stash[browser_events_key] = BrowserEventMonitor.from_env(stream=config.stash[diagnostics_key] is not None)
+    if config.stash[diagnostics_key] and config.stash[browser_events_key]:
+        config.stash[browser_events_key].listeners.append(config.stash[diagnostics_key].on_browser_event)
+        config.stash[diagnostics_key].streamed = True
+    config.stash[perf_history_key] = PerfHistory.from_env()
+    if config.stash[perf_history_key] and is_xdist_worker(config):
+        # The runs of all the workers make one session of the history
+        config.stash[perf_history_key].session = config.workerinput["perf_history_session"]
+    config.stash[interactive_key] = {}
+    if config.getoption("incremental"):
+        config.stash[incremental_key] = IncrementalRun(config.cache, NAppFingerprinter(
+            os.getenv('BASE_URL', 'http://localhost:18181'), int(os.getenv('DEFAULT_TIMEOUT', '10'))))
+    if config.getoption("cassette"):
+        recorder = config.stash[cassette_key] = CassetteRecorder(config.getoption("cassette_dir"),
+                                                                 config.getoption("cassette"))
+        recorder.install()
+    if config.getoption("intercept"):
+        config.stash[interceptor_key] = ApiInterceptor.from_profile(config.getoption("intercept"))
+        if config.stash[perf_history_key]:
+            config.stash[perf_history_key].environment['intercept'] = config.getoption("intercept")
+    if config.getoption("profile_harness"):
+        config.stash[profiler_key] = HarnessProfiler.from_env()
+    config.stash[throttler_key] = Throttler(load_profiles())
+    config.stash[throttle_timings_key] = {}
+    unknown = set(throttle_profiles(config)) - set(config.stash[throttler_key].profiles)
+    if unknown:
+        raise pytest.UsageError(f"Unknown throttling profile(s): {', '.join(sorted(unknown))}")
+    if config.getoption("throttle") and config.stash[perf_history_key]:
+        config.stash[perf_history_key].environment['throttle'] = config.getoption("throttle")
+
+def throttle_profiles(config):
+    """Throttling profiles given with --throttle, [] when the run is not throttled."""
+    return [profile.strip() for profile in (config.getoption("throttle") or "").split(",") if profile.strip()]
+
+def pytest_generate_tests(metafunc):
+    # Several throttling profiles: run each UI test under every one of them
+    profiles = throttle_profiles(metafunc.config)
+    if (len(profiles) > 1 and "driver" in metafunc.fixturenames
+            and metafunc.definition.get_closest_marker("throttle") is None):
+        metafunc.parametrize("throttling", profiles, indirect=True)
+
+def pytest_unconfigure(config):
+    recorder = config.stash.get(cassette_key, None)
+    if recorder:
+        recorder.uninstall()
+
+def is_xdist_worker(config):
+    """Whether this process is a pytest-xdist worker, not the controller."""
+    return hasattr(config, "workerinput")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # pytest-xdist: hand the session id of the performance history to each worker
+    history = node.config.stash.get(perf_history_key, None)
+    node.workerinput["perf_history_session"] = history.session if history else None
+
+def pytest_sessionstart(session):
+    # Delete what killed or failed runs left on the controller, by id from the journal
+    if not JOURNAL.open_from_env():
+        return
+    if is_xdist_worker(session.config) or session.config.getoption("cassette"):
+        # Only the controller cleans up, before the workers start. Recorded and
+        # replayed runs must not send requests outside the tests.
+        return
+    deleted, pending, in_use = JOURNAL.cleanup(int(os.getenv('DEFAULT_TIMEOUT', '10')))
+    if deleted or pending or in_use:
+        print(f"Resource journal: deleted {len(deleted)} resource(s) left by previous runs, "
+              f"{len(pending)} still pending, {len(in_use)} of sessions still running")
+    for entry in pending:
+        print(f"Could not delete {entry['kind']} {entry['url']}")
+
 # --- Fixtures for Configuration ---
 
 @pytest.fixture(scope="session")
@@ -36,234 +192,429 @@ def default_timeout():
     """Default timeout for Selenium waits."""
     return int(os.getenv('DEFAULT_TIMEOUT', '10'))
 
+@pytest.fixture(scope="session")
+def topology(request, default_timeout):
+    """
+    Topology snapshot shared by the session. Tests changing the topology
+    state must call topology.invalidate(). With --intercept, the routes of the
+    profile are read from its fixtures, like the browser does.
+    """
+    interceptor = request.config.stash.get(interceptor_key, None)
+    return TopologySnapshot.from_env(default_timeout, interceptor.payload_for if interceptor else None)
+
 # --- Fixture for WebDriver Setup ---
 
 @pytest.fixture(scope="session")
-def driver(default_timeout):
+def driver(request, default_timeout):
     """
     Pytest fixture to set up and tear down the Selenium WebDriver (ChromeDriver).
+    Chrome starts on the first WebDriver call, so tests that only use the API
+    never start it. The browser can be recycled between tests, see memory_sampling.
     """
-    options = Options()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--remote-debugging-port=9222")
-    options.add_argument("--window-size=1920,1080")
-    
-    # Headless mode controlled by environment variable (default to true)
-    if os.getenv("HEADLESS", "true").lower() != "false":
-        options.add_argument("--headless=new")
-        
-    # Use the specified path for chromedriver
-    try:
-        service = Service("/usr/local/bin/chromedriver")
-        driver = webdriver.Chrome(service=service, options=options)
-        print("\nChromeDriver successfully initialized.")
-    except Exception as e:
-        print(f"\nError initializing ChromeDriver: {e}")
-        # Fallback to system path if service path fails
-        driver = webdriver.Chrome(options=options)
-
-    driver.implicitly_wait(default_timeout)
-    
+    driver = RecyclableDriver(lambda: start_chrome_driver(default_timeout))
+    recorder = request.config.stash[diagnostics_key]
+    if recorder:
+        driver.command_listeners.append(recorder.on_command)
+    accounting = request.config.stash[commands_key]
+    if accounting:
+        driver.command_listeners.append(accounting.on_command)
+    interceptor = request.config.stash.get(interceptor_key, None)
+    if interceptor:
+        driver.start_listeners.append(interceptor.attach)
+    driver.start_listeners.append(request.config.stash[throttler_key].attach)
+    monitor = request.config.stash[browser_events_key]
+    if monitor:
+        driver.start_listeners.append(monitor.attach)
+
     yield driver
 
+    if interceptor:
+        interceptor.detach()
+    if monitor:
+        monitor.detach()
     print("\nClosing ChromeDriver.")
     driver.quit()
 
+# --- API cassettes ---
+
+@pytest.fixture(autouse=True)
+def cassette(request):
+    """Record or replay the HTTP requests of the test, see CassetteRecorder."""
+    recorder = request.config.stash.get(cassette_key, None)
+    if not recorder:
+        yield None
+        return
+
+    # Named from the tests directory, the node id depends on the rootdir pytest picked
+    module = request.node.path.relative_to(Path(__file__).parent).as_posix()
+    recorder.start("::".join([module, *request.node.nodeid.split("::")[1:]]))
+    yield recorder.cassette
+    recorder.stop()
+
+# --- Network and CPU throttling ---
+
+@pytest.fixture(autouse=True)
+def throttling(request):
+    """
+    Throttling profile of the UI test: its @pytest.mark.throttle, else its
+    --throttle parameter, else the single --throttle profile. Yields the
+    profile name, None when the run is not throttled.
+    """
+    marker = request.node.get_closest_marker("throttle")
+    profiles = throttle_profiles(request.config)
+    if "driver" not in request.fixturenames or (marker is None and not profiles):
+        yield None
+        return
+
+    if marker is not None:
+        profile = marker.args[0]
+    else:
+        profile = getattr(request, "param", profiles[0])
+    throttler = request.config.stash[throttler_key]
+    if profile not in throttler.profiles:
+        pytest.fail(f"Unknown throttling profile: {profile}", pytrace=False)
+    driver = request.getfixturevalue("driver")
+    # A browser that is not started yet is throttled when it starts
+    throttler.use(profile, driver.wrapped_driver if driver.started else None)
+    request.node.stash[throttle_profile_key] = profile
+    yield profile
+
+# --- Browser memory tracking ---
+
+@pytest.fixture(autouse=True)
+def memory_sampling(request):
+    """
+    Sample JS heap, DOM nodes and Chrome RSS around each UI test and recycle
+    the driver when a DRIVER_RECYCLE_* threshold is exceeded.
+    """
+    if "driver" not in request.fixturenames:
+        yield
+        return
+
+    driver = request.getfixturevalue("driver")
+    tracker = request.config.stash[memory_tracker_key]
+    # Sampling must not start the browser, tests may never use it
+    before = sample_memory(driver) if driver.started else {}
+
+    yield
+
+    if not driver.started:
+        return
+    after = sample_memory(driver)
+    tracker.record(request.node.nodeid, napp_from_module(request.module.__name__), before, after)
+    reason = tracker.should_recycle(after)
+    if reason:
+        print(f"\nRecycling ChromeDriver: {reason}")
+        driver.recycle()
+        tracker.recycles.append((request.node.nodeid, reason))
+
+# --- Page-object phase timings ---
+
+@pytest.fixture(autouse=True)
+def phase_timings():
+    """Phase durations of the running test, recorded by the @timed_phase page-object methods."""
+    PHASES.reset()
+    yield PHASES
+
+def check_slo(item, report):
+    """Turn a passed test into a failure (or a warning) when a phase exceeded its @pytest.mark.slo budget."""
+    marker = item.get_closest_marker("slo")
+    if marker is None or not report.passed:
+        return
+    budgets = dict(marker.kwargs)
+    strict = budgets.pop("strict", True) and os.getenv("SLO_MODE", "fail").lower() != "warn"
+    violations = slo_violations(budgets)
+    if not violations:
+        return
+    message = "SLO exceeded: " + "; ".join(violations)
+    if strict:
+        report.outcome = "failed"
+        report.longrepr = message
+    else:
+        item.warn(SLOWarning(message))
+
+# --- WebDriver command accounting ---
+
+@pytest.fixture(autouse=True)
+def command_accounting(request):
+    """Count the WebDriver commands of each UI test, see CommandAccounting."""
+    accounting = request.config.stash[commands_key]
+    if not accounting or "driver" not in request.fixturenames:
+        yield None
+        return
+
+    accounting.start(request.node.nodeid)
+    yield accounting
+    accounting.stop()
+
+def check_webdriver_budget(item, report):
+    """Turn a passed test into a failure (or a warning) when it went over its @pytest.mark.webdriver_budget."""
+    marker = item.get_closest_marker("webdriver_budget")
+    accounting = item.config.stash[commands_key]
+    if marker is None or accounting is None or not report.passed:
+        return
+    budget = dict(marker.kwargs)
+    strict = budget.pop("strict", True) and os.getenv("SLO_MODE", "fail").lower() != "warn"
+    violations = accounting.budget_violations(item.nodeid, **budget)
+    if not violations:
+        return
+    message = "WebDriver budget exceeded: " + "; ".join(violations)
+    if strict:
+        report.outcome = "failed"
+        report.longrepr = message
+    else:
+        item.warn(SLOWarning(message))
+
+# --- Console errors and failed requests ---
+
+@pytest.fixture(autouse=True)
+def browser_events(request):
+    """Collect the browser errors and slow responses of each UI test, see BrowserEventMonitor."""
+    monitor = request.config.stash[browser_events_key]
+    if not monitor or "driver" not in request.fixturenames:
+        yield None
+        return
+
+    # After the reset of the phase log, so the step stack of this test is the one watched
+    request.getfixturevalue("phase_timings")
+    monitor.start(request.node.nodeid, PHASES.steps())
+    yield monitor
+    monitor.stop()
+
+def check_browser_events(item, report):
+    """Fail a passed test (or warn with BROWSER_EVENTS=warn) on the browser errors it produced."""
+    monitor = item.config.stash[browser_events_key]
+    if not monitor or monitor.mode == "off" or monitor.nodeid != item.nodeid or not monitor.attached:
+        return
+    events = monitor.collected()
+    if not events:
+        return
+    report.sections.append(("browser events", "\n".join(map(monitor.format, events))))
+    marker = item.get_closest_marker("browser_events")
+    failures = monitor.failures(events, **(marker.kwargs if marker else {}))
+    slow = [event for event in events if event['kind'] == 'slow']
+    if slow:
+        item.warn(BrowserEventWarning("Slow API responses: " + "; ".join(map(monitor.format, slow))))
+    if not failures or not report.passed:
+        return
+    message = "Browser errors: " + "; ".join(map(monitor.format, failures))
+    if monitor.mode == "fail":
+        report.outcome = "failed"
+        report.longrepr = message
+    else:
+        item.warn(BrowserEventWarning(message))
+
+# --- Failure diagnostics ---
+
+@pytest.fixture(autouse=True)
+def diagnostics(request):
+    """Record the recent WebDriver commands of each UI test, see DiagnosticsRecorder."""
+    recorder = request.config.stash[diagnostics_key]
+    if not recorder or "driver" not in request.fixturenames:
+        yield
+        return
+
+    recorder.start(request.node.nodeid, request.getfixturevalue("driver"))
+    yield
+    recorder.stop()
+
+# --- Harness profiling ---
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    """Sample the setup, call and teardown of the test with --profile-harness."""
+    profiler = item.config.stash.get(profiler_key, None)
+    if profiler:
+        profiler.start(item.nodeid)
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.stop()
+
+# --- Test report hooks ---
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        check_slo(item, report)
+        check_webdriver_budget(item, report)
+        check_browser_events(item, report)
+        history = item.config.stash[perf_history_key]
+        if history:
+            history.add_test(item.nodeid, report.outcome, report.duration, PHASES.timings)
+        for timing in PHASES.timings:
+            if timing.phase == "interactive":
+                item.config.stash[interactive_key].setdefault(timing.method, []).append(timing.duration)
+        profile = item.stash.get(throttle_profile_key, None)
+        if profile is not None and report.passed:
+            timings = item.config.stash[throttle_timings_key]
+            for timing in PHASES.timings:
+                timings.setdefault((timing.phase, timing.method), {}).setdefault(profile, []).append(timing.duration)
+
+    recorder = item.config.stash[diagnostics_key]
+    if recorder and recorder.active and report.failed and report.when == "call":
+        bundle = recorder.dump(report.longreprtext)
+        report.sections.append(("diagnostics", f"Failure artifacts written to {bundle}"))
+
+    incremental = item.config.stash.get(incremental_key, None)
+    if incremental:
+        incremental.record(report)
+
+# --- Test tiers and incremental runs ---
+
+def pytest_collection_modifyitems(config, items):
+    # Tiers: pytest -m api runs the browser-free tests only
+    replay = config.getoption("cassette") == "replay"
+    for item in items:
+        if "driver" in item.fixturenames:
+            item.add_marker(pytest.mark.ui)
+            if replay:
+                item.add_marker(pytest.mark.skip(reason="Cassettes replay the API traffic only"))
+        else:
+            item.add_marker(pytest.mark.api)
+
+    incremental = config.stash.get(incremental_key, None)
+    if not incremental:
+        return
+
+    # Runs at collection, before -k, -m and --deselect drop items: the items of
+    # a module are all there unless the module was selected by node id or --lf
+    partial = {Path(arg.split("::")[0]).resolve() for arg in config.args if "::" in arg}
+    last_failed = config.getoption("lf", False)
+    # The scenarios are loaded by the fixtures of this file as well as by the modules
+    extra_files = [__file__, *sorted(path for path in SCENARIOS_DIR.iterdir() if path.is_file())]
+    unchanged = {}
+    for item in items:
+        module_id = item.nodeid.split("::")[0]
+        if module_id not in unchanged:
+            key = incremental.module_key(napp_from_module(item.module.__name__), item.module, extra_files)
+            unchanged[module_id] = incremental.is_unchanged(module_id, key)
+        incremental.expect(item.nodeid, complete=not last_failed and item.path.resolve() not in partial)
+        if unchanged[module_id]:
+            item.add_marker(pytest.mark.skip(reason="NApp and test code unchanged since last green run"))
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # pytest-xdist: the controller gathers the collected items and outcomes of every worker
+    incremental = node.config.stash.get(incremental_key, None)
+    exported = getattr(node, "workeroutput", {}).get("incremental")
+    if incremental and exported:
+        incremental.merge(exported)
+
+# --- Run summary ---
+
+def pytest_sessionfinish(session):
+    incremental = session.config.stash.get(incremental_key, None)
+    if incremental:
+        if is_xdist_worker(session.config):
+            session.config.workeroutput["incremental"] = incremental.export()
+        else:
+            incremental.save()
+    history = session.config.stash.get(perf_history_key, None)
+    if history:
+        history.save()
+    profiler = session.config.stash.get(profiler_key, None)
+    if profiler:
+        profiler.save()
+    if not is_xdist_worker(session.config):
+        # The workers are done, none of them appends any more
+        JOURNAL.compact()
+
+def pytest_terminal_summary(terminalreporter, config):
+    tracker = config.stash.get(memory_tracker_key, None)
+    if tracker and tracker.samples:
+        terminalreporter.write_sep("-", "browser memory growth per NApp")
+        for line in tracker.report_lines():
+            terminalreporter.write_line(line)
+        report_path = os.getenv("MEMORY_REPORT_PATH")
+        if report_path:
+            tracker.write_report(report_path)
+
+    accounting = config.stash.get(commands_key, None)
+    if accounting and accounting.tests:
+        lines = accounting.report_lines()
+        if lines:
+            terminalreporter.write_sep("-", "WebDriver round trips")
+            for line in lines:
+                terminalreporter.write_line(line)
+        report_path = os.getenv("COMMAND_REPORT_PATH")
+        if report_path:
+            accounting.write_report(report_path)
+
+    interactive = config.stash.get(interactive_key, None)
+    if interactive:
+        terminalreporter.write_sep("-", "time to interactive per NApp form")
+        for napp, durations in sorted(interactive.items()):
+            terminalreporter.write_line(
+                f"{napp}: median {statistics.median(durations):.2f}s, max {max(durations):.2f}s "
+                f"over {len(durations)} opening(s)")
+
+    if COMPONENT_LOADS.loads:
+        terminalreporter.write_sep("-", "NApp component loads, first and repeat opening")
+        for line in COMPONENT_LOADS.report_lines():
+            terminalreporter.write_line(line)
+        report_path = os.getenv("COMPONENT_REPORT_PATH")
+        if report_path:
+            COMPONENT_LOADS.write_report(report_path)
+
+    throttled = config.stash.get(throttle_timings_key, None)
+    if throttled:
+        profiles = sorted({profile for by_profile in throttled.values() for profile in by_profile},
+                          key=lambda profile: (profile != NO_THROTTLING, profile))
+        terminalreporter.write_sep("-", "median phase times per throttling profile")
+        terminalreporter.write_line(f"{'':<56}" + "".join(f"{profile:>14}" for profile in profiles))
+        for (phase, method), by_profile in sorted(throttled.items()):
+            cells = [f"{statistics.median(by_profile[profile]):.2f}s" if profile in by_profile else "-"
+                     for profile in profiles]
+            terminalreporter.write_line(f"{phase + ' ' + method:<56}" + "".join(f"{cell:>14}" for cell in cells))
+
+    profiler = config.stash.get(profiler_key, None)
+    if profiler and profiler.attribution:
+        terminalreporter.write_sep("-", f"harness time per page-object method (profiles in {profiler.output_dir})")
+        for line in profiler.report_lines():
+            terminalreporter.write_line(line)
+
+    history = config.stash.get(perf_history_key, None)
+    if history and not is_xdist_worker(config) and Path(history.path).exists():
+        # Under xdist the workers saved the runs of the session, the controller compares them
+        _, regressions = compare(history.path, session=history.session)
+        if regressions:
+            terminalreporter.write_sep("-", "significant slowdowns against the previous runs")
+            for line in report_lines(regressions):
+                terminalreporter.write_line(line)
+
 # --- Fixture for Test Data ---
+# The scenarios live in tests/scenarios/, the test modules parametrize over
+# them with scenario_cases(). These fixtures expose the whole file of a NApp.
 
 @pytest.fixture
 def evc_test_data():
     """Test data for EVC creation tests"""
-    return {
-        "valid_circuits": [
-            {
-                "name": "Test_Circuit_001",
-                "endpoint_a": "00:00:00:00:00:00:00:18:13",
-                "endpoint_a_field": "00:00:00:00:00:00:00:18: mia_s18-eth13",
-                "vlan_a": "104",
-                "endpoint_z": "00:00:00:00:00:00:00:18:8",
-                "endpoint_z_field": "00:00:00:00:00:00:00:18: mia_s18-eth8",
-                "vlan_z": "100"
-            },
-            {
-                "name": "Full_Feature_Circuit",
-                "endpoint_a": "00:00:00:00:00:00:00:18:13",
-                "endpoint_a_field": "00:00:00:00:00:00:00:18: mia_s18-eth13",
-                "vlan_a": "104",
-                "endpoint_z": "00:00:00:00:00:00:00:18:8",
-                "endpoint_z_field": "00:00:00:00:00:00:00:18: mia_s18-eth8",
-                "vlan_z": "100",
-                "service_level": "5",
-                "priority": "high",
-                "max_paths": "3",
-                "qos_queue": "premium",
-                "enable_int": True
-            },
-            {
-                "name": "VLAN_Range_Circuit",
-                "endpoint_a": "00:00:00:00:00:00:00:18:13",
-                "vlan_a": "[100, 200]",
-                "endpoint_z": "00:00:00:00:00:00:00:18:8",
-                "vlan_z": "[100, 200]"
-            }
-        ],
-        "invalid_circuits": [
-            {
-                "name": "",
-                "endpoint_a": "Switch01:eth1",
-                "vlan_a": "100",
-                "endpoint_z": "Switch02:eth1",
-                "vlan_z": "100",
-                "expected_error": "Circuit Name is required"
-            },
-            {
-                "name": "Invalid_VLAN_Test",
-                "endpoint_a": "Switch01:eth1",
-                "vlan_a": "invalid_vlan",
-                "endpoint_z": "Switch02:eth1",
-                "vlan_z": "100",
-                "expected_error": "Invalid VLAN format"
-            },
-            {
-                "name": "Invalid_Endpoint_Test",
-                "endpoint_a": "NonExistentSwitch:eth1",
-                "vlan_a": "100",
-                "endpoint_z": "Switch02:eth1",
-                "vlan_z": "100",
-                "expected_error": "Endpoint not found"
-            }
-        ],
-        "boundary_test": {
-            "max_vlan": "4094",
-            "invalid_vlan": "4095",
-            "long_name": "a" * 256
-        }
-    }
+    data = load_scenarios("mefeline")
+    boundary = data["boundary_test"]
+    boundary["long_name"] = "a" * boundary.pop("long_name_length")
+    return data
 
 
 @pytest.fixture
 def sdntrace_test_data():
     """Test data for SDNTrace"""
-    return {
-        "valid_basic_data": {
-            "dpid": "00:00:00:00:00:00:00:14",
-            "port": "13"
-        },
-        "valid_trace": {
-            "dpid": "00:00:00:00:00:00:00:14",
-            "port": "13",
-            "dl_vlan": "300",
-            "dl_type": "2048",
-            "dl_src": "1",
-            "dl_dst": "a1:b2:c3:d4:e5:f6",
-            "nw_src": "10.10.10.1",
-            "nw_dst": "10.10.10.254",
-            "nw_proto": "6",        
-            "nw_tos": "2",
-            "tp_src": "1234",
-            "tp_dst": "80",
-        },
-        "non_existent_dpid": {
-            "dpid": "00:00:00:00:00:00:00:01",
-            "port": "13"
-        },
-        "invalid_dpid": {
-            "dpid": "ff:ff:ff:ff:ff:ff:ff:ff",
-            "port": "13"
-        },
-        "non_existent_port": {
-            "dpid": "00:00:00:00:00:00:00:18",
-            "port": "9999"
-        },
-        "invalid_port": {
-            "dpid": "00:00:00:00:00:00:00:18",
-            "port": "a"
-        },
-        "invalid_nw_tos": {
-            "dpid": "00:00:00:00:00:00:00:18",
-            "port": "13",
-            "nw_tos": "20",
-        }
-    }
-
-def get_future_time_data(days_from_now=2):
-    """Generates start and end time data for a maintenance window in the near future."""
-    # The format required is 'yyyy-mm-ddThh:mm:ss+0000'
-    
-    now = datetime.datetime.now(datetime.timezone.utc)
-    start_time = now + datetime.timedelta(days=days_from_now)
-    end_time = now + datetime.timedelta(days=days_from_now, hours=1)
-
-    time_format = "%Y-%m-%dT%H:%M:%S+0000"
-    
-    start_time_str = start_time.strftime(time_format) 
-    end_time_str = end_time.strftime(time_format)
-    
-    return {
-        "start_time": start_time_str,
-        "end_time": end_time_str
-    }
+    return load_scenarios("sdntrace")
 
 @pytest.fixture
 def maintenance_test_data():
-    """Test data for maintenance"""
-    time_data = get_future_time_data()
-    time_data_past = time_data.copy()
-    time_data_past["start_time"] = time_data_past["start_time"].replace("2025", "2024")
-    time_data_wrong_format = time_data.copy()
-    time_data_wrong_format["start_time"] = time_data_wrong_format["start_time"].split('T')[0]
-    
-    return {
-        "valid_data": [
-            {**{
-                "description": "Valid data",
-                "switches": ["MIA-MI1-SW14"],
-                "interfaces": ["00:00:00:00:00:00:00:14:32"],
-                "links": ["e879d80c5907429087330d24ac29f6fc78513c02bb21f91212d0dd0db89a7d55"],
-            }, **get_future_time_data(3)},
-            {**{
-                "description": "Valid data - multiple switches",
-                "switches": ["MIA-MI1-SW14","SJU-H787-SW02"],
-            }, **get_future_time_data(4)}
-        ],
-        "invalid_data": [
-            {**{
-                "description": "Invalid data - empty lists",
-                "switches": [],
-            }, **time_data},
-            {**{
-                "description": "Invalid data - past time",
-                "switches": ["MIA-MI1-SW14"],
-            }, **time_data_past},
-            {**{
-                "description": "Invalid data - unexpected time format",
-                "switches": ["MIA-MI1-SW14"],
-            }, **time_data_wrong_format}
-        ]
-    }
+    """Test data for maintenance, with the window times resolved from now"""
+    data = load_scenarios("maintenance")
+    for cases in data.values():
+        for case in cases:
+            case["windows"] = [build_window(window) for window in case["windows"]]
+    return data
 
 
 @pytest.fixture
 def pathfinder_test_data():
-    """Test data for EVC creation tests"""
-    return {
-        "valid_data": [
-            {
-                "source": "00:00:00:00:00:00:00:14:9",
-                "destination": "00:00:00:00:00:04:00:02:15"
-            },
-            {
-                "source": "00:00:00:00:00:00:00:14:9",
-                "destination": "00:00:00:00:00:04:00:02:15",
-                "bandwidth": "10",
-                "reliability": "5",
-                "delay": "4",
-                "utilization": "3",
-                "priority": "2",
-                "spf_max_paths": "10",
-                "spf_max_path_cost": "100"
-            }
-        ]
-    }
+    """Test data for pathfinder tests"""
+    return load_scenarios("pathfinder")
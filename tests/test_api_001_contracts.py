@@ -0,0 +1,89 @@
+import pytest
+from tests.utils.evc_page import EVCPage
+from tests.utils.maintenance_page import MaintenancePage
+from tests.utils.sdntrace_page import SDNTRACEPage
+from tests.utils.scenarios import build_window, scenario_cases, scenario_now
+
+# API tier: these tests never request the driver, so they run without a
+# browser (pytest -m api). The page objects are built without a driver and
+# only their API methods are used.
+
+
+@pytest.mark.parametrize("api_url", [("API_MEFELINE_URL", "http://localhost:18181/api/kytos/mef_eline/v2/evc/")],
+                         indirect=True)
+class TestMefElineAPI:
+    """API contract of mef_eline relied on by EVCPage"""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, base_url, api_url, default_timeout):
+        self.evc_page = EVCPage(None, base_url, api_url, default_timeout)
+
+    @pytest.mark.parametrize("circuit_data", scenario_cases("mefeline", "listed_circuits")
+                             + scenario_cases("mefeline", "valid_circuits"))
+    def test_001_create_find_delete_circuit(self, circuit_data):
+        """
+        Create a circuit of the form scenarios through the API, find it by name and delete it
+
+        Objective: Check the lookups and the cleanup of the UI tests without a browser
+        """
+        circuit_id = self.evc_page.create_circuit_via_api(circuit_data)
+        assert circuit_id is not None, f"Circuit '{circuit_data['name']}' was refused by the API"
+        try:
+            assert self.evc_page.verify_circuit_via_api(circuit_data["name"]) == circuit_id
+        finally:
+            self.evc_page.cleanup_test_circuit(circuit_data["name"])
+        assert self.evc_page.find_circuit_via_api(circuit_data["name"]) is None, "Circuit was not deleted"
+
+
+@pytest.mark.parametrize("api_url", [("API_MAINTENANCE_URL", "http://localhost:18181/api/kytos/maintenance/v1/")],
+                         indirect=True)
+class TestMaintenanceAPI:
+    """API contract of maintenance relied on by MaintenancePage"""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, base_url, api_url, default_timeout):
+        self.maintenance_page = MaintenancePage(None, base_url, api_url, default_timeout)
+
+    @pytest.mark.parametrize("case", scenario_cases("maintenance", "valid_data"))
+    def test_001_create_find_delete_windows(self, case, topology):
+        """
+        Create the windows of the form scenarios through the API, find them and delete them
+
+        Objective: Check the lookups and the cleanup of the UI tests without a browser
+        """
+        switch_ids = {name: topology.switch_by_name(name)["id"]
+                      for window in case["windows"] for name in window.get("switches", [])}
+        inserted_time = scenario_now().timestamp() - 1
+        submitted, created = [], []
+        try:
+            for window in case["windows"]:
+                data = build_window(window)
+                window_id = self.maintenance_page.create_window_via_api(data, switch_ids)
+                assert window_id is not None, f"Window '{data['description']}' was refused by the API"
+                submitted.append((data, inserted_time))
+                created.append(window_id)
+            assert self.maintenance_page.verify_all_windows_via_api(submitted) == created
+        finally:
+            self.maintenance_page.cleanup_windows(created)
+            topology.invalidate()
+
+
+@pytest.mark.parametrize("api_url", [("API_SDNTRACE_URL", "http://localhost:18181/api/amlight/sdntrace/v1/trace")],
+                         indirect=True)
+class TestSDNTraceAPI:
+    """API contract of sdntrace relied on by SDNTRACEPage"""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, base_url, api_url, default_timeout):
+        self.sdntrace_page = SDNTRACEPage(None, base_url, api_url, default_timeout)
+
+    @pytest.mark.parametrize("data", scenario_cases("sdntrace", "valid_traces"))
+    def test_001_start_find_trace(self, data):
+        """
+        Start a trace of the form scenarios through the API and find it
+
+        Objective: Check the lookup of the UI tests without a browser
+        """
+        assert self.sdntrace_page.start_trace_via_api(data) is not None, "Trace was refused by the API"
+        traces = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
+        assert traces is not None, f"Trace '{data['dpid']}' - '{data['port']}' not found in API"
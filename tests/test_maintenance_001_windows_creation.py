@@ -1,9 +1,11 @@
 import pytest
 import time
 from tests.utils.maintenance_page import MaintenancePage
+from tests.utils.scenarios import build_window, scenario_cases
 
 @pytest.mark.parametrize("api_url",[("API_MAINTENANCE_URL", "http://localhost:18181/api/kytos/maintenance/v1/")], indirect=True)
 @pytest.mark.usefixtures("driver", "base_url", "api_url", "default_timeout")
+@pytest.mark.slo(navigate=10.0, submit_to_visible=20.0)
 class TestMaintenance:
     """Test cases for Maintenance"""
     
@@ -11,19 +13,26 @@ class TestMaintenance:
     def setup_class(self, request, driver, base_url, api_url, default_timeout): 
         """ Initialize MaintenancePage object once per class. """ 
         request.cls.maintenance_page = MaintenancePage(driver, base_url, api_url, default_timeout) 
-        yield 
-        try: 
-            request.cls.maintenance_page.cleanup_test_windows() 
-        except Exception as e: 
-            print(f"Error during class cleanup: {e}")
 
-    def test_001_create_maintenance_window_with_valid_data(self, maintenance_test_data):
+    @pytest.fixture(autouse=True)
+    def created_windows(self, topology):
+        """Windows created by the test, deleted once it is over so every case is independent."""
+        window_ids = []
+        yield window_ids
+        self.maintenance_page.cleanup_windows(window_ids)
+        # Maintenance windows change the state of the switches, interfaces and links
+        if window_ids:
+            topology.invalidate()
+
+    @pytest.mark.parametrize("case", scenario_cases("maintenance", "valid_data"))
+    def test_001_create_maintenance_window_with_valid_data(self, case, created_windows):
         """
-        Create Maintenance Window with a Switch
+        Create Maintenance Windows with switches, interfaces and links
         
-        Objective: Verify successful creation of a maintenance window.
+        Objective: Verify successful creation of the maintenance windows of a scenario.
         """
-        for data in maintenance_test_data["valid_data"]:
+        submitted = []
+        for data in map(build_window, case["windows"]):
             # 1. Navigate to Maintenance tab
             assert self.maintenance_page.navigate_to_maintenance_tab(), "Failed to navigate to Maintenance tab"
             
@@ -31,20 +40,27 @@ class TestMaintenance:
             inserted_time = time.time()
             self.maintenance_page.fill_maintenance_form(data)
             self.maintenance_page.submit_form()
-            
-            # 3. Verify via API
-            window_id = self.maintenance_page.verify_windows_via_api(data, inserted_time)
-            assert window_id is not None, "Error creating Maintenance Window: not found in table"
-            
-            # 4. Verify creation
-            self.maintenance_page.click_list_windows()
+            submitted.append((data, inserted_time))
+
+        # 3. Verify all windows via API at once
+        window_ids = self.maintenance_page.verify_all_windows_via_api(submitted)
+        created_windows.extend(window_id for window_id in window_ids if window_id is not None)
+        for (data, _), window_id in zip(submitted, window_ids):
+            assert window_id is not None, f"Error creating Maintenance Window '{data['description']}': not found in API"
+
+        # 4. Verify creation
+        self.maintenance_page.click_list_windows()
+        for window_id in window_ids:
             window_id_text = self.maintenance_page.get_data_from_table(window_id)
             assert window_id_text != None, "Error creating window"
 
-    def test_002_create_maintenance_window_with_invalid_data(self, maintenance_test_data):
+    @pytest.mark.parametrize("case", scenario_cases("maintenance", "invalid_data"))
+    @pytest.mark.browser_events(allow_status=["4xx"])
+    def test_002_create_maintenance_window_with_invalid_data(self, case, created_windows):
         """Using invalid data"""
 
-        for data in maintenance_test_data['invalid_data']:
+        submitted = []
+        for data in map(build_window, case["windows"]):
             # 1. Navigate to Maintenance tab
             assert self.maintenance_page.navigate_to_maintenance_tab(), "Failed to navigate to Maintenance tab"
             
@@ -52,8 +68,10 @@ class TestMaintenance:
             inserted_time = time.time()
             self.maintenance_page.fill_maintenance_form(data)
             self.maintenance_page.submit_form()
-            
-            # 3. Verify via API
-            window_id = self.maintenance_page.verify_windows_via_api(data, inserted_time)
-            assert window_id is None, "Maintenance Window created with invalid data"
+            submitted.append((data, inserted_time))
 
+        # 3. Verify via API that none of them was created
+        window_ids = self.maintenance_page.verify_all_windows_via_api(submitted)
+        created_windows.extend(window_id for window_id in window_ids if window_id is not None)
+        for (data, _), window_id in zip(submitted, window_ids):
+            assert window_id is None, f"Maintenance Window created with invalid data: {data['description']}"
@@ -1,7 +1,9 @@
 import pytest
 from tests.utils.evc_page import EVCPage
+from tests.utils.scenarios import scenario_cases, scenario_group
 
 @pytest.mark.parametrize("api_url",[("API_MEFELINE_URL", "http://localhost:18181/api/kytos/mef_eline/v2/evc/")], indirect=True)
+@pytest.mark.slo(navigate=10.0, submit_to_visible=15.0)
 class TestPositiveEVCCreation:
     """Positive test cases for successful EVC creation"""
     
@@ -16,19 +18,20 @@ class TestPositiveEVCCreation:
             "Test_Circuit_001",
             "Full_Feature_Circuit", 
             "VLAN_Range_Circuit",
-            "Performance_Test_Circuit"
+            "Performance_Test_Circuit",
+            "Batch_Circuit_001",
+            "Batch_Circuit_002",
         ]
         for circuit in test_circuits:
             self.evc_page.cleanup_test_circuit(circuit)
     
-    def test_001_create_basic_evc_minimum_fields(self, evc_test_data):
+    @pytest.mark.parametrize("circuit_data", scenario_cases("mefeline", "listed_circuits"))
+    def test_001_create_basic_evc_minimum_fields(self, circuit_data):
         """
         Create Basic EVC with Minimum Required Fields
         
         Objective: Verify successful creation of EVC with only required fields
         """
-        circuit_data = evc_test_data["valid_circuits"][0] 
-        
         # Navigate to EVC creation form
         assert self.evc_page.navigate_to_evc_form(), "Failed to navigate to EVC creation form"
         
@@ -47,18 +50,17 @@ class TestPositiveEVCCreation:
         
         print(f"✅ TC_001 PASSED. EVC with circuit id {circuit_id} created and verified successfully")
 
-    def test_002_create_evc_all_optional_fields(self, evc_test_data):
+    @pytest.mark.parametrize("circuit_data", scenario_cases("mefeline", "valid_circuits"))
+    def test_002_create_evc(self, circuit_data):
         """
-        Create EVC with All Optional Fields
+        Create EVC with optional fields or VLAN ranges
 
-        Objective: Verify EVC creation with all fields populated
+        Objective: Verify EVC creation with all fields populated and with VLAN range notation
         """
-        circuit_data = evc_test_data["valid_circuits"][1]
-
         # Navigate to EVC creation form
         assert self.evc_page.navigate_to_evc_form(), "Failed to navigate to EVC creation form"
 
-        # Fill and submit form with all optional fields
+        # Fill and submit form
         self.evc_page.fill_circuit_form(circuit_data)
         self.evc_page.submit_form()
 
@@ -66,25 +68,23 @@ class TestPositiveEVCCreation:
         circuit_id = self.evc_page.verify_circuit_via_api(circuit_data["name"])
         assert circuit_id is not None, f"Circuit '{circuit_data['name']}' not found in API"
 
-        print(f"✅ TC_002 PASSED: Full-feature circuit created with ID {circuit_id}")
+        print(f"✅ TC_002 PASSED: circuit '{circuit_data['name']}' created with ID {circuit_id}")
 
-    def test_003_create_evc_vlan_range(self, evc_test_data):
+    def test_003_create_evcs_together(self):
         """
-        Create EVC with VLAN Range
+        Create several EVCs, then verify them together
 
-        Objective: Verify EVC creation with VLAN range notation
+        Objective: Verify that every circuit submitted through the form is created
         """
-        circuit_data = evc_test_data["valid_circuits"][2]
-
-        # Navigate to EVC creation form
-        assert self.evc_page.navigate_to_evc_form(), "Failed to navigate to EVC creation form"
-
-        # Fill and submit form with VLAN ranges
-        self.evc_page.fill_circuit_form(circuit_data)
-        self.evc_page.submit_form()
-
-        # Verify via API
-        circuit_id = self.evc_page.verify_circuit_via_api(circuit_data["name"])
-        assert circuit_id is not None, f"Circuit '{circuit_data['name']}' not found in API"
-
-        print(f"✅ TC_003 PASSED: VLAN range circuit created with ID {circuit_id}")
+        circuits = scenario_group("mefeline", "batch_circuits")
+        for circuit_data in circuits:
+            assert self.evc_page.navigate_to_evc_form(), "Failed to navigate to EVC creation form"
+            self.evc_page.fill_circuit_form(circuit_data)
+            self.evc_page.submit_form()
+
+        # Verify all circuits via API at once
+        circuit_ids = self.evc_page.verify_circuits_via_api([circuit_data["name"] for circuit_data in circuits])
+        for circuit_data, circuit_id in zip(circuits, circuit_ids):
+            assert circuit_id is not None, f"Circuit '{circuit_data['name']}' not found in API"
+
+        print(f"✅ TC_003 PASSED: {len(circuit_ids)} circuits created and verified together")
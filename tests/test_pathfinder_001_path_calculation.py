@@ -1,9 +1,11 @@
 import pytest
 from tests.utils.pathfinder_page import PathfinderPage
+from tests.utils.scenarios import scenario_cases
 
 
 @pytest.mark.parametrize("api_url", [("API_MEFELINE_URL", "http://localhost:18181/api/kytos/mef_eline/v2/evc/")],
                          indirect=True)
+@pytest.mark.slo(navigate=10.0, submit_to_visible=10.0)
 class TestPositiveEVCCreation:
     """Positive test cases for successful EVC creation"""
 
@@ -12,14 +14,13 @@ class TestPositiveEVCCreation:
         """Initialize EVCPage object before each test."""
         self.pathfinder_page = PathfinderPage(driver, base_url, api_url, default_timeout)
 
-    def test_001_calculate_basic_path(self, pathfinder_test_data):
+    @pytest.mark.parametrize("test_data", scenario_cases("pathfinder", "valid_paths"))
+    def test_001_calculate_path(self, test_data):
         """
-        Create Basic EVC with Minimum Required Fields
+        Calculate paths with the required fields and with the optional metrics
 
-        Objective: Verify successful creation of EVC with only required fields
+        Objective: Verify that pathfinder finds at least one path
         """
-        test_data = pathfinder_test_data["valid_data"][0]
-
         # Navigate to EVC creation form
         assert self.pathfinder_page.navigate_to_pathfinder_form(), "Failed to navigate to Pathfinder form"
 
@@ -32,24 +33,4 @@ class TestPositiveEVCCreation:
         assert paths>0, "no paths found"
         print(f"✅ TC_001 PASSED. paths calculated")
 
-    def test_002_calculate_path_with_fields(self, pathfinder_test_data):
-        """
-        Create Basic EVC with Minimum Required Fields
-
-        Objective: Verify successful creation of EVC with only required fields
-            """
-        test_data = pathfinder_test_data["valid_data"][1]
-
-        # Navigate to EVC creation form
-        assert self.pathfinder_page.navigate_to_pathfinder_form(), "Failed to navigate to Pathfinder form"
-
-        # Fill and submit form
-        self.pathfinder_page.fill_path_form(test_data)
-        self.pathfinder_page.submit_form()
-
-        # Original verification logic
-        paths = self.pathfinder_page.get_paths()
-        assert paths > 0, "no paths found"
-        print(f"✅ TC_002 PASSED. paths calculated")
-
 
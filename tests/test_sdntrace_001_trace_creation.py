@@ -1,7 +1,9 @@
 import pytest
 from tests.utils.sdntrace_page import SDNTRACEPage
+from tests.utils.scenarios import scenario_cases, scenario_group
 
 @pytest.mark.parametrize("api_url",[("API_SDNTRACE_URL", "http://localhost:18181/api/amlight/sdntrace/v1/trace")], indirect=True)
+@pytest.mark.slo(navigate=10.0, submit_to_visible=15.0)
 class TestSDNTraces:
     """Test cases for SDNTraces"""
     
@@ -10,12 +12,11 @@ class TestSDNTraces:
         """Initialize SDNTRACEPage object before each test."""
         self.sdntrace_page = SDNTRACEPage(driver, base_url, api_url, default_timeout)
         
-    def test_001_start_trace_with_required_params(self, sdntrace_test_data):
+    @pytest.mark.parametrize("data", scenario_cases("sdntrace", "valid_traces"))
+    def test_001_start_trace(self, data):
         """
-        Start trace with minimum required fields
+        Start trace with the required fields and with the optional fields
         """
-        data = sdntrace_test_data["valid_basic_data"]
-        
         # Navigate to SDNTrace form
         assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
         
@@ -34,62 +35,16 @@ class TestSDNTraces:
         trace = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
         assert trace is not None, f"Trace '{data['dpid']}' - '{data['port']}' not found in API"
 
-    def test_002_start_trace_with_optional_fields(self, sdntrace_test_data):
+    @pytest.mark.parametrize("data", scenario_cases("sdntrace", "invalid_dpids"))
+    @pytest.mark.browser_events(allow_status=["4xx"])
+    def test_002_start_trace_with_invalid_dpid(self, data):
         """
-        Start trace with optional fields
+        Start trace with a non-existent or invalid DPID
         """
-        data = sdntrace_test_data["valid_trace"]
-
         # Navigate to SDNTrace form
         assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
 
-        # Fill and submit form with all optional fields
-        self.sdntrace_page.fill_form(data)
-        self.sdntrace_page.submit_form()
-
-        # Original verification logic
-        self.sdntrace_page.click_view_all_traces()
-        trace_dpid_text = self.sdntrace_page.get_first_dpid_from_table()
-        assert trace_dpid_text == data["dpid"], "Error starting trace - wrong dpid"
-        trace_port_text = self.sdntrace_page.get_first_port_from_table()
-        assert trace_port_text == data["port"], "Error starting trace - wrong port"
-
-        # Verify via API
-        trace = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
-        assert trace is not None, f"Trace '{data['dpid']}' - '{data['port']}' not found in API"
-
-    def test_003_start_trace_with_non_existent_pdid(self, sdntrace_test_data):
-        """
-        Start trace with invalid DPID
-        """
-        data = sdntrace_test_data["non_existent_dpid"]
-
-        # Navigate to SDNTrace form
-        assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
-
-        # Fill and submit form with all optional fields
-        self.sdntrace_page.fill_form(data)
-        self.sdntrace_page.submit_form()
-
-        # Original verification logic
-        self.sdntrace_page.click_view_all_traces()
-        trace_dpid_text = self.sdntrace_page.get_first_dpid_from_table()
-        assert trace_dpid_text != data["dpid"], "Invalid trace started"
-
-        # Verify via API
-        trace = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
-        assert trace is None, f"Trace was found in API but dpid is wrong"
-
-    def test_004_start_trace_with_invalid_pdid(self, sdntrace_test_data):
-        """
-        Start trace with invalid DPID
-        """
-        data = sdntrace_test_data["invalid_dpid"]
-
-        # Navigate to SDNTrace form
-        assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
-
-        # Fill and submit form with all optional fields
+        # Fill and submit form
         self.sdntrace_page.fill_form(data)
         self.sdntrace_page.submit_form()
 
@@ -102,47 +57,41 @@ class TestSDNTraces:
         trace = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
         assert trace is None, f"Trace was found in API but dpid is wrong"
 
-    @pytest.mark.xfail(reason="A trace was initiated using a non-existent port.")
-    def test_005_start_trace_with_non_existent_port(self, sdntrace_test_data):
+    @pytest.mark.parametrize("data", scenario_cases("sdntrace", "invalid_ports"))
+    @pytest.mark.browser_events(allow_status=["4xx"])
+    def test_003_start_trace_with_invalid_port(self, data):
         """
-        Start trace with invalid Port
+        Start trace with a non-existent or invalid Port
         """
-        data = sdntrace_test_data["non_existent_port"]
-
         # Navigate to SDNTrace form
         assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
 
-        # Fill and submit form with all optional fields
+        # Fill and submit form
         self.sdntrace_page.fill_form(data)
         self.sdntrace_page.submit_form()
 
         # Original verification logic
         self.sdntrace_page.click_view_all_traces()
-        trace_dpid_text = self.sdntrace_page.get_first_port_from_table()
-        assert trace_dpid_text != data["port"], "Invalid trace started"
+        trace_port_text = self.sdntrace_page.get_first_port_from_table()
+        assert trace_port_text != data["port"], "Invalid trace started"
 
         # Verify via API
         trace = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
         assert trace is None, f"Trace was found in API but port is wrong"
 
-    def test_006_start_trace_with_invalid_port(self, sdntrace_test_data):
+    def test_004_start_traces_together(self):
         """
-        Start trace with invalid Port
+        Start several traces, then verify them together
         """
-        data = sdntrace_test_data["invalid_port"]
-
-        # Navigate to SDNTrace form
-        assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
-
-        # Fill and submit form with all optional fields
-        self.sdntrace_page.fill_form(data)
-        self.sdntrace_page.submit_form()
-
-        # Original verification logic
-        self.sdntrace_page.click_view_all_traces()
-        trace_dpid_text = self.sdntrace_page.get_first_port_from_table()
-        assert trace_dpid_text != data["port"], "Invalid trace started"
-
-        # Verify via API
-        trace = self.sdntrace_page.verify_traces_via_api(data["dpid"], data["port"])
-        assert trace is None, f"Trace was found in API but port is wrong"
+        traces = scenario_group("sdntrace", "batch_traces")
+        # Only the traces started by this test count, not the ones left by earlier tests or runs
+        known = self.sdntrace_page.trace_ids_via_api()
+        for data in traces:
+            assert self.sdntrace_page.navigate_to_sdntrace_form(), "Failed to navigate to form"
+            self.sdntrace_page.fill_form(data)
+            self.sdntrace_page.submit_form()
+
+        # Verify all traces via API at once
+        found = self.sdntrace_page.verify_all_traces_via_api([(data["dpid"], data["port"]) for data in traces], known)
+        for data, trace in zip(traces, found):
+            assert trace is not None, f"Trace '{data['dpid']}' - '{data['port']}' not found in API"
@@ -1,28 +1,39 @@
-import time
-
 import pytest
 from tests.utils.statusmenu_page import StatusmenuPage
 
 
+@pytest.fixture(scope="class")
+def statusmenu_page(driver, base_url, api_url, default_timeout, topology):
+    """Status menu page shared by the checks of the class, so the dashboard is opened once."""
+    return StatusmenuPage(driver, base_url, api_url, default_timeout, topology)
+
+
 @pytest.mark.parametrize("api_url", [("API_MEFELINE_URL", "http://localhost:18181/api/kytos/mef_eline/v2/evc/")],
                          indirect=True)
+@pytest.mark.slo(navigate=10.0, check=5.0, filter=30.0)
 class TestStatusMenu:
     """Positive test cases for successful status checks"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self, driver, base_url, api_url, default_timeout):
-        """Initialize Status menu object before each test."""
-        self.statusmenu_page = StatusmenuPage(driver, base_url, api_url, default_timeout)
+    def setup_method(self, statusmenu_page):
+        """Open the status menu, or reuse the one a previous check opened."""
+        self.statusmenu_page = statusmenu_page
+        assert self.statusmenu_page.open_dashboard(), "Failed to navigate to Status menu"
 
     def test_001_check_switches(self):
-
-        # Navigate to status menu
-        assert self.statusmenu_page.navigate_to_statusmenu(), "Failed to navigate to Pathfinder form"
-
-        # check number of switches,links and interfaces and filters
         assert self.statusmenu_page.check_switches(), "switches data not consistent"
+
+    def test_002_check_switches_filters(self):
         assert self.statusmenu_page.check_switches_filters(), "switch filters not working"
+
+    def test_003_check_links(self):
         assert self.statusmenu_page.check_links(), "links data not consistent"
+
+    def test_004_check_links_filters(self):
         assert self.statusmenu_page.check_links_filters(), "links filters not working"
+
+    def test_005_check_interfaces(self):
         assert self.statusmenu_page.check_interfaces(), "interfaces data not consistent"
+
+    def test_006_check_interfaces_filters(self):
         assert self.statusmenu_page.check_interfaces_filters(), "interfaces filters not working"
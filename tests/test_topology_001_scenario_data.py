@@ -0,0 +1,56 @@
+import pytest
+from tests.utils.scenarios import load_scenarios
+
+
+def scenario_references():
+    """Switches, interfaces and links the valid scenarios rely on, as (kind, id) params."""
+    references = []
+
+    def add(kind, ref, napp, case_id):
+        references.append(pytest.param(kind, ref, id=f"{napp}-{case_id}-{ref}"))
+
+    mefeline = load_scenarios("mefeline")
+    for case in mefeline["listed_circuits"] + mefeline["valid_circuits"] + mefeline["batch_circuits"]:
+        add("interface", case["endpoint_a"], "mefeline", case["id"])
+        add("interface", case["endpoint_z"], "mefeline", case["id"])
+
+    sdntrace = load_scenarios("sdntrace")
+    for case in sdntrace["valid_traces"]:
+        add("switch", case["dpid"], "sdntrace", case["id"])
+    for case in sdntrace["batch_traces"]:
+        add("interface", f"{case['dpid']}:{case['port']}", "sdntrace", case["id"])
+
+    for case in load_scenarios("pathfinder")["valid_paths"]:
+        add("interface", case["source"], "pathfinder", case["id"])
+        add("interface", case["destination"], "pathfinder", case["id"])
+
+    for case in load_scenarios("maintenance")["valid_data"]:
+        for window in case["windows"]:
+            for name in window.get("switches", []):
+                add("switch_name", name, "maintenance", case["id"])
+            for interface_id in window.get("interfaces", []):
+                add("interface", interface_id, "maintenance", case["id"])
+            for link_id in window.get("links", []):
+                add("link", link_id, "maintenance", case["id"])
+    return references
+
+
+class TestScenarioTopology:
+    """The hardcoded switches, interfaces and links of the scenarios exist on the controller"""
+
+    LOOKUPS = {
+        "switch": "switch",
+        "switch_name": "switch_by_name",
+        "interface": "interface",
+        "link": "link",
+    }
+
+    @pytest.mark.parametrize("kind, ref", scenario_references())
+    def test_001_scenario_reference_exists(self, topology, kind, ref):
+        """
+        Validate the scenario data against the topology snapshot
+
+        Objective: Fail early and clearly when the scenarios do not match the controller
+        """
+        lookup = getattr(topology, self.LOOKUPS[kind])
+        assert lookup(ref) is not None, f"{kind} '{ref}' not found in the topology"
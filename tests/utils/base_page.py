@@ -0,0 +1,36 @@
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from tests.utils.readiness import click_until_interactive
+
+
+class BasePage:
+    """
+    Plumbing shared by the page objects of the NApps: construction, element
+    lookup and opening a NApp until its form is interactive.
+    """
+    SELECTORS = {}
+
+    # Fields that must be usable for the form to be interactive
+    REQUIRED_FIELDS = ()
+
+    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int):
+        self.driver = driver
+        self.base_url = base_url
+        self.api_base_url = api_url
+        self.wait = WebDriverWait(driver, default_timeout)
+        self.default_timeout = default_timeout
+
+    def _find(self, locator_name):
+        """Helper to find an element by locator name."""
+        by, value = self.SELECTORS[locator_name]
+        return self.wait.until(EC.presence_of_element_located((by, value)))
+
+    def _open_napp(self, button_name, napp):
+        """
+        Click the button of a NApp and wait until the REQUIRED_FIELDS of its form
+        are usable. Returns the time to interactive in seconds, None on timeout.
+        """
+        button = self.wait.until(EC.element_to_be_clickable(self.SELECTORS[button_name]))
+        required = [self.SELECTORS[field] for field in self.REQUIRED_FIELDS]
+        return click_until_interactive(self.driver, button, required, self.default_timeout, napp)
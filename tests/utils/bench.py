@@ -0,0 +1,126 @@
+"""
+Plumbing shared by the benchmark commands (contention, inventory,
+trace_fanout, evc_lifecycle): concurrent timed requests, the mef_eline
+circuit client and the latency statistics. Each command keeps its workload.
+"""
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from tests.utils.journal import JOURNAL
+
+
+def percentile(values, q):
+    """Nearest-rank percentile, None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def seconds(value):
+    return f"{value:.2f}s" if value is not None else "n/a"
+
+
+def latency_stats(outcomes, wall_time=None):
+    """
+    Latency percentiles, error rate and, given the wall time, throughput of
+    outcomes, dicts with a 'latency' and an 'error' (None on success).
+    """
+    latencies = [outcome['latency'] for outcome in outcomes if outcome['error'] is None]
+    errors = [outcome['error'] for outcome in outcomes if outcome['error'] is not None]
+    stats = {
+        'count': len(outcomes),
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'max': max(latencies, default=None),
+        'error_rate': len(errors) / len(outcomes) if outcomes else 0.0,
+        'errors': Counter(errors).most_common(3),
+    }
+    if wall_time is not None:
+        stats['throughput'] = len(latencies) / wall_time if wall_time else 0.0
+    return stats
+
+
+def stats_line(row):
+    """p50/p95/max, error rate and throughput (when known) of latency_stats, most frequent errors last."""
+    line = f"p50 {seconds(row['p50'])}, p95 {seconds(row['p95'])}, max {seconds(row['max'])}, " \
+           f"errors {row['error_rate']:.0%}"
+    if 'throughput' in row:
+        line += f", {row['throughput']:.2f}/s"
+    if row['errors']:
+        line += " (" + ", ".join(f"{error} x{count}" for error, count in row['errors']) + ")"
+    return line
+
+
+class BenchClient:
+    """Concurrent timed requests to an API, with one HTTP session per worker thread."""
+
+    def __init__(self, api_url, timeout, workers):
+        self.api_url = api_url
+        self.timeout = timeout
+        self.workers = workers
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def timed(self, method, url, expected, **kwargs):
+        """Send a request. Returns (latency, response or None, error or None)."""
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            return time.perf_counter() - start, None, repr(e)
+        latency = time.perf_counter() - start
+        if response.status_code not in expected:
+            return latency, response, f"{method} {response.status_code}"
+        return latency, response, None
+
+    def run(self, function, *iterables):
+        """Apply an operation with workers requests in flight. Returns the outcomes and the wall time."""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            outcomes = list(executor.map(function, *iterables))
+        return outcomes, time.perf_counter() - start
+
+
+class CircuitClient(BenchClient):
+    """
+    Timed mef_eline circuit requests. Each returns an outcome with its latency
+    and error. The circuits are recorded in the resource journal, so the ones
+    of an interrupted benchmark are deleted by the next test session.
+    """
+
+    def create(self, payload):
+        latency, response, error = self.timed('POST', self.api_url, [200, 201], json=payload)
+        circuit_id = None
+        if error is None:
+            try:
+                circuit_id = response.json().get('circuit_id')
+            except ValueError:
+                error = "POST invalid JSON"
+            else:
+                JOURNAL.created('evc', f"{self.api_url}{circuit_id}")
+        return {'latency': latency, 'error': error, 'id': circuit_id}
+
+    def update(self, circuit_id, payload):
+        latency, _, error = self.timed('PATCH', f"{self.api_url}{circuit_id}", [200], json=payload)
+        return {'latency': latency, 'error': error}
+
+    def delete(self, circuit_id):
+        latency, _, error = self.timed('DELETE', f"{self.api_url}{circuit_id}", [200, 204])
+        if error is None:
+            JOURNAL.deleted(f"{self.api_url}{circuit_id}")
+        return {'latency': latency, 'error': error}
+
+    def leftovers(self, name_prefix):
+        """Ids of the circuits whose name starts with name_prefix, i.e. left by a previous benchmark."""
+        response = self.session.get(self.api_url, timeout=self.timeout)
+        response.raise_for_status()
+        return [circuit_id for circuit_id, circuit in response.json().items()
+                if circuit.get('name', '').startswith(name_prefix)]
@@ -0,0 +1,155 @@
+import os
+import time
+import shutil
+import functools
+from pathlib import Path
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+
+def build_chrome_options():
+    """Chrome options shared by every driver started by the test session."""
+    options = Options()
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    # Port 0 lets every Chrome pick a free DevTools port, so several sessions
+    # can run at once. CHROME_DEBUGGING_PORT pins it to attach a debugger.
+    options.add_argument(f"--remote-debugging-port={os.getenv('CHROME_DEBUGGING_PORT', '0')}")
+    options.add_argument("--window-size=1920,1080")
+
+    # Headless mode controlled by environment variable (default to true)
+    if os.getenv("HEADLESS", "true").lower() != "false":
+        options.add_argument("--headless=new")
+    return options
+
+
+# Where the chromedriver path resolved by webdriver-manager is remembered between runs
+CHROMEDRIVER_CACHE_FILE = Path(os.getenv(
+    "CHROMEDRIVER_CACHE_FILE", Path.home() / ".cache" / "kytos-ui-tests" / "chromedriver-path"))
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver():
+    """
+    Path of the chromedriver binary, resolved once per process: CHROMEDRIVER_PATH,
+    /usr/local/bin/chromedriver, the PATH, the path cached by a previous run,
+    and only then webdriver-manager, which may hit the network. None lets
+    Selenium Manager look for one.
+    """
+    candidates = [os.getenv("CHROMEDRIVER_PATH"), "/usr/local/bin/chromedriver", shutil.which("chromedriver")]
+    if CHROMEDRIVER_CACHE_FILE.exists():
+        candidates.append(CHROMEDRIVER_CACHE_FILE.read_text().strip())
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        print(f"\nwebdriver-manager could not resolve ChromeDriver: {e}")
+        return None
+    try:
+        CHROMEDRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CHROMEDRIVER_CACHE_FILE.write_text(path)
+    except OSError as e:
+        print(f"\nCould not cache the ChromeDriver path: {e}")
+    return path
+
+
+# Seconds the async scripts get beyond default_timeout, see start_chrome_driver
+SCRIPT_TIMEOUT_MARGIN = 2
+
+
+def start_chrome_driver(default_timeout):
+    """Start a new ChromeDriver session configured for the Kytos UI tests."""
+    options = build_chrome_options()
+    path = resolve_chromedriver()
+    service = Service(path) if path else Service()
+    driver = webdriver.Chrome(service=service, options=options)
+    print(f"\nChromeDriver successfully initialized ({path or 'Selenium Manager'}).")
+
+    driver.implicitly_wait(default_timeout)
+    # The async scripts (readiness, filters, list rendering) give up with null
+    # after default_timeout themselves, the margin lets them report it
+    driver.set_script_timeout(default_timeout + SCRIPT_TIMEOUT_MARGIN)
+    return driver
+
+
+class RecyclableDriver:
+    """
+    Proxy around a WebDriver that can swap the underlying Chrome instance.
+
+    Chrome is only started on the first WebDriver call, so tests that never
+    touch the browser do not pay for it. Page objects keep a reference to this
+    proxy, so recycling the browser between tests is transparent to them.
+    Every WebDriver command is reported to the callables in command_listeners
+    as listener(command, params, duration, error), and every new browser to
+    the callables in start_listeners as listener(driver).
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self.command_listeners = []
+        self.start_listeners = []
+        self._driver = None
+        self.recycle_count = 0
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped_driver, name)
+
+    def _start(self):
+        """Start a browser and route its commands through the listeners."""
+        driver = self._factory()
+        execute = driver.execute
+        listeners = self.command_listeners
+
+        def instrumented_execute(driver_command, params=None):
+            if not listeners:
+                return execute(driver_command, params)
+            error = None
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                for listener in listeners:
+                    listener(driver_command, params, duration, error)
+
+        driver.execute = instrumented_execute
+        for listener in self.start_listeners:
+            listener(driver)
+        return driver
+
+    @property
+    def started(self):
+        """Whether a browser is running behind the proxy."""
+        return self._driver is not None
+
+    @property
+    def wrapped_driver(self):
+        """The WebDriver currently behind the proxy, started on first use."""
+        if self._driver is None:
+            self._driver = self._start()
+        return self._driver
+
+    def recycle(self):
+        """Quit the current browser, the next WebDriver call starts a fresh one."""
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+        except Exception as e:
+            print(f"Error closing ChromeDriver before recycling: {e}")
+        self._driver = None
+        self.recycle_count += 1
+
+    def quit(self):
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
@@ -0,0 +1,222 @@
+import os
+import time
+import threading
+
+try:
+    import trio
+except ImportError:
+    trio = None
+
+# Events that fail a test, the others (slow responses) only warn
+FAILURE_KINDS = ('console', 'exception', 'status', 'failed')
+
+
+class BrowserEventWarning(UserWarning):
+    """The browser reported errors or slow responses that the test does not fail on."""
+
+
+def _describe(remote_object):
+    """Text of a console.error argument."""
+    if remote_object.value is not None:
+        return str(remote_object.value)
+    return remote_object.description or remote_object.type_
+
+
+def status_allowed(status, allowed):
+    """Whether a response status matches an allowed status, e.g. 404 or '4xx'."""
+    return any(str(status) == str(entry) or (isinstance(entry, str) and entry.endswith('xx')
+                                             and str(status)[0] == entry[0])
+               for entry in allowed)
+
+
+class BrowserEventMonitor:
+    """
+    Streams the console errors, uncaught exceptions and API responses of the
+    browser over a DevTools connection, so nothing is polled between steps.
+
+    Each event is charged to the page-object step that was running: the one
+    that sent the request for network events, the one running when the event
+    arrived for console events. API requests (XHR and fetch) answered with a
+    4xx/5xx status or that failed fail the test, those slower than slow_ms are
+    reported as warnings. The events are handled by a CDP connection running
+    in its own thread, like ApiInterceptor.
+
+    Every console message and network event, errors or not, is also passed
+    to the listeners, e.g. the ring buffers of DiagnosticsRecorder. In mode
+    'off' the events are only streamed to the listeners.
+    """
+
+    def __init__(self, mode='fail', slow_ms=2000, grace_ms=100):
+        self.mode = mode
+        self.slow = slow_ms / 1000
+        self.grace = grace_ms / 1000
+        self.nodeid = None
+        self.events = []
+        self._steps = []
+        self._requests = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._token = None
+        self._cancel_scope = None
+        self._ready = threading.Event()
+        # Called with (kind, event) for every console message ('console') and network event ('network')
+        self.listeners = []
+
+    @classmethod
+    def from_env(cls, stream=False):
+        """
+        Build a monitor from BROWSER_EVENTS_*. With BROWSER_EVENTS=off, None, or
+        a monitor in mode 'off' when stream is True, i.e. listeners need the events.
+        """
+        mode = os.getenv('BROWSER_EVENTS', 'fail').lower()
+        if mode == 'off' and not stream:
+            return None
+        if trio is None:
+            print("trio is not installed, browser events are not monitored")
+            return None
+        return cls(
+            mode,
+            int(os.getenv('BROWSER_EVENTS_SLOW_MS', '2000')),
+            int(os.getenv('BROWSER_EVENTS_GRACE_MS', '100')),
+        )
+
+    @property
+    def attached(self):
+        """Whether a browser is streamed, i.e. there can be events to check."""
+        return self._thread is not None
+
+    def start(self, nodeid, steps):
+        """Collect the events of a test; steps is the step stack of the test thread (PHASES.steps())."""
+        with self._lock:
+            self.nodeid = nodeid
+            self.events = []
+            self._steps = steps
+
+    def stop(self):
+        with self._lock:
+            self.nodeid = None
+            self._steps = []
+
+    def collected(self):
+        """Events of the running test, once the ones already sent by the browser had time to arrive."""
+        time.sleep(self.grace)
+        with self._lock:
+            return list(self.events)
+
+    def failures(self, events, allow_status=(), allow_console=False):
+        """Events that fail the test, given the allowances of its @pytest.mark.browser_events."""
+        failures = []
+        for event in events:
+            if event['kind'] not in FAILURE_KINDS:
+                continue
+            if event['kind'] == 'status' and status_allowed(event['status'], allow_status):
+                continue
+            if event['kind'] in ('console', 'exception') and allow_console:
+                continue
+            failures.append(event)
+        return failures
+
+    @staticmethod
+    def format(event):
+        return f"[{event['kind']}] {event['step']}: {event['message']}"
+
+    def _current_step(self):
+        steps = self._steps
+        return steps[-1] if steps else '(test code)'
+
+    def _add(self, kind, message, step=None, **details):
+        with self._lock:
+            if self.nodeid is not None:
+                self.events.append({'kind': kind, 'step': step or self._current_step(), 'message': message,
+                                    'time': time.time(), **details})
+
+    def _emit(self, kind, **event):
+        event['time'] = time.time()
+        for listener in self.listeners:
+            listener(kind, event)
+
+    def attach(self, driver):
+        """Start streaming the events of a freshly started browser."""
+        self.detach()
+        self._ready.clear()
+        self._thread = threading.Thread(target=trio.run, args=(self._serve, driver), daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=10):
+            print("Browser event monitoring did not start in time")
+
+    def detach(self):
+        if self._thread is None:
+            return
+        if self._token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._token)
+            except (RuntimeError, trio.RunFinishedError):
+                pass
+        self._thread.join(timeout=5)
+        self._thread = self._token = self._cancel_scope = None
+        self._requests.clear()
+
+    async def _serve(self, driver):
+        try:
+            with trio.CancelScope() as self._cancel_scope:
+                self._token = trio.lowlevel.current_trio_token()
+                async with driver.bidi_connection() as connection:
+                    session, devtools = connection.session, connection.devtools
+                    runtime, network = devtools.runtime, devtools.network
+                    await session.execute(runtime.enable())
+                    await session.execute(network.enable())
+                    events = session.listen(
+                        runtime.ConsoleAPICalled, runtime.ExceptionThrown, network.RequestWillBeSent,
+                        network.ResponseReceived, network.LoadingFinished, network.LoadingFailed,
+                        buffer_size=1000,
+                    )
+                    self._ready.set()
+                    async for event in events:
+                        self._handle(devtools, event)
+        except Exception as e:
+            print(f"Browser event monitoring stopped: {e}")
+        finally:
+            self._ready.set()
+
+    def _handle(self, devtools, event):
+        runtime, network = devtools.runtime, devtools.network
+        if isinstance(event, runtime.ConsoleAPICalled):
+            message = ' '.join(_describe(arg) for arg in event.args)
+            self._emit('console', level=event.type_, message=message)
+            if event.type_ in ('error', 'assert'):
+                self._add('console', message)
+        elif isinstance(event, runtime.ExceptionThrown):
+            details = event.exception_details
+            message = details.exception.description if details.exception and details.exception.description \
+                else details.text
+            self._emit('console', level='exception', message=message, url=details.url)
+            self._add('exception', message, url=details.url)
+        elif isinstance(event, network.RequestWillBeSent):
+            self._emit('network', method='Network.requestWillBeSent', request_id=str(event.request_id),
+                       url=event.request.url, http_method=event.request.method,
+                       type=event.type_.value if event.type_ else None)
+            if event.type_ in (network.ResourceType.XHR, network.ResourceType.FETCH):
+                self._requests[event.request_id] = (event.request.method, event.request.url,
+                                                    float(event.timestamp), self._current_step())
+        elif isinstance(event, network.ResponseReceived):
+            self._emit('network', method='Network.responseReceived', request_id=str(event.request_id),
+                       url=event.response.url, status=event.response.status)
+            request = self._requests.get(event.request_id)
+            if request and event.response.status >= 400:
+                method, url, _, step = request
+                self._add('status', f"{method} {url} -> {event.response.status}", step,
+                          url=url, status=event.response.status)
+        elif isinstance(event, network.LoadingFinished):
+            request = self._requests.pop(event.request_id, None)
+            if request:
+                method, url, started, step = request
+                duration = float(event.timestamp) - started
+                if duration > self.slow:
+                    self._add('slow', f"{method} {url} took {duration:.2f}s", step, url=url, duration=duration)
+        elif isinstance(event, network.LoadingFailed):
+            self._emit('network', method='Network.loadingFailed', request_id=str(event.request_id),
+                       error=event.error_text)
+            request = self._requests.pop(event.request_id, None)
+            if request and not event.canceled:
+                method, url, _, step = request
+                self._add('failed', f"{method} {url}: {event.error_text}", step, url=url)
@@ -0,0 +1,165 @@
+import re
+import gzip
+import json
+import base64
+import hashlib
+import threading
+from pathlib import Path
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from tests.utils.scenarios import freeze_clock
+
+# Headers describing the raw body, which is stored decoded
+DROPPED_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length')
+
+
+class CassetteMiss(requests.ConnectionError):
+    """No response was recorded for a request made in replay mode."""
+
+
+def request_key(request):
+    """Method, url and a digest of the body of a prepared request."""
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode()
+    digest = f" {hashlib.sha1(body).hexdigest()[:12]}" if body else ''
+    return f"{request.method} {request.url}{digest}"
+
+
+def serialize(response):
+    try:
+        body, encoding = response.content.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        body, encoding = base64.b64encode(response.content).decode('ascii'), 'base64'
+    headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+    return {'status': response.status_code, 'reason': response.reason, 'headers': headers,
+            'body': body, 'encoding': encoding}
+
+
+def build_response(request, data):
+    """A requests.Response for a prepared request, from a recorded interaction."""
+    response = requests.Response()
+    response.status_code = data['status']
+    response.reason = data['reason']
+    response.headers = CaseInsensitiveDict(data['headers'])
+    response._content = base64.b64decode(data['body']) if data['encoding'] == 'base64' else data['body'].encode()
+    response.encoding = 'utf-8'
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class Cassette:
+    """
+    The HTTP interactions of one test, stored as gzipped JSON. Responses are
+    kept in order per request, so polling the same url replays the same
+    sequence; the last response is repeated once the sequence is exhausted.
+    now is the time the test was recorded at.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.now = time.time()
+        self.interactions = {}
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self.path.exists():
+            with gzip.open(self.path, 'rt') as file:
+                data = json.load(file)
+            self.now, self.interactions = data['now'], data['interactions']
+        return self
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, 'wt') as file:
+            json.dump({'now': self.now, 'interactions': self.interactions}, file, separators=(',', ':'))
+
+    def record(self, key, data):
+        with self._lock:
+            self.interactions.setdefault(key, []).append(data)
+
+    def play(self, key):
+        with self._lock:
+            responses = self.interactions.get(key)
+            if not responses:
+                return None
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = min(index + 1, len(responses) - 1)
+            return responses[index]
+
+
+class CassetteRecorder:
+    """
+    Records the HTTP requests made while a test runs to one cassette per test,
+    or serves them back from the cassettes without touching the network.
+
+    It hooks HTTPAdapter.send, so every requests call of the page objects, the
+    topology snapshot and the verifications goes through it. Requests made
+    outside a test are not affected. In replay mode, a request missing from
+    the cassette of the test is looked up in all the cassettes of the
+    directory, e.g. the topology fetched once for the session.
+
+    The scenario clock is frozen at the recording time of the test, so the
+    relative maintenance window times give the same requests on replay.
+    """
+
+    def __init__(self, directory, mode):
+        self.directory = Path(directory)
+        self.mode = mode
+        self.cassette = None
+        self._library = None
+        self._original_send = None
+
+    def install(self):
+        original = self._original_send = HTTPAdapter.send
+        recorder = self
+
+        def send(adapter, request, **kwargs):
+            return recorder.send(original, adapter, request, **kwargs)
+
+        HTTPAdapter.send = send
+
+    def uninstall(self):
+        if self._original_send is not None:
+            HTTPAdapter.send = self._original_send
+            self._original_send = None
+
+    def start(self, nodeid):
+        path = self.directory / (re.sub(r'[^\w.-]+', '_', nodeid) + '.json.gz')
+        self.cassette = Cassette(path).load() if self.mode == 'replay' else Cassette(path)
+        freeze_clock(self.cassette.now)
+
+    def stop(self):
+        if self.mode == 'record' and self.cassette and self.cassette.interactions:
+            self.cassette.save()
+        self.cassette = None
+        freeze_clock(None)
+
+    def library(self):
+        """The last recorded response of every request, over all the cassettes."""
+        if self._library is None:
+            self._library = {}
+            for path in sorted(self.directory.glob('*.json.gz')):
+                for key, responses in Cassette(path).load().interactions.items():
+                    self._library[key] = responses[-1]
+        return self._library
+
+    def send(self, original, adapter, request, **kwargs):
+        cassette = self.cassette
+        if cassette is None:
+            return original(adapter, request, **kwargs)
+
+        key = request_key(request)
+        if self.mode == 'replay':
+            data = cassette.play(key) or self.library().get(key)
+            if data is None:
+                raise CassetteMiss(f"No recorded response for {key}", request=request)
+            return build_response(request, data)
+
+        response = original(adapter, request, **kwargs)
+        cassette.record(key, serialize(response))
+        return response
@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+from collections import Counter
+from pathlib import Path
+from tests.utils.timing import PHASES, qualname
+
+UTILS_DIR = str(Path(__file__).parent)
+TESTS_DIR = str(Path(__file__).parent.parent)
+
+# Frames of the harness plumbing, skipped when looking for the call site of a command
+PLUMBING_FILES = (os.path.join(UTILS_DIR, 'browser.py'), os.path.join(UTILS_DIR, 'commands.py'))
+
+
+def call_site():
+    """
+    Page-object method and call site ("file:line") of the WebDriver command
+    being executed, from the innermost frame of the tests directory.
+    """
+    frame = sys._getframe(1)
+    site = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(TESTS_DIR) and filename not in PLUMBING_FILES:
+            if site is None:
+                site = f"{Path(filename).name}:{frame.f_lineno}"
+            if filename.endswith('_page.py'):
+                return qualname(frame), site
+        frame = frame.f_back
+    return PHASES.current_step or '(test code)', site or '(outside tests)'
+
+
+class CommandAccounting:
+    """
+    Counts and times the WebDriver commands of each test, i.e. the round
+    trips to chromedriver, per page-object method and per call site.
+
+    Runs as a command listener of RecyclableDriver. A test can cap its
+    commands with @pytest.mark.webdriver_budget, see budget_violations.
+    """
+
+    def __init__(self):
+        self.nodeid = None
+        self.tests = {}
+        self.methods = Counter()
+        self.method_times = Counter()
+        self.sites = Counter()
+        self.site_times = Counter()
+        self.commands = Counter()
+
+    @classmethod
+    def from_env(cls):
+        """Build the accounting, or None when COMMAND_ACCOUNTING=false."""
+        if os.getenv('COMMAND_ACCOUNTING', 'true').lower() == 'false':
+            return None
+        return cls()
+
+    def start(self, nodeid):
+        self.nodeid = nodeid
+        self.tests[nodeid] = {'commands': 0, 'seconds': 0.0, 'methods': Counter(), 'method_times': Counter()}
+
+    def stop(self):
+        self.nodeid = None
+
+    def on_command(self, command, params, duration, error):
+        """WebDriver command listener, see RecyclableDriver."""
+        if self.nodeid is None:
+            return
+        method, site = call_site()
+        test = self.tests[self.nodeid]
+        test['commands'] += 1
+        test['seconds'] += duration
+        test['methods'][method] += 1
+        test['method_times'][method] += duration
+        self.methods[method] += 1
+        self.method_times[method] += duration
+        self.sites[(method, site)] += 1
+        self.site_times[(method, site)] += duration
+        self.commands[command] += 1
+
+    def budget_violations(self, nodeid, commands=None, seconds=None):
+        """Messages for a test that went over its command count or round-trip time budget."""
+        test = self.tests.get(nodeid)
+        if test is None:
+            return []
+        violations = []
+        if commands is not None and test['commands'] > commands:
+            heaviest = ", ".join(f"{method} x{count}" for method, count in test['methods'].most_common(3))
+            violations.append(f"{test['commands']} WebDriver commands > {commands} ({heaviest})")
+        if seconds is not None and test['seconds'] > seconds:
+            violations.append(f"{test['seconds']:.2f}s in WebDriver commands > {seconds}s")
+        return violations
+
+    def report_lines(self, limit=10):
+        """Heaviest call sites and tests of the run, by number of commands."""
+        total = sum(self.methods.values())
+        if not total:
+            return []
+        lines = [f"{total} WebDriver commands in {sum(self.method_times.values()):.1f}s over "
+                 f"{len(self.tests)} test(s); most used: "
+                 + ", ".join(f"{command} x{count}" for command, count in self.commands.most_common(5))]
+        lines.append("heaviest call sites:")
+        for (method, site), count in self.sites.most_common(limit):
+            lines.append(f"  {count:>6} commands {self.site_times[(method, site)]:>8.2f}s  {method} ({site})")
+        lines.append("chattiest tests:")
+        tests = sorted(self.tests.items(), key=lambda item: item[1]['commands'], reverse=True)
+        for nodeid, test in tests[:limit]:
+            if test['commands']:
+                lines.append(f"  {test['commands']:>6} commands {test['seconds']:>8.2f}s  {nodeid}")
+        return lines
+
+    def write_report(self, path):
+        """Dump the commands per test and method and the call sites as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            'tests': {nodeid: {'commands': test['commands'], 'seconds': test['seconds'],
+                               'methods': {method: {'commands': count, 'seconds': test['method_times'][method]}
+                                           for method, count in test['methods'].items()}}
+                      for nodeid, test in self.tests.items()},
+            'call_sites': [{'method': method, 'site': site, 'commands': count,
+                            'seconds': self.site_times[(method, site)]}
+                           for (method, site), count in self.sites.most_common()],
+            'commands': dict(self.commands),
+        }
+        path.write_text(json.dumps(report, indent=2))
@@ -0,0 +1,242 @@
+"""
+Several operators creating EVCs and maintenance windows at once.
+
+Each operator is a browser session of its own, driven through EVCPage and
+MaintenancePage against the same controller. All the operators use the same
+endpoints, switches and window times. With --shared-vlans they also compete
+for the same VLAN in every attempt. For each concurrency level:
+
+    python -m tests.utils.contention run [--operators 1,2,4,8] [--iterations 3]
+                                         [--workflows evc,maintenance] [--shared-vlans] [--output PATH]
+
+prints the latency inflation against the first level, the error and race
+rates and the throughput, i.e. the throughput-versus-concurrency curve.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import requests
+from tests.utils.bench import percentile
+from tests.utils.browser import start_chrome_driver
+from tests.utils.evc_page import EVCPage
+from tests.utils.journal import JOURNAL
+from tests.utils.maintenance_page import MaintenancePage
+from tests.utils.scenarios import build_window, load_scenarios
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent.parent / '.env')
+except ImportError:
+    pass
+
+# First VLAN used by the contention circuits
+VLAN_BASE = 2000
+
+NAME_PREFIX = 'Contention'
+
+
+class Operator:
+    """One browser session creating resources through the page objects."""
+
+    def __init__(self, index, config):
+        self.index = index
+        self.config = config
+        self.driver = start_chrome_driver(config.timeout)
+        self.evc_page = EVCPage(self.driver, config.base_url, config.mefeline_url, config.timeout)
+        self.maintenance_page = MaintenancePage(self.driver, config.base_url, config.maintenance_url, config.timeout)
+        self.attempts = []
+
+    def vlan(self, attempt):
+        if self.config.shared_vlans:
+            return VLAN_BASE + attempt
+        return VLAN_BASE + self.index * self.config.iterations + attempt
+
+    def create_evc(self, level, attempt):
+        vlan = str(self.vlan(attempt))
+        data = dict(self.config.circuit, name=f"{NAME_PREFIX}_{level}_{self.index}_{attempt}", vlan_a=vlan, vlan_z=vlan)
+        self.evc_page.navigate_to_evc_form()
+        self.evc_page.fill_circuit_form(data)
+        self.evc_page.submit_form()
+        return self.evc_page.verify_circuit_via_api(data['name'])
+
+    def create_maintenance(self, level, attempt):
+        data = dict(self.config.window, description=f"{NAME_PREFIX} {level} {self.index} {attempt}")
+        inserted_time = time.time() - 1
+        self.maintenance_page.navigate_to_maintenance_tab()
+        self.maintenance_page.fill_maintenance_form(data)
+        self.maintenance_page.submit_form()
+        return self.maintenance_page.verify_windows_via_api(data, inserted_time)
+
+    def run(self, level, barrier):
+        """Wait for the other operators, then go through every workflow of every attempt."""
+        barrier.wait()
+        for attempt in range(self.config.iterations):
+            for workflow in self.config.workflows:
+                start = time.perf_counter()
+                try:
+                    resource_id = getattr(self, f"create_{workflow}")(level, attempt)
+                    error = None if resource_id is not None else "not found in the API"
+                except Exception as e:
+                    resource_id, error = None, repr(e)
+                self.attempts.append({
+                    'operator': self.index, 'workflow': workflow, 'attempt': attempt,
+                    'latency': time.perf_counter() - start, 'id': resource_id, 'error': error,
+                })
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"Error closing ChromeDriver: {e}")
+
+
+def evc_races(config, level):
+    """Contention circuits of a level sharing the same endpoint and VLAN, i.e. allocated twice."""
+    response = requests.get(config.mefeline_url, timeout=config.timeout)
+    response.raise_for_status()
+    tags = Counter(
+        (circuit['uni_a']['interface_id'], json.dumps(circuit['uni_a'].get('tag', {}).get('value')))
+        for circuit in response.json().values()
+        if circuit.get('name', '').startswith(f"{NAME_PREFIX}_{level}_") and circuit.get('active', True)
+    )
+    return sum(count - 1 for count in tags.values() if count > 1)
+
+
+def window_races(config, level):
+    """Contention windows of a level created more than once."""
+    response = requests.get(config.maintenance_url, timeout=config.timeout)
+    response.raise_for_status()
+    descriptions = Counter(
+        window.get('description') for window in response.json()
+        if (window.get('description') or '').startswith(f"{NAME_PREFIX} {level} ")
+    )
+    return sum(count - 1 for count in descriptions.values() if count > 1)
+
+
+def cleanup(config, level):
+    """Delete every resource created by the operators of a level."""
+    evc_page = EVCPage(None, config.base_url, config.mefeline_url, config.timeout)
+    response = requests.get(config.mefeline_url, timeout=config.timeout)
+    if response.status_code == 200:
+        for circuit in response.json().values():
+            if circuit.get('name', '').startswith(f"{NAME_PREFIX}_{level}_"):
+                evc_page.cleanup_test_circuit(circuit['name'])
+    maintenance_page = MaintenancePage(None, config.base_url, config.maintenance_url, config.timeout)
+    response = requests.get(config.maintenance_url, timeout=config.timeout)
+    if response.status_code == 200:
+        maintenance_page.cleanup_windows([
+            window['id'] for window in response.json()
+            if (window.get('description') or '').startswith(f"{NAME_PREFIX} {level} ")
+        ])
+
+
+def run_level(config, level):
+    """Run one concurrency level. Returns its summary per workflow."""
+    operators = []
+    try:
+        with ThreadPoolExecutor(max_workers=level) as executor:
+            for started in [executor.submit(Operator, index, config) for index in range(level)]:
+                try:
+                    operators.append(started.result())
+                except Exception as e:
+                    print(f"Error starting an operator: {e}")
+            if len(operators) < level:
+                raise RuntimeError(f"Only {len(operators)} of {level} browser sessions started")
+
+            # The browsers are up, time only the workflows
+            barrier = threading.Barrier(level + 1)
+            futures = [executor.submit(operator.run, level, barrier) for operator in operators]
+            barrier.wait()
+            start = time.perf_counter()
+            for future in futures:
+                future.result()
+            wall_time = time.perf_counter() - start
+
+        attempts = [attempt for operator in operators for attempt in operator.attempts]
+        races = {'evc': evc_races, 'maintenance': window_races}
+        summary = {}
+        for workflow in config.workflows:
+            done = [attempt for attempt in attempts if attempt['workflow'] == workflow]
+            latencies = [attempt['latency'] for attempt in done if attempt['error'] is None]
+            errors = [attempt['error'] for attempt in done if attempt['error'] is not None]
+            summary[workflow] = {
+                'operators': level,
+                'attempts': len(done),
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'error_rate': len(errors) / len(done) if done else 0.0,
+                'race_rate': races[workflow](config, level) / len(done) if done else 0.0,
+                'throughput': len(latencies) / wall_time if wall_time else 0.0,
+                'errors': Counter(errors).most_common(5),
+            }
+        return summary
+    finally:
+        for operator in operators:
+            operator.quit()
+        cleanup(config, level)
+
+
+def report_lines(curve):
+    """One line per workflow and concurrency level, with the inflation against the first level."""
+    lines = []
+    for workflow in sorted({workflow for summary in curve for workflow in summary}):
+        rows = [summary[workflow] for summary in curve if workflow in summary]
+        baseline = rows[0]['p50']
+        lines.append(f"{workflow}:")
+        for row in rows:
+            inflation = f"x{row['p50'] / baseline:.2f}" if baseline and row['p50'] else "n/a"
+            p50 = f"{row['p50']:.2f}s" if row['p50'] is not None else "n/a"
+            p95 = f"{row['p95']:.2f}s" if row['p95'] is not None else "n/a"
+            lines.append(
+                f"  {row['operators']:>3} operator(s): p50 {p50} ({inflation}), p95 {p95}, "
+                f"errors {row['error_rate']:.0%}, races {row['race_rate']:.0%}, {row['throughput']:.2f}/s"
+            )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent operators on the Kytos UI")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run = subparsers.add_parser('run', help="run the workflows at increasing concurrency levels")
+    run.add_argument('--operators', default='1,2,4', help="comma separated concurrency levels")
+    run.add_argument('--iterations', type=int, default=3, help="attempts of each workflow per operator")
+    run.add_argument('--workflows', default='evc,maintenance', help="evc and/or maintenance")
+    run.add_argument('--shared-vlans', action='store_true', help="make every operator request the same VLAN")
+    run.add_argument('--output', help="write the curve as JSON")
+    args = parser.parse_args(argv)
+    JOURNAL.open_from_env()
+
+    circuit = {key: value for key, value in load_scenarios('mefeline')['listed_circuits'][0].items() if key != 'id'}
+    window = build_window(load_scenarios('maintenance')['valid_data'][0]['windows'][0])
+    config = argparse.Namespace(
+        base_url=os.getenv('BASE_URL', 'http://localhost:18181'),
+        mefeline_url=os.getenv('API_MEFELINE_URL', 'http://localhost:18181/api/kytos/mef_eline/v2/evc/'),
+        maintenance_url=os.getenv('API_MAINTENANCE_URL', 'http://localhost:18181/api/kytos/maintenance/v1/'),
+        timeout=int(os.getenv('DEFAULT_TIMEOUT', '10')),
+        iterations=args.iterations,
+        workflows=args.workflows.split(','),
+        shared_vlans=args.shared_vlans,
+        circuit=circuit,
+        window=window,
+    )
+
+    curve = []
+    for level in sorted(int(level) for level in args.operators.split(',')):
+        print(f"Running {level} operator(s)...")
+        curve.append(run_level(config, level))
+    for line in report_lines(curve):
+        print(line)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(curve, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
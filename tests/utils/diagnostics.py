@@ -0,0 +1,113 @@
+import os
+import re
+import json
+import time
+from collections import deque
+from pathlib import Path
+
+# Written in the bundle when the DevTools stream is not available
+CAPTURE_UNAVAILABLE = (
+    "The DevTools stream of BrowserEventMonitor was not available (trio is not installed).\n"
+    "console.json holds the entries of chromedriver's browser log instead, warnings and errors only.\n"
+    "network.json is empty: the network events are not captured.\n"
+)
+
+
+class DiagnosticsRecorder:
+    """
+    Keeps the most recent WebDriver commands, console messages and network
+    events of the running test in ring buffers and writes an artifact bundle
+    only when the test fails.
+
+    The console messages and network events come from the DevTools stream of
+    BrowserEventMonitor (see on_browser_event), so nothing is buffered by
+    Chrome or chromedriver for the passing tests. Without the stream, the
+    console messages are read from chromedriver's browser log when the
+    bundle is written, and capture.txt says what is missing.
+    """
+
+    def __init__(self, output_dir, size=200):
+        self.output_dir = Path(output_dir)
+        self.size = size
+        self.commands = deque(maxlen=size)
+        self.console = deque(maxlen=size)
+        self.network = deque(maxlen=size)
+        self.driver = None
+        self.nodeid = None
+        self.started_at = None
+        # Whether on_browser_event is fed by a BrowserEventMonitor
+        self.streamed = False
+
+    @classmethod
+    def from_env(cls):
+        """Build a recorder from DIAGNOSTICS_*, or None when DIAGNOSTICS=false."""
+        if os.getenv('DIAGNOSTICS', 'true').lower() == 'false':
+            return None
+        return cls(
+            os.getenv('DIAGNOSTICS_DIR', 'reports/diagnostics'),
+            int(os.getenv('DIAGNOSTICS_BUFFER_SIZE', '200')),
+        )
+
+    @property
+    def active(self):
+        """Whether a test is recorded and its browser was started, i.e. there is something to dump."""
+        return self.driver is not None and getattr(self.driver, 'started', True)
+
+    def start(self, nodeid, driver):
+        """Start recording a new test."""
+        self.commands.clear()
+        self.console.clear()
+        self.network.clear()
+        self.nodeid = nodeid
+        self.driver = driver
+        self.started_at = time.time()
+
+    def stop(self):
+        self.driver = None
+
+    def on_command(self, command, params, duration, error):
+        """WebDriver command listener, see RecyclableDriver."""
+        if self.driver is not None:
+            self.commands.append((time.time(), command, params, duration, error))
+
+    def on_browser_event(self, kind, event):
+        """BrowserEventMonitor listener, called from its thread."""
+        if self.driver is not None:
+            (self.console if kind == 'console' else self.network).append(event)
+
+    def _browser_log(self):
+        """Entries of chromedriver's browser log written since the test started."""
+        try:
+            entries = self.driver.get_log('browser')
+        except Exception as e:
+            print(f"Error reading browser log: {e}")
+            return []
+        since = self.started_at * 1000
+        return [{'time': entry['timestamp'] / 1000, 'level': entry['level'].lower(), 'message': entry['message']}
+                for entry in entries if entry['timestamp'] >= since][-self.size:]
+
+    def dump(self, error_text):
+        """Write the buffers, a screenshot and the DOM of the running test. Returns the bundle directory."""
+        bundle = self.output_dir / re.sub(r'[^\w.-]+', '_', self.nodeid)
+        bundle.mkdir(parents=True, exist_ok=True)
+
+        commands = [
+            {'time': ts, 'command': command, 'params': params, 'duration': duration,
+             'error': repr(error) if error else None}
+            for ts, command, params, duration, error in list(self.commands)
+        ]
+        console = list(self.console) if self.streamed else self._browser_log()
+        network = list(self.network)
+        if not self.streamed:
+            (bundle / 'capture.txt').write_text(CAPTURE_UNAVAILABLE)
+
+        (bundle / 'error.txt').write_text(error_text)
+        (bundle / 'commands.json').write_text(json.dumps(commands, indent=2, default=str))
+        (bundle / 'console.json').write_text(json.dumps(console, indent=2))
+        (bundle / 'network.json').write_text(json.dumps(network, indent=2))
+        try:
+            self.driver.save_screenshot(str(bundle / 'screenshot.png'))
+            (bundle / 'dom.html').write_text(self.driver.page_source)
+        except Exception as e:
+            print(f"Error capturing page state: {e}")
+        return bundle
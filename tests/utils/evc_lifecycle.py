@@ -0,0 +1,218 @@
+"""
+Throughput of the EVC lifecycle, through the mef_eline API and through the UI.
+
+N circuits shaped like the listed_circuits scenarios of mefeline.yaml (same
+endpoints, one VLAN pair per circuit) are created, updated (moved to another
+VLAN pair) and deleted through API_MEFELINE_URL, with --workers requests in
+flight. Then --ui-count circuits are created through the EVC form with
+--ui-workers browser sessions:
+
+    python -m tests.utils.evc_lifecycle run [--count 50] [--workers 8] [--ui-count 5] [--ui-workers 1]
+                                            [--output PATH]
+
+It reports the p50/p95/max latency and the throughput of each operation on
+both paths. The API latency is the controller cost. The form latency is split
+into navigate, fill and submit, which are UI cost, and visible (from submit
+until the API lists the circuit), which is mostly controller cost again.
+EVCPage has no form for updating or deleting a circuit, so only creation is
+measured through the UI; its circuits are deleted through the API.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tests.utils.bench import CircuitClient, latency_stats, stats_line
+from tests.utils.browser import start_chrome_driver
+from tests.utils.evc_page import EVCPage
+from tests.utils.journal import JOURNAL
+from tests.utils.scenarios import load_scenarios
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent.parent / '.env')
+except ImportError:
+    pass
+
+NAME_PREFIX = 'Lifecycle'
+
+# VLANs of the index-th benchmark circuit: created on VLAN_BASE + index and
+# updated to VLAN_BASE + UPDATE_OFFSET + index. The form circuits are numbered
+# after the API ones.
+VLAN_BASE = 3000
+UPDATE_OFFSET = 500
+
+API_OPERATIONS = ('create', 'update', 'delete')
+UI_STEPS = ('navigate', 'fill', 'submit', 'visible')
+
+
+def circuit_data(template, index, vlan_offset=0):
+    """Form data of the index-th benchmark circuit, shaped like template."""
+    vlan = str(VLAN_BASE + vlan_offset + index)
+    return dict(template, name=f"{NAME_PREFIX}_{index:04d}", vlan_a=vlan, vlan_z=vlan)
+
+
+def update_payload(data):
+    """PATCH payload moving a circuit to the UNIs of data."""
+    payload = EVCPage.circuit_payload(data)
+    return {'uni_a': payload['uni_a'], 'uni_z': payload['uni_z']}
+
+
+def run_api(config, client):
+    """Create, update and delete config.count circuits through the API. Returns the stats per operation."""
+    indexes = range(config.count)
+    results = {}
+    created, wall_time = client.run(
+        client.create, [EVCPage.circuit_payload(circuit_data(config.template, i)) for i in indexes])
+    results['create'] = latency_stats(created, wall_time)
+    circuit_ids = [outcome['id'] for outcome in created if outcome['id']]
+    try:
+        updated, wall_time = client.run(
+            client.update, circuit_ids,
+            [update_payload(circuit_data(config.template, i, UPDATE_OFFSET))
+             for i, outcome in zip(indexes, created) if outcome['id']])
+        results['update'] = latency_stats(updated, wall_time)
+    finally:
+        deleted, wall_time = client.run(client.delete, circuit_ids)
+        results['delete'] = latency_stats(deleted, wall_time)
+    return results
+
+
+class FormOperator:
+    """One browser session creating circuits through the EVC form."""
+
+    def __init__(self, config):
+        self.driver = start_chrome_driver(config.timeout)
+        self.evc_page = EVCPage(self.driver, config.base_url, config.api_url, config.timeout)
+
+    def create(self, data):
+        """Create a circuit through the form, timing each step. Returns what happened."""
+        outcome = {'name': data['name'], 'error': None, 'id': None}
+        start = step_start = time.perf_counter()
+        try:
+            for step, action in (('navigate', self.evc_page.navigate_to_evc_form),
+                                 ('fill', lambda: self.evc_page.fill_circuit_form(data)),
+                                 ('submit', self.evc_page.submit_form)):
+                action()
+                outcome[step] = time.perf_counter() - step_start
+                step_start = time.perf_counter()
+            outcome['id'] = self.evc_page.verify_circuit_via_api(data['name'])
+            outcome['visible'] = time.perf_counter() - step_start
+            if outcome['id'] is None:
+                outcome['error'] = "not found in the API"
+        except Exception as e:
+            outcome['error'] = repr(e)
+        outcome['latency'] = time.perf_counter() - start
+        return outcome
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"Error closing ChromeDriver: {e}")
+
+
+def run_ui(config, client):
+    """Create config.ui_count circuits through the form. Returns the stats of the creation and of its steps."""
+    if not config.ui_count:
+        return None
+    operators = []
+    try:
+        with ThreadPoolExecutor(max_workers=config.ui_workers) as executor:
+            for started in [executor.submit(FormOperator, config) for _ in range(config.ui_workers)]:
+                try:
+                    operators.append(started.result())
+                except Exception as e:
+                    print(f"Error starting a browser session: {e}")
+            if not operators:
+                raise RuntimeError("No browser session started")
+
+            # Browsers are up, time only the form: operator k creates circuits k, k + n, k + 2n...
+            batches = [[circuit_data(config.template, config.count + i)
+                        for i in range(k, config.ui_count, len(operators))] for k in range(len(operators))]
+            start = time.perf_counter()
+            futures = [executor.submit(lambda operator, batch: [operator.create(data) for data in batch],
+                                       operator, batch) for operator, batch in zip(operators, batches)]
+            created = [outcome for future in futures for outcome in future.result()]
+            wall_time = time.perf_counter() - start
+    finally:
+        for operator in operators:
+            operator.quit()
+        # The API circuits are already deleted, whatever is left was created through the form
+        client.run(client.delete, client.leftovers(f"{NAME_PREFIX}_"))
+
+    results = {'create': latency_stats(created, wall_time)}
+    for step in UI_STEPS:
+        results[step] = latency_stats([{'latency': outcome[step], 'error': None}
+                                       for outcome in created if step in outcome])
+    return results
+
+
+def _line(label, row):
+    return f"  {label:<10} {stats_line(row)}"
+
+
+def report_lines(results):
+    api, ui = results['api'], results['ui']
+    lines = [f"API ({results['count']} circuits, {results['workers']} in flight):"]
+    lines += [_line(operation, api[operation]) for operation in API_OPERATIONS if operation in api]
+    if ui:
+        lines.append(f"UI ({results['ui_count']} circuits, {results['ui_workers']} browser session(s)):")
+        lines.append(_line('create', ui['create']))
+        lines += [_line(step, ui[step]) for step in UI_STEPS]
+        if ui['create']['p50'] is not None and api['create']['p50'] is not None:
+            form = sum(ui[step]['p50'] or 0 for step in ('navigate', 'fill', 'submit'))
+            lines.append(f"Create p50: controller {api['create']['p50']:.2f}s (API), form {form:.2f}s "
+                         f"(navigate + fill + submit), {ui['create']['p50'] / api['create']['p50']:.1f}x the API")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EVC lifecycle throughput through the API and the UI")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run = subparsers.add_parser('run', help="create, update and delete circuits through the API, create through the UI")
+    run.add_argument('--count', type=int, default=50, help="circuits of the API benchmark")
+    run.add_argument('--workers', type=int, default=8, help="API requests in flight")
+    run.add_argument('--ui-count', type=int, default=5, help="circuits created through the form, 0 for none")
+    run.add_argument('--ui-workers', type=int, default=1, help="browser sessions filling the form")
+    run.add_argument('--output', help="write the results as JSON")
+    subparsers.add_parser('cleanup', help="delete the circuits left by an interrupted run")
+    args = parser.parse_args(argv)
+    JOURNAL.open_from_env()
+
+    template = {key: value for key, value in load_scenarios('mefeline')['listed_circuits'][0].items() if key != 'id'}
+    config = argparse.Namespace(
+        base_url=os.getenv('BASE_URL', 'http://localhost:18181'),
+        api_url=os.getenv('API_MEFELINE_URL', 'http://localhost:18181/api/kytos/mef_eline/v2/evc/'),
+        timeout=int(os.getenv('DEFAULT_TIMEOUT', '10')),
+        template=template,
+        count=getattr(args, 'count', 0),
+        ui_count=getattr(args, 'ui_count', 0),
+        ui_workers=getattr(args, 'ui_workers', 1),
+    )
+    client = CircuitClient(config.api_url, config.timeout, getattr(args, 'workers', 8))
+
+    if args.command == 'cleanup':
+        leftovers = client.leftovers(f"{NAME_PREFIX}_")
+        deleted, _ = client.run(client.delete, leftovers)
+        print(f"Deleted {sum(outcome['error'] is None for outcome in deleted)} of {len(leftovers)} leftover EVCs")
+        return 0
+
+    if config.count + config.ui_count > UPDATE_OFFSET:
+        parser.error(f"at most {UPDATE_OFFSET} circuits in all")
+    results = {'count': config.count, 'workers': client.workers, 'ui_count': config.ui_count,
+               'ui_workers': config.ui_workers}
+    results['api'] = run_api(config, client)
+    results['ui'] = run_ui(config, client)
+    for line in report_lines(results):
+        print(line)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
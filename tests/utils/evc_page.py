@@ -1,12 +1,47 @@
+import json
 import time
 import requests
+from datetime import datetime, timezone
+from functools import partial
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
+from tests.utils.verification import verify_concurrently
+from tests.utils.timing import timed_phase
+from tests.utils.base_page import BasePage
+from tests.utils.journal import JOURNAL
 
-class EVCPage:
+
+# creation_time of the mef_eline circuits
+CREATION_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Resolves with the milliseconds to the first row of the installed EVC table and
+# to its row count staying the same for stableMs, or null after timeoutMs
+EVC_ROWS_SCRIPT = """
+const [tableId, timeoutMs, stableMs, done] = arguments;
+const start = performance.now();
+let firstRow = null, count = -1, changedAt = start;
+const tick = () => {
+    const now = performance.now();
+    const rows = document.querySelectorAll(`#${tableId} tbody tr`).length;
+    if (rows > 0 && firstRow === null) firstRow = now - start;
+    if (rows !== count) {
+        count = rows;
+        changedAt = now;
+    }
+    if (rows > 0 && now - changedAt >= stableMs) {
+        done({first_row: firstRow, rendered: changedAt - start, rows: rows});
+    } else if (now - start > timeoutMs) {
+        done(null);
+    } else {
+        setTimeout(tick, 16);
+    }
+};
+tick();
+"""
+
+
+class EVCPage(BasePage):
     """
     Page Object Model for the EVC creation and management page in Kytos UI.
     Encapsulates all UI interactions and locators.
@@ -33,29 +68,19 @@ class EVCPage:
         'submit_button': (By.XPATH, "//button[contains(., 'Request') and not(@disabled)]"),
         'cancel_button': (By.CSS_SELECTOR, "button[class*='k-button']"),
         
-        # Messages
-        'evc_form_message_title': (By.CLASS_NAME, "notification-text notification-title"),
-        'evc_form_message_description': (By.CLASS_NAME, "notification-text notification-description"),
-        'validation_error': (By.CSS_SELECTOR, ".validation-error, [class*='error']"),
-
         # List installed EVC button
         'list_installed_evcs_button': (By.XPATH, "//button[contains(., 'List installed EVC') and not(@disabled)]"),
         # EVC table element for verification
         'evc_table_first_row_name': (By.XPATH,"//*[@id='mef-table-list-circuit']/tbody/tr/td[1]")
     }
 
-    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int):
-        self.driver = driver
-        self.base_url = base_url
-        self.api_base_url = api_url
-        self.wait = WebDriverWait(driver, default_timeout)
-        self.default_timeout = default_timeout
+    # Fields that must be usable for the form to be interactive
+    REQUIRED_FIELDS = ('circuit_name_input', 'endpoint_a_input', 'endpoint_z_input', 'vlan_a_input', 'vlan_z_input')
 
-    def _find(self, locator_name):
-        """Helper to find an element by locator name."""
-        by, value = self.SELECTORS[locator_name]
-        return self.wait.until(EC.presence_of_element_located((by, value)))
+    # Time of the last form submission, see find_circuit_via_api
+    submitted_at = None
 
+    @timed_phase('navigate')
     def navigate_to_evc_form(self):
         """Navigate from homepage to EVC creation form."""
         print("Navigating to EVC creation form...")
@@ -65,22 +90,16 @@ class EVCPage:
         time.sleep(3)
         
         # Click the MEF E-Line button to open the request circuit form
-        mef_button = self.wait.until(EC.element_to_be_clickable(self.SELECTORS['mef_eline_button']))
-        mef_button.click()
-        
-        # Wait for the form to appear
-        time.sleep(2)
-        
-        # Verify that form elements are now visible
-        form_elements = self.driver.find_elements(By.CSS_SELECTOR, "input[class='k-input'], textarea, select")
-        
-        if len(form_elements) > 0:
-            print(f"✅ Successfully opened MEF form with {len(form_elements)} form elements")
+        # and wait for its required fields to be usable instead of a fixed delay
+        interactive = self._open_napp('mef_eline_button', 'mef_eline')
+        if interactive is not None:
+            print(f"✅ Successfully opened MEF form, interactive after {interactive:.2f}s")
             return True
         else:
-            print("❌ No form elements found after clicking MEF button")
+            print("❌ Required fields not usable after clicking MEF button")
             return False
 
+    @timed_phase('fill')
     def fill_circuit_form(self, circuit_data):
         """Fill the EVC creation form with provided data."""
         
@@ -151,74 +170,125 @@ class EVCPage:
             except NoSuchElementException:
                 print("QoS queue field not found")
 
+    @timed_phase('submit', opens='submit_to_visible')
     def submit_form(self):
         """Submit the EVC creation form."""
         submit_button = self.driver.find_element(*self.SELECTORS['submit_button'])
+        self.submitted_at = time.time()
         submit_button.click()
         time.sleep(2)
 
-    def get_form_messages(self):
-        """Get success/error messages from the form."""
-        messages = {}
+    @staticmethod
+    def circuit_payload(circuit_data):
+        """mef_eline API payload of a circuit described like the form data."""
+        def uni(endpoint, vlan):
+            # A VLAN range is written as in the form, e.g. "[100, 200]"
+            vlan = json.loads(vlan) if str(vlan).startswith('[') else int(vlan)
+            value = [vlan] if isinstance(vlan, list) else vlan
+            return {'interface_id': endpoint, 'tag': {'tag_type': 'vlan', 'value': value}}
 
-        try:
-            success_element = self.driver.find_element(*self.SELECTORS['evc_form_message_title'])
-            messages['success'] = success_element.text
-        except NoSuchElementException:
-            messages['success'] = None
-        
-        try:
-            error_element = self.driver.find_element(*self.SELECTORS['error_message'])
-            messages['error'] = error_element.text
-            pass
-        except NoSuchElementException:
-            messages['error'] = None
-        
-        try:
-            validation_elements = self.driver.find_elements(*self.SELECTORS['validation_error'])
-            messages['validation_errors'] = [elem.text for elem in validation_elements]
-        except NoSuchElementException:
-            messages['validation_errors'] = []
-        
-        return messages
+        payload = {
+            'name': circuit_data['name'],
+            'dynamic_backup_path': True,
+            'uni_a': uni(circuit_data['endpoint_a'], circuit_data['vlan_a']),
+            'uni_z': uni(circuit_data['endpoint_z'], circuit_data['vlan_z']),
+        }
+        if circuit_data.get('service_level'):
+            payload['service_level'] = int(circuit_data['service_level'])
+        if circuit_data.get('max_paths'):
+            payload['max_paths'] = int(circuit_data['max_paths'])
+        return payload
 
+    def create_circuit_via_api(self, circuit_data):
+        """Create a circuit through the API, without the form. Returns its id or None."""
+        response = requests.post(self.api_base_url, json=self.circuit_payload(circuit_data),
+                                 timeout=self.default_timeout)
+        if response.status_code in [200, 201]:
+            circuit_id = response.json().get('circuit_id')
+            JOURNAL.created('evc', f"{self.api_base_url}{circuit_id}")
+            return circuit_id
+        print(f"Circuit creation refused: {response.status_code} {response.text}")
+        return None
+
+    def find_circuit_via_api(self, circuit_name):
+        """
+        Single API lookup of a circuit by name. Returns its id or None. After a
+        form submission, only a circuit created since then matches, and it is
+        recorded in the resource journal: an older circuit of the same name is
+        not the test's to delete.
+        """
+        response = requests.get(self.api_base_url, timeout=self.default_timeout)
+        if response.status_code == 200:
+            circuits = response.json()
+            since = None
+            if self.submitted_at is not None:
+                # mef_eline writes the creation time in UTC, to the second
+                since = datetime.fromtimestamp(int(self.submitted_at), tz=timezone.utc).strftime(CREATION_TIME_FORMAT)
+            for circuit_id, circuit_data in circuits.items():
+                if circuit_data.get('name') != circuit_name:
+                    continue
+                if since is None:
+                    return circuit_id
+                if str(circuit_data.get('creation_time', '')) >= since:
+                    JOURNAL.created('evc', f"{self.api_base_url}{circuit_id}")
+                    return circuit_id
+        return None
+
+    @timed_phase('verify', closes='submit_to_visible')
     def verify_circuit_via_api(self, circuit_name):
         """Verify circuit was created via API."""
         start_time = time.time()
         while time.time() - start_time < self.default_timeout:
             try:
-                response = requests.get(self.api_base_url)
-                if response.status_code == 200:
-                    circuits = response.json()
-                    for circuit_id, circuit_data in circuits.items():
-                        if circuit_data.get('name') == circuit_name:
-                            return circuit_id
+                circuit_id = self.find_circuit_via_api(circuit_name)
+                if circuit_id is not None:
+                    return circuit_id
                 time.sleep(2)
             except Exception as e:
                 print(f"API check error: {e}")
                 time.sleep(2)
         return None
 
+    @timed_phase('verify', closes='submit_to_visible')
+    def verify_circuits_via_api(self, circuit_names):
+        """Verify several circuits at once, sharing one timeout. Returns their ids in the same order."""
+        probes = [partial(self.find_circuit_via_api, name) for name in circuit_names]
+        return verify_concurrently(probes, self.default_timeout)
+
     def cleanup_test_circuit(self, circuit_name):
         """Clean up test circuit via API."""
         try:
-            response = requests.get(self.api_base_url)
+            response = requests.get(self.api_base_url, timeout=self.default_timeout)
             if response.status_code == 200:
                 circuits = response.json()
                 for circuit_id, circuit_data in circuits.items():
                     if circuit_data.get('name') == circuit_name:
-                        delete_response = requests.delete(f"{self.api_base_url}{circuit_id}")
+                        delete_response = requests.delete(f"{self.api_base_url}{circuit_id}", timeout=self.default_timeout)
                         if delete_response.status_code in [200, 204]:
+                            JOURNAL.deleted(f"{self.api_base_url}{circuit_id}")
                             print(f"Cleaned up circuit: {circuit_name}")
                         break
         except Exception as e:
             print(f"Cleanup error: {e}")
 
+    @timed_phase('list')
     def click_list_installed_evcs(self):
-        """Clicks the 'List installed EVC' button."""
+        """Clicks the 'List installed EVC' button and waits for the list, see wait_for_evc_rows."""
         list_button = self.driver.find_element(*self.SELECTORS['list_installed_evcs_button'])
         list_button.click()
-        time.sleep(3) # Wait for the list to load
+        return self.wait_for_evc_rows()
+
+    def wait_for_evc_rows(self, stable_ms=300):
+        """
+        Wait until the installed EVC table has rows and its row count is stable.
+        Returns the seconds to the first row and to the rendered list, and the row count.
+        """
+        result = self.driver.execute_async_script(
+            EVC_ROWS_SCRIPT, 'mef-table-list-circuit', self.default_timeout * 1000, stable_ms)
+        if result is None:
+            print("❌ Installed EVC list not rendered")
+            return None
+        return {'first_row': result['first_row'] / 1000, 'rendered': result['rendered'] / 1000, 'rows': result['rows']}
 
     def get_first_evc_name_from_table(self):
         """Gets the name of the first EVC in the installed EVC table."""
@@ -0,0 +1,170 @@
+import hashlib
+from pathlib import Path
+import requests
+
+UTILS_DIR = Path(__file__).parent
+
+# UI sections in which the NApps register their components
+UI_SECTIONS = ('k-toolbar', 'k-menu-bar', 'k-info-panel', 'k-action-menu')
+
+# NApps exercised by each test module, keyed by the NApp part of the module
+# name (test_[NApp]_[number]_description.py). A module missing from the map
+# is never skipped.
+TEST_NAPPS = {
+    'api': ['kytos/mef_eline', 'kytos/maintenance', 'amlight/sdntrace'],
+    'maintenance': ['kytos/maintenance'],
+    'mefeline': ['kytos/mef_eline'],
+    'pathfinder': ['kytos/pathfinder'],
+    'sdntrace': ['amlight/sdntrace', 'amlight/sdntrace_cp'],
+    'statusmenu': ['kytos/topology'],
+    'topology': ['kytos/topology'],
+}
+
+
+class NAppFingerprinter:
+    """
+    Fingerprints the NApps served by a running Kytos controller from their
+    UI components and their version.
+    """
+
+    def __init__(self, base_url, timeout):
+        self.core_url = f"{base_url.rstrip('/')}/api/kytos/core"
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._components = None
+        self._fingerprints = {}
+
+    def _get(self, path):
+        response = self.session.get(f"{self.core_url}/{path}", timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def components(self):
+        """UI component urls served by the controller, grouped by NApp."""
+        if self._components is None:
+            self._components = {}
+            for section in UI_SECTIONS:
+                try:
+                    entries = self._get(f"ui/{section}/").json()
+                except (requests.RequestException, ValueError) as e:
+                    print(f"Error listing UI components of {section}: {e}")
+                    continue
+                for entry in entries:
+                    # e.g. ui/kytos/mef_eline/k-toolbar/main.kytos
+                    parts = entry['url'].split('/')
+                    self._components.setdefault(f"{parts[1]}/{parts[2]}", []).append(entry['url'])
+        return self._components
+
+    def version(self, napp):
+        try:
+            return self._get(f"napps/{napp}/metadata/version").json().get('version')
+        except (requests.RequestException, ValueError):
+            return None
+
+    def fingerprint(self, napp):
+        """Hash of the NApp version and the content of every UI component it serves."""
+        if napp not in self._fingerprints:
+            digest = hashlib.sha256(f"{napp}@{self.version(napp)}".encode())
+            for url in sorted(self.components().get(napp, [])):
+                try:
+                    content = self._get(url).content
+                except requests.RequestException:
+                    content = b''
+                digest.update(url.encode())
+                digest.update(hashlib.sha256(content).digest())
+            self._fingerprints[napp] = digest.hexdigest()
+        return self._fingerprints[napp]
+
+
+def module_code_hash(module, extra_files=()):
+    """
+    Hash of a test module and of every module of tests/utils: the page objects
+    import helpers of their own (timing, readiness, verification...), so any
+    of them may change what the test does.
+    """
+    files = {Path(module.__file__), *UTILS_DIR.glob('*.py')} | {Path(path) for path in extra_files}
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class IncrementalRun:
+    """
+    Skips the test modules whose NApp fingerprint and test code are unchanged
+    since their last green run. The keys of the green runs live in the pytest
+    cache, under kytos/incremental/.
+
+    A module is green when every item collected from it ran and passed (or
+    xfailed): a run restricted by -k, -m, a node id or deselection does not
+    make it green. Under xdist, each worker exports its keys and collected
+    items and the outcomes of the tests it ran (export), and the controller
+    merges them (merge) and saves.
+    """
+
+    CACHE_PREFIX = 'kytos/incremental/'
+
+    def __init__(self, cache, fingerprinter):
+        self.cache = cache
+        self.fingerprinter = fingerprinter
+        self.keys = {}
+        self.expected = {}
+        self.partial = set()
+        self.failed = set()
+        self.passed = set()
+
+    def module_key(self, napp, module, extra_files=()):
+        """Key of a module's NApps and code, None when its NApps are unknown."""
+        if napp not in TEST_NAPPS:
+            return None
+        fingerprints = [self.fingerprinter.fingerprint(name) for name in TEST_NAPPS[napp]]
+        digest = hashlib.sha256(module_code_hash(module, extra_files).encode())
+        for fingerprint in fingerprints:
+            digest.update(fingerprint.encode())
+        return digest.hexdigest()
+
+    def is_unchanged(self, module_id, key):
+        """Remember the key of a module and tell whether it matches its last green run."""
+        if key is None:
+            return False
+        self.keys[module_id] = key
+        return self.cache.get(self.CACHE_PREFIX + module_id, None) == key
+
+    def expect(self, nodeid, complete=True):
+        """Remember a collected item; complete=False when its module was not collected in full."""
+        module_id = nodeid.split('::')[0]
+        self.expected.setdefault(module_id, set()).add(nodeid)
+        if not complete:
+            self.partial.add(module_id)
+
+    def record(self, report):
+        if report.failed:
+            self.failed.add(report.nodeid)
+        elif report.when == 'call' and (report.passed or hasattr(report, 'wasxfail')):
+            self.passed.add(report.nodeid)
+
+    def export(self):
+        """Keys, collected items and outcomes of a worker, for the controller to merge."""
+        return {'keys': self.keys, 'partial': sorted(self.partial),
+                'expected': {module_id: sorted(nodeids) for module_id, nodeids in self.expected.items()},
+                'passed': sorted(self.passed), 'failed': sorted(self.failed)}
+
+    def merge(self, exported):
+        self.keys.update(exported['keys'])
+        for module_id, nodeids in exported['expected'].items():
+            self.expected.setdefault(module_id, set()).update(nodeids)
+        self.partial.update(exported['partial'])
+        self.passed.update(exported['passed'])
+        self.failed.update(exported['failed'])
+
+    def is_green(self, module_id):
+        nodeids = self.expected.get(module_id)
+        return (bool(nodeids) and module_id not in self.partial
+                and nodeids <= self.passed and not nodeids & self.failed)
+
+    def save(self):
+        """Store the key of every module that ran green in this session."""
+        for module_id, key in self.keys.items():
+            if self.is_green(module_id):
+                self.cache.set(self.CACHE_PREFIX + module_id, key)
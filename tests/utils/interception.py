@@ -0,0 +1,174 @@
+import json
+import base64
+import fnmatch
+import threading
+from tests.utils.scenarios import SCENARIOS_DIR, load_scenarios
+
+try:
+    import trio
+except ImportError:
+    trio = None
+
+
+def generate_switches(size):
+    switches = {}
+    for i in range(size):
+        dpid = f"00:00:00:00:00:00:{i // 256:02x}:{i % 256:02x}"
+        switches[dpid] = {
+            'id': dpid, 'dpid': dpid, 'name': dpid, 'enabled': True, 'active': True, 'status': 'UP',
+            'connection': f"127.0.0.1:{40000 + i}", 'metadata': {'name': f"SW{i:05d}"},
+        }
+    return {'switches': switches}
+
+
+def generate_interfaces(size):
+    interfaces = {}
+    for i in range(size):
+        dpid = f"00:00:00:00:00:00:{i // 2560:02x}:{i // 10 % 256:02x}"
+        port = i % 10 + 1
+        interface_id = f"{dpid}:{port}"
+        interfaces[interface_id] = {
+            'id': interface_id, 'name': f"eth{port}", 'port_number': port, 'switch': dpid,
+            'enabled': True, 'active': True, 'status': 'UP', 'speed': 1250000000.0, 'metadata': {},
+        }
+    return {'interfaces': interfaces}
+
+
+def generate_links(size):
+    links = {}
+    for i in range(size):
+        link_id = f"{i:064x}"
+        links[link_id] = {
+            'id': link_id, 'enabled': True, 'active': True, 'status': 'UP', 'metadata': {},
+            'endpoint_a': {'id': f"00:00:00:00:00:00:00:{i % 256:02x}:1"},
+            'endpoint_b': {'id': f"00:00:00:00:00:00:00:{(i + 1) % 256:02x}:2"},
+        }
+    return {'links': links}
+
+
+def generate_evcs(size):
+    evcs = {}
+    for i in range(size):
+        evc_id = f"{i:014x}"
+        evcs[evc_id] = {
+            'id': evc_id, 'name': f"Intercepted_EVC_{i:05d}", 'enabled': True, 'active': True,
+            'uni_a': {'interface_id': "00:00:00:00:00:00:00:01:1", 'tag': {'tag_type': 'vlan', 'value': 100 + i % 3900}},
+            'uni_z': {'interface_id': "00:00:00:00:00:00:00:02:1", 'tag': {'tag_type': 'vlan', 'value': 100 + i % 3900}},
+            'current_path': [], 'primary_path': [], 'backup_path': [], 'dynamic_backup_path': True,
+            'creation_time': "2024-01-01T00:00:00", 'service_level': 0, 'sb_priority': None,
+        }
+    return evcs
+
+
+# Fixtures that can be generated at any size
+GENERATORS = {
+    'switches': generate_switches,
+    'interfaces': generate_interfaces,
+    'links': generate_links,
+    'evcs': generate_evcs,
+}
+
+
+class Route:
+    """An API route served from a fixture: a generated payload or a JSON file of the scenarios directory."""
+
+    def __init__(self, url, fixture=None, size=0, file=None, delay_ms=0, status=200, method='GET'):
+        self.url = url
+        self.method = method
+        self.delay = delay_ms / 1000
+        self.status = status
+        if file:
+            self.payload = json.loads((SCENARIOS_DIR / file).read_text())
+        else:
+            self.payload = GENERATORS[fixture](size)
+        self.body = base64.b64encode(json.dumps(self.payload).encode()).decode()
+
+    def matches(self, url, method='GET'):
+        return method == self.method and fnmatch.fnmatchcase(url, self.url)
+
+
+class ApiInterceptor:
+    """
+    Serves chosen API routes to the browser through DevTools Fetch, with the
+    sizes and delays of an interception profile, so the UI can be timed with
+    the backend held constant. Requests that do not match a route go to the
+    controller.
+
+    The profiles are defined in tests/scenarios/interception.yaml. Fetch
+    events are handled by a CDP connection running in its own thread.
+    """
+
+    def __init__(self, profile, routes):
+        self.profile = profile
+        self.routes = routes
+        self._thread = None
+        self._token = None
+        self._cancel_scope = None
+        self._ready = threading.Event()
+
+    @classmethod
+    def from_profile(cls, profile):
+        if trio is None:
+            raise ImportError("trio is required to intercept the API requests of the browser")
+        return cls(profile, [Route(**route) for route in load_scenarios('interception')[profile]])
+
+    def route_for(self, url, method='GET'):
+        return next((route for route in self.routes if route.matches(url, method)), None)
+
+    def payload_for(self, url):
+        """Payload served for a GET of url, None if it is not intercepted."""
+        route = self.route_for(url)
+        return route.payload if route else None
+
+    def attach(self, driver):
+        """Start intercepting the requests of a freshly started browser."""
+        self.detach()
+        self._ready.clear()
+        self._thread = threading.Thread(target=trio.run, args=(self._serve, driver), daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=10):
+            print("DevTools interception did not start in time")
+
+    def detach(self):
+        if self._thread is None:
+            return
+        if self._token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._token)
+            except (RuntimeError, trio.RunFinishedError):
+                pass
+        self._thread.join(timeout=5)
+        self._thread = self._token = self._cancel_scope = None
+
+    async def _serve(self, driver):
+        try:
+            with trio.CancelScope() as self._cancel_scope:
+                self._token = trio.lowlevel.current_trio_token()
+                async with driver.bidi_connection() as connection:
+                    session, fetch = connection.session, connection.devtools.fetch
+                    patterns = [fetch.RequestPattern(url_pattern=route.url, request_stage=fetch.RequestStage.REQUEST)
+                                for route in self.routes]
+                    await session.execute(fetch.enable(patterns=patterns))
+                    events = session.listen(fetch.RequestPaused, buffer_size=100)
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in events:
+                            nursery.start_soon(self._respond, session, fetch, event)
+        except Exception as e:
+            print(f"DevTools interception stopped: {e}")
+        finally:
+            self._ready.set()
+
+    async def _respond(self, session, fetch, event):
+        route = self.route_for(event.request.url, event.request.method)
+        if route is None:
+            await session.execute(fetch.continue_request(request_id=event.request_id))
+            return
+        if route.delay:
+            await trio.sleep(route.delay)
+        await session.execute(fetch.fulfill_request(
+            request_id=event.request_id,
+            response_code=route.status,
+            response_headers=[fetch.HeaderEntry(name='Content-Type', value='application/json')],
+            body=route.body,
+        ))
@@ -0,0 +1,224 @@
+"""
+Rendering of the installed EVC list with a large inventory.
+
+For each size, N disabled EVCs are seeded through the mef_eline API with
+concurrent requests (no flows are installed), the list is opened in a fresh
+browser and timed, and the EVCs are deleted again:
+
+    python -m tests.utils.inventory run [--sizes 100,1000,10000] [--workers 16] [--output PATH]
+
+It reports the seeding and teardown times, the time to the first row and to
+the rendered list, the frame time of scrolling through it, the time to apply
+a name filter and the browser memory before and after opening the list.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from tests.utils.bench import CircuitClient, seconds
+from tests.utils.browser import start_chrome_driver
+from tests.utils.evc_page import EVCPage
+from tests.utils.journal import JOURNAL
+from tests.utils.memory import MB, sample_memory
+from tests.utils.topology import TopologySnapshot
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent.parent / '.env')
+except ImportError:
+    pass
+
+NAME_PREFIX = 'Inventory'
+
+# Tags of the seeded UNIs: A sides and Z sides use separate ranges, so an
+# interface can be the A side of one EVC and the Z side of another one.
+VLAN_A_BASE = 100
+VLAN_Z_BASE = 2100
+VLANS_PER_INTERFACE = 1994
+
+TABLE_ID = 'mef-table-list-circuit'
+
+# Scroll the list page by page, timing the frame that follows each scroll
+SCROLL_SCRIPT = """
+const [tableId, steps, done] = arguments;
+const table = document.getElementById(tableId);
+if (!table) return done(null);
+let box = table.parentElement;
+while (box && box.scrollHeight <= box.clientHeight) box = box.parentElement;
+box = box || document.scrollingElement;
+const frames = [];
+const step = i => {
+    if (i >= steps || box.scrollTop + box.clientHeight >= box.scrollHeight) {
+        const total = frames.reduce((sum, frame) => sum + frame, 0);
+        return done({pages: frames.length, mean: frames.length ? total / frames.length : null,
+                     max: frames.length ? Math.max(...frames) : null});
+    }
+    const start = performance.now();
+    box.scrollTop += box.clientHeight;
+    requestAnimationFrame(() => requestAnimationFrame(() => {
+        frames.push(performance.now() - start);
+        step(i + 1);
+    }));
+};
+step(0);
+"""
+
+# Type a value in the first filter input of the list and wait for the table to
+# re-render: elapsed runs to its last DOM mutation, once no mutation came for
+# quietMs after the next frame. null elapsed when the table never re-rendered.
+FILTER_SCRIPT = """
+const [tableId, value, timeoutMs, quietMs, done] = arguments;
+const table = document.getElementById(tableId);
+const input = table && table.querySelector('thead input');
+if (!input) return done(null);
+const rows = () => table.querySelectorAll('tbody tr').length;
+const start = performance.now();
+let changedAt = null, settleFrom = null;
+const observer = new MutationObserver(() => { changedAt = performance.now(); });
+const body = table.querySelector('tbody') || table;
+observer.observe(body, {subtree: true, childList: true, characterData: true});
+input.value = value;
+for (const type of ['input', 'keyup', 'change']) {
+    input.dispatchEvent(new Event(type, {bubbles: true}));
+}
+const tick = () => {
+    const now = performance.now();
+    const quietSince = changedAt === null ? settleFrom : Math.max(settleFrom, changedAt);
+    if (now - quietSince >= quietMs || now - start > timeoutMs) {
+        observer.disconnect();
+        done({elapsed: changedAt === null ? null : changedAt - start, rows: rows()});
+    } else {
+        setTimeout(tick, 16);
+    }
+};
+requestAnimationFrame(() => {
+    settleFrom = performance.now();
+    tick();
+});
+"""
+
+# Quiet period ending the filter re-render, long enough for a debounced filter
+FILTER_QUIET_MS = 300
+
+
+def circuit_payloads(size, interface_ids):
+    """mef_eline payloads of size disabled circuits spread over the interfaces."""
+    if size > len(interface_ids) * VLANS_PER_INTERFACE:
+        raise ValueError(f"{len(interface_ids)} interfaces cannot hold {size} circuits")
+    count = len(interface_ids)
+    payloads = []
+    for i in range(size):
+        offset = i // count
+        payloads.append({
+            'name': f"{NAME_PREFIX}_{size}_{i:05d}",
+            'enabled': False,
+            'uni_a': {'interface_id': interface_ids[i % count],
+                      'tag': {'tag_type': 'vlan', 'value': VLAN_A_BASE + offset}},
+            'uni_z': {'interface_id': interface_ids[(i + 1) % count],
+                      'tag': {'tag_type': 'vlan', 'value': VLAN_Z_BASE + offset}},
+        })
+    return payloads
+
+
+def measure_list(config, size):
+    """Open the installed EVC list in a fresh browser and time it."""
+    driver = start_chrome_driver(config.timeout)
+    try:
+        evc_page = EVCPage(driver, config.base_url, config.api_url, config.timeout)
+        evc_page.navigate_to_evc_form()
+        memory_before = sample_memory(driver)
+        listed = evc_page.click_list_installed_evcs()
+        scroll = driver.execute_async_script(SCROLL_SCRIPT, TABLE_ID, config.scroll_pages)
+        filtered = driver.execute_async_script(
+            FILTER_SCRIPT, TABLE_ID, f"{NAME_PREFIX}_{size}_{size - 1:05d}", config.timeout * 1000, FILTER_QUIET_MS)
+        memory_after = sample_memory(driver)
+    finally:
+        driver.quit()
+    return {'list': listed, 'scroll': scroll, 'filter': filtered,
+            'memory_before': memory_before, 'memory_after': memory_after}
+
+
+def run_size(config, client, interface_ids, size):
+    start = time.perf_counter()
+    created, _ = client.run(client.create, circuit_payloads(size, interface_ids))
+    circuit_ids = [outcome['id'] for outcome in created if outcome['id']]
+    result = {'size': size, 'seeded': len(circuit_ids), 'seed_time': time.perf_counter() - start}
+    try:
+        result.update(measure_list(config, size))
+    finally:
+        start = time.perf_counter()
+        deleted, _ = client.run(client.delete, circuit_ids)
+        result['deleted'] = sum(outcome['error'] is None for outcome in deleted)
+        result['teardown_time'] = time.perf_counter() - start
+    return result
+
+
+def _mb(value):
+    return f"{value / MB:.0f}MB" if value is not None else "n/a"
+
+
+def report_lines(results):
+    lines = []
+    for result in results:
+        listed = result.get('list') or {}
+        scroll = result.get('scroll') or {}
+        filtered = result.get('filter') or {}
+        before, after = result.get('memory_before') or {}, result.get('memory_after') or {}
+        lines.append(
+            f"{result['size']:>6} EVCs: seeded {result['seeded']} in {result['seed_time']:.1f}s, "
+            f"deleted {result['deleted']} in {result['teardown_time']:.1f}s"
+        )
+        lines.append(
+            f"        first row {seconds(listed.get('first_row'))}, rendered {seconds(listed.get('rendered'))} "
+            f"({listed.get('rows', 0)} rows), scroll frame mean "
+            f"{scroll.get('mean') or 0:.0f}ms max {scroll.get('max') or 0:.0f}ms, filter "
+            f"{seconds(filtered['elapsed'] / 1000) if filtered and filtered['elapsed'] is not None else 'n/a'}"
+        )
+        lines.append(
+            f"        JS heap {_mb(before.get('js_heap'))} -> {_mb(after.get('js_heap'))}, "
+            f"DOM nodes {before.get('dom_nodes')} -> {after.get('dom_nodes')}, "
+            f"Chrome RSS {_mb(before.get('chrome_rss'))} -> {_mb(after.get('chrome_rss'))}"
+        )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Installed EVC list with a large inventory")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run = subparsers.add_parser('run', help="seed, time and delete each inventory size")
+    run.add_argument('--sizes', default='100,1000,10000', help="comma separated numbers of EVCs")
+    run.add_argument('--workers', type=int, default=16, help="concurrent API requests while seeding and deleting")
+    run.add_argument('--scroll-pages', type=int, default=20, help="pages scrolled through the list")
+    run.add_argument('--output', help="write the results as JSON")
+    subparsers.add_parser('cleanup', help="delete the EVCs left by an interrupted run")
+    args = parser.parse_args(argv)
+    JOURNAL.open_from_env()
+
+    config = argparse.Namespace(
+        base_url=os.getenv('BASE_URL', 'http://localhost:18181'),
+        api_url=os.getenv('API_MEFELINE_URL', 'http://localhost:18181/api/kytos/mef_eline/v2/evc/'),
+        timeout=int(os.getenv('DEFAULT_TIMEOUT', '10')),
+        scroll_pages=getattr(args, 'scroll_pages', 20),
+    )
+    client = CircuitClient(config.api_url, config.timeout, getattr(args, 'workers', 16))
+
+    if args.command == 'cleanup':
+        leftovers = client.leftovers(f"{NAME_PREFIX}_")
+        deleted, _ = client.run(client.delete, leftovers)
+        print(f"Deleted {sum(outcome['error'] is None for outcome in deleted)} of {len(leftovers)} leftover EVCs")
+        return 0
+
+    interface_ids = sorted(TopologySnapshot.from_env(config.timeout).entries('interfaces'))
+    results = [run_size(config, client, interface_ids, int(size)) for size in args.sizes.split(',')]
+    for line in report_lines(results):
+        print(line)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+import requests
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _pid_alive(pid):
+    """Whether a process of this host is still running."""
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name != 'posix':
+        # No safe way to probe a process, take it as alive and keep its entries
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ResourceJournal:
+    """
+    Append-only journal of the resources the tests create on the controller
+    (EVCs, maintenance windows), one JSON line per creation or deletion.
+
+    Every line is flushed and synced to disk as soon as the id is known, so a
+    killed run still leaves the ids of what it created. At the next session
+    start, the resources created but never deleted are deleted concurrently
+    by id, with no scan of the controller lists. Disabled until open() is
+    called with a path.
+
+    Several processes (xdist workers, benchmarks) may share the journal: the
+    appends and the compaction take an exclusive lock on a side file, and the
+    entries of a process that is still running are never cleaned up.
+    """
+
+    def __init__(self):
+        self.path = None
+        self._live = set()
+        self._lock = threading.Lock()
+
+    def open(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def open_from_env(self):
+        """Open RESOURCE_JOURNAL_PATH, unless RESOURCE_JOURNAL=false. Returns whether the journal is open."""
+        if os.getenv('RESOURCE_JOURNAL', 'true').lower() == 'false':
+            return False
+        self.open(os.getenv('RESOURCE_JOURNAL_PATH', 'reports/resource_journal.jsonl'))
+        return True
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive access to the journal, across the threads and the processes sharing it."""
+        with self._lock, open(self.path.with_suffix('.lock'), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _append(self, entry):
+        with self._locked(), open(self.path, 'a') as file:
+            file.write(json.dumps(entry) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+    def created(self, kind, url):
+        """Record a resource created by a test; url is the one deleting it."""
+        if self.path is None or url in self._live:
+            return
+        self._live.add(url)
+        self._append({'op': 'created', 'kind': kind, 'url': url, 'time': time.time(), 'pid': os.getpid()})
+
+    def deleted(self, url):
+        if self.path is None:
+            return
+        self._live.discard(url)
+        self._append({'op': 'deleted', 'url': url, 'time': time.time()})
+
+    def _read(self):
+        if not self.path.exists():
+            return []
+        entries = {}
+        for line in self.path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # The last line of a killed run may be cut
+                continue
+            if entry['op'] == 'created':
+                entries[entry['url']] = entry
+            else:
+                entries.pop(entry['url'], None)
+        return list(entries.values())
+
+    def pending(self):
+        """Entries of the resources created and not deleted yet, oldest first."""
+        if self.path is None:
+            return []
+        with self._locked():
+            return self._read()
+
+    def compact(self, gone=()):
+        """Rewrite the journal with the pending entries only, dropping the urls in gone."""
+        if self.path is None:
+            return
+        gone = set(gone)
+        with self._locked():
+            pending = [entry for entry in self._read() if entry['url'] not in gone]
+            temporary = self.path.with_suffix('.tmp')
+            temporary.write_text(''.join(json.dumps(entry) + '\n' for entry in pending))
+            os.replace(temporary, self.path)
+
+    @staticmethod
+    def _delete(entry, timeout):
+        try:
+            response = requests.delete(entry['url'], timeout=timeout)
+            # 404: already deleted by hand or by the controller
+            return response.status_code in [200, 204, 404]
+        except requests.RequestException as e:
+            print(f"Cleanup error for {entry['url']}: {e}")
+            return False
+
+    def cleanup(self, timeout=10, workers=8):
+        """
+        Delete the resources left by previous runs. Returns (deleted, pending, in_use):
+        the entries that are gone, the ones still on the controller and the ones
+        of processes still running, which are left alone.
+        """
+        entries = self.pending()
+        in_use = [entry for entry in entries if entry.get('pid') and _pid_alive(entry['pid'])]
+        orphans = [entry for entry in entries if entry not in in_use]
+        if not orphans:
+            return [], [], in_use
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda entry: self._delete(entry, timeout), orphans))
+        deleted = [entry for entry, ok in zip(orphans, results) if ok]
+        self.compact(entry['url'] for entry in deleted)
+        return deleted, [entry for entry, ok in zip(orphans, results) if not ok], in_use
+
+
+JOURNAL = ResourceJournal()
@@ -1,13 +1,16 @@
 import time
 import requests
 from datetime import datetime, timezone
+from functools import partial
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import NoSuchElementException
+from tests.utils.verification import verify_concurrently
+from tests.utils.timing import timed_phase
+from tests.utils.base_page import BasePage
+from tests.utils.journal import JOURNAL
 
-class MaintenancePage:
+class MaintenancePage(BasePage):
     """
     Page Object Model for maintenance page in Kytos UI.
     Encapsulates all UI interactions and locators.
@@ -34,21 +37,13 @@ class MaintenancePage:
         'reset_button': (By.XPATH, "//button[contains(., 'Reset') and not(@disabled)]"),
         'list_windows_button': (By.XPATH, "//button[contains(., 'List Maintenance Windows') and not(@disabled)]"),
         
-        # Messages
-        'form_message_title': (By.CLASS_NAME, "notification-text notification-title"),
-        'form_message_description': (By.CLASS_NAME, "notification-text notification-description"),
-        'validation_error': (By.CSS_SELECTOR, ".validation-error, [class*='error']"),
-        
         'list_windows_button': (By.XPATH, "//button[contains(., 'List Maintenance Windows') and not(@disabled)]")
     }
 
-    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int):
-        self.driver = driver
-        self.base_url = base_url
-        self.api_base_url = api_url
-        self.wait = WebDriverWait(driver, default_timeout)
-        self.default_timeout = default_timeout
+    # Fields that must be usable for the form to be interactive
+    REQUIRED_FIELDS = ('start_time', 'end_time')
 
+    @timed_phase('navigate')
     def navigate_to_maintenance_tab(self):
         """Navigate from homepage to Create Maintenance Windows form."""
         print("Navigating to Create Maintenance Windows form...")
@@ -58,22 +53,16 @@ class MaintenancePage:
         time.sleep(3)
         
         # Click the Maintenance button to open the request form
-        maintenance_button = self.wait.until(EC.element_to_be_clickable(self.SELECTORS['maintenance_button']))
-        maintenance_button.click()
-        
-        # Wait for the form to appear
-        time.sleep(2)
-        
-        # Verify that form elements are now visible
-        form_elements = self.driver.find_elements(By.CSS_SELECTOR, "input[class='k-input'], textarea, select")
-        
-        if len(form_elements) > 0:
-            print(f"✅ Successfully opened Maintenance form with {len(form_elements)} form elements")
+        # and wait for its required fields to be usable instead of a fixed delay
+        interactive = self._open_napp('maintenance_button', 'maintenance')
+        if interactive is not None:
+            print(f"✅ Successfully opened Maintenance form, interactive after {interactive:.2f}s")
             return True
         else:
-            print("❌ No form elements found after clicking Maintenance button")
+            print("❌ Required fields not usable after clicking Maintenance button")
             return False
 
+    @timed_phase('fill')
     def fill_maintenance_form(self, data):
         """Fill the maintenance form with provided data."""
 
@@ -105,6 +94,7 @@ class MaintenancePage:
         force_checkbox = self.driver.find_element(*self.SELECTORS['force'])
         force_checkbox.click()
         
+    @timed_phase('submit', opens='submit_to_visible')
     def submit_form(self):
         """Submit the window creation form."""
         submit_button = self.driver.find_element(*self.SELECTORS['submit_button'])
@@ -117,66 +107,79 @@ class MaintenancePage:
         submit_button.click()
         time.sleep(2)
 
-    def get_form_messages(self):
-        """Get success/error messages from the form."""
-        messages = {}
+    def create_window_via_api(self, data, switch_ids):
+        """
+        Create a window through the API, without the form. The API takes dpids,
+        switch_ids maps the switch names of the form data to them. Returns its id or None.
+        """
+        payload = {
+            'description': data.get('description', ''),
+            'start': data['start_time'],
+            'end': data['end_time'],
+            'switches': [switch_ids[name] for name in data.get('switches', [])],
+            'interfaces': data.get('interfaces', []),
+            'links': data.get('links', []),
+        }
+        response = requests.post(self.api_base_url, json=payload, timeout=self.default_timeout)
+        if response.status_code in [200, 201]:
+            window_id = response.json().get('mw_id')
+            JOURNAL.created('maintenance', f"{self.api_base_url}{window_id}")
+            return window_id
+        print(f"Window creation refused: {response.status_code} {response.text}")
+        return None
 
-        try:
-            success_element = self.driver.find_element(*self.SELECTORS['form_message_title'])
-            messages['success'] = success_element.text
-        except NoSuchElementException:
-            messages['success'] = None
-        
-        try:
-            error_element = self.driver.find_element(*self.SELECTORS['form_message_description'])
-            messages['error'] = error_element.text
-            pass
-        except NoSuchElementException:
-            messages['error'] = None
-        
-        try:
-            validation_elements = self.driver.find_elements(*self.SELECTORS['validation_error'])
-            messages['validation_errors'] = [elem.text for elem in validation_elements]
-        except NoSuchElementException:
-            messages['validation_errors'] = []
-        
-        return messages
-    
+    def find_window_via_api(self, data, inserted_time):
+        """Single API lookup of a window created after inserted_time. Returns its id or None."""
+        response = requests.get(self.api_base_url, timeout=self.default_timeout)
+        if response.status_code == 200:
+            windows = response.json()
+            dt2 = datetime.fromtimestamp(inserted_time, tz=timezone.utc)
+            dt2 = dt2.strftime("%Y-%m-%dT%H:%M:%S%z")
+            for window in windows:
+                if window.get('inserted_at') > dt2 \
+                    and window.get('description') == data['description'] \
+                    and window.get('start') == data['start_time'] \
+                        and window.get('end') == data['end_time']:
+                    JOURNAL.created('maintenance', f"{self.api_base_url}{window.get('id')}")
+                    return window.get('id')
+        return None
+
+    @timed_phase('verify', closes='submit_to_visible')
     def verify_windows_via_api(self, data, inserted_time):
         """Verify windows was created via API."""
         start_time = time.time()
         while time.time() - start_time < self.default_timeout:
             try:
-                response = requests.get(self.api_base_url)
-                if response.status_code == 200:
-                    windows = response.json()
-                    for window in windows: 
-                        dt2 = datetime.fromtimestamp(inserted_time, tz=timezone.utc)
-                        dt2 = dt2.strftime("%Y-%m-%dT%H:%M:%S%z")
-                        if window.get('inserted_at') > dt2 \
-                            and window.get('description') == data['description'] \
-                            and window.get('start') == data['start_time'] \
-                                and window.get('end') == data['end_time']:
-                            return window.get('id')
+                window_id = self.find_window_via_api(data, inserted_time)
+                if window_id is not None:
+                    return window_id
                 time.sleep(2)
             except Exception as e:
                 print(f"API check error: {e}")
                 time.sleep(2)
         return None
 
-    def cleanup_test_windows(self):
-        """Clean up test window via API."""
-        try:
-            response = requests.get(self.api_base_url)
-            if response.status_code == 200:
-                windows = response.json()
-                for window in windows:
-                    delete_response = requests.delete(f"{self.api_base_url}{window.get('id')}")
-                    if delete_response.status_code == 200:
-                        print(f"Cleaned up window: {window.get('id')}")
-        except Exception as e:
-            print(f"Cleanup error: {e}")
+    @timed_phase('verify', closes='submit_to_visible')
+    def verify_all_windows_via_api(self, submitted):
+        """
+        Verify several windows at once, sharing one timeout.
+        submitted is a list of (data, inserted_time); returns the window ids in the same order.
+        """
+        probes = [partial(self.find_window_via_api, data, inserted_time) for data, inserted_time in submitted]
+        return verify_concurrently(probes, self.default_timeout)
+
+    def cleanup_windows(self, window_ids):
+        """Delete the given windows via API."""
+        for window_id in window_ids:
+            try:
+                delete_response = requests.delete(f"{self.api_base_url}{window_id}", timeout=self.default_timeout)
+                if delete_response.status_code == 200:
+                    JOURNAL.deleted(f"{self.api_base_url}{window_id}")
+                    print(f"Cleaned up window: {window_id}")
+            except Exception as e:
+                print(f"Cleanup error: {e}")
 
+    @timed_phase('list')
     def click_list_windows(self):
         """Clicks the 'List Maintenance Windows' button."""
         list_button = self.driver.find_element(*self.SELECTORS['list_windows_button'])
@@ -0,0 +1,128 @@
+import os
+import json
+from collections import defaultdict
+from pathlib import Path
+from selenium.common.exceptions import WebDriverException
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+MB = 1024 * 1024
+
+MEMORY_SCRIPT = """
+const memory = performance.memory || {};
+return {
+    js_heap: memory.usedJSHeapSize || null,
+    dom_nodes: document.getElementsByTagName('*').length
+};
+"""
+
+METRICS = ('js_heap', 'dom_nodes', 'chrome_rss')
+
+
+def napp_from_module(module_name):
+    """Get the NApp name from a test module, e.g. test_maintenance_001_windows_creation -> maintenance."""
+    parts = module_name.rsplit('.', 1)[-1].split('_')
+    return parts[1] if len(parts) > 1 else parts[0]
+
+
+def _chrome_rss(driver):
+    """Sum the RSS of every process started by chromedriver (browser, renderers, GPU...)."""
+    if psutil is None:
+        return None
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is None:
+        return None
+    try:
+        children = psutil.Process(process.pid).children(recursive=True)
+        return sum(child.memory_info().rss for child in children)
+    except psutil.Error:
+        return None
+
+
+def sample_memory(driver):
+    """Sample JS heap, DOM node count and Chrome RSS from the running browser."""
+    try:
+        sample = driver.execute_script(MEMORY_SCRIPT) or {}
+    except WebDriverException as e:
+        print(f"Memory sampling error: {e}")
+        sample = {}
+    return {
+        'js_heap': sample.get('js_heap'),
+        'dom_nodes': sample.get('dom_nodes'),
+        'chrome_rss': _chrome_rss(driver),
+    }
+
+
+def _env_limit(name, scale=1):
+    value = os.getenv(name)
+    return int(float(value) * scale) if value else None
+
+
+class MemoryTracker:
+    """
+    Collects per-test browser memory samples and decides when the driver
+    should be recycled.
+    """
+
+    def __init__(self, heap_limit=None, rss_limit=None, dom_limit=None):
+        self.limits = {'js_heap': heap_limit, 'chrome_rss': rss_limit, 'dom_nodes': dom_limit}
+        self.samples = []
+        self.recycles = []
+
+    @classmethod
+    def from_env(cls):
+        """Build a tracker with the DRIVER_RECYCLE_* thresholds from the environment."""
+        return cls(
+            heap_limit=_env_limit('DRIVER_RECYCLE_HEAP_MB', MB),
+            rss_limit=_env_limit('DRIVER_RECYCLE_RSS_MB', MB),
+            dom_limit=_env_limit('DRIVER_RECYCLE_DOM_NODES'),
+        )
+
+    def record(self, nodeid, napp, before, after):
+        """Store the samples taken around one test."""
+        self.samples.append({'nodeid': nodeid, 'napp': napp, 'before': before, 'after': after})
+
+    def should_recycle(self, sample):
+        """Return the reason to recycle the driver, or None if every metric is under its limit."""
+        for metric, limit in self.limits.items():
+            value = sample.get(metric)
+            if limit and value is not None and value > limit:
+                return f"{metric}={value} exceeds limit {limit}"
+        return None
+
+    def napp_growth(self):
+        """Sum the growth of each metric over the tests of every NApp."""
+        growth = defaultdict(lambda: {'tests': 0, **{metric: 0 for metric in METRICS}})
+        for sample in self.samples:
+            napp = growth[sample['napp']]
+            napp['tests'] += 1
+            for metric in METRICS:
+                before, after = sample['before'].get(metric), sample['after'].get(metric)
+                if before is not None and after is not None:
+                    napp[metric] += after - before
+        return dict(growth)
+
+    def report_lines(self):
+        """Human readable per-NApp growth, biggest JS heap growth first."""
+        lines = []
+        growth = sorted(self.napp_growth().items(), key=lambda item: item[1]['js_heap'], reverse=True)
+        for napp, data in growth:
+            lines.append(
+                f"{napp:<12} tests={data['tests']:<3} "
+                f"js_heap={data['js_heap'] / MB:+.1f}MB "
+                f"dom_nodes={data['dom_nodes']:+d} "
+                f"chrome_rss={data['chrome_rss'] / MB:+.1f}MB"
+            )
+        for nodeid, reason in self.recycles:
+            lines.append(f"driver recycled after {nodeid}: {reason}")
+        return lines
+
+    def write_report(self, path):
+        """Dump the raw samples and the per-NApp growth as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {'napps': self.napp_growth(), 'samples': self.samples, 'recycles': self.recycles}
+        path.write_text(json.dumps(report, indent=2))
@@ -1,14 +1,14 @@
 import time
 import requests
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.keys import Keys
+from tests.utils.timing import timed_phase
+from tests.utils.base_page import BasePage
 
 
-class PathfinderPage:
+class PathfinderPage(BasePage):
     """
     Page Object Model for the EVC creation and management page in Kytos UI.
     Encapsulates all UI interactions and locators.
@@ -36,18 +36,10 @@ class PathfinderPage:
         'submit_button': (By.XPATH, "//*[@id='app']/div[1]/div/div[7]/div/div/div/div/div[16]/button")
     }
 
-    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int):
-        self.driver = driver
-        self.base_url = base_url
-        self.api_base_url = api_url
-        self.wait = WebDriverWait(driver, default_timeout)
-        self.default_timeout = default_timeout
-
-    def _find(self, locator_name):
-        """Helper to find an element by locator name."""
-        by, value = self.SELECTORS[locator_name]
-        return self.wait.until(EC.presence_of_element_located((by, value)))
+    # Fields that must be usable for the form to be interactive
+    REQUIRED_FIELDS = ('source_input', 'destination_input')
 
+    @timed_phase('navigate')
     def navigate_to_pathfinder_form(self):
         """Navigate from homepage to EVC creation form."""
         print("Navigating to Pathfinder form...")
@@ -57,22 +49,16 @@ class PathfinderPage:
         time.sleep(3)
 
         # Click the Napp Pathfinder button to open the request circuit form
-        pathfinder_button = self.wait.until(EC.element_to_be_clickable(self.SELECTORS['napp_pathfinder_button']))
-        pathfinder_button.click()
-
-        # Wait for the form to appear
-        time.sleep(2)
-
-        # Verify that form elements are now visible
-        form_elements = self.driver.find_elements(By.CSS_SELECTOR, "input[class='k-input'], textarea, select")
-
-        if len(form_elements) > 0:
-            print(f"✅ Successfully opened Pathfinder form with {len(form_elements)} form elements")
+        # and wait for its required fields to be usable instead of a fixed delay
+        interactive = self._open_napp('napp_pathfinder_button', 'pathfinder')
+        if interactive is not None:
+            print(f"✅ Successfully opened Pathfinder form, interactive after {interactive:.2f}s")
             return True
         else:
-            print("❌ No form elements found after clicking pathfinder button")
+            print("❌ Required fields not usable after clicking pathfinder button")
             return False
 
+    @timed_phase('fill')
     def fill_path_form(self, test_data):
         """Fill the EVC creation form with provided data."""
 
@@ -147,12 +133,14 @@ class PathfinderPage:
                 print("spf_max_path_cost field not found")
 
 
+    @timed_phase('submit', opens='submit_to_visible')
     def submit_form(self):
         """Submit the EVC creation form."""
         submit_button = self.driver.find_element(*self.SELECTORS['submit_button'])
         submit_button.click()
         time.sleep(2)
 
+    @timed_phase('results', closes='submit_to_visible')
     def get_paths(self):
         """print paths."""
         paths = self.driver.find_element(*self.SELECTORS['paths'])
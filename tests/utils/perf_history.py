@@ -0,0 +1,291 @@
+"""
+Local history of the test and phase durations, kept in SQLite.
+
+Every run is recorded by the pytest session (see tests/conftest.py); the xdist
+workers of a session each record their part, sharing the session id. To compare
+the last session with the rolling baseline of the previous ones:
+
+    python -m tests.utils.perf_history report [--db PATH] [--baseline RUNS] [--alpha P]
+"""
+import os
+import sys
+import json
+import math
+import time
+import uuid
+import sqlite3
+import argparse
+import platform
+import statistics
+from contextlib import closing
+from pathlib import Path
+import requests
+
+DEFAULT_DB = 'reports/perf_history.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    base_url TEXT,
+    kytos_version TEXT,
+    environment TEXT,
+    session TEXT
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    workflow TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS phases_workflow ON phases (workflow, run_id);
+CREATE INDEX IF NOT EXISTS tests_nodeid ON tests (nodeid, run_id);
+"""
+
+# Session of a run; the runs recorded before sessions existed are sessions of their own
+SESSION = "COALESCE(session, 'run-' || id)"
+
+# Kytos core endpoints that may answer with the controller version
+VERSION_ENDPOINTS = ('kytos_version/', 'version/')
+
+
+def fetch_kytos_version(base_url, timeout=5):
+    for endpoint in VERSION_ENDPOINTS:
+        try:
+            response = requests.get(f"{base_url.rstrip('/')}/api/kytos/core/{endpoint}", timeout=timeout)
+            if response.status_code == 200:
+                data = response.json()
+                if isinstance(data, dict):
+                    data = data.get('kytos_version') or data.get('version') or data
+                return str(data)
+        except (requests.RequestException, ValueError):
+            continue
+    return None
+
+
+def environment():
+    """What describes the machine and the browser setup of a run."""
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'headless': os.getenv('HEADLESS', 'true'),
+        'default_timeout': os.getenv('DEFAULT_TIMEOUT', '10'),
+        'xdist_worker': os.getenv('PYTEST_XDIST_WORKER'),
+    }
+
+
+def connect(path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    if 'session' not in [column[1] for column in connection.execute("PRAGMA table_info(runs)")]:
+        connection.execute("ALTER TABLE runs ADD COLUMN session TEXT")
+    return connection
+
+
+class PerfHistory:
+    """
+    Collects the durations of the running session and stores them as one run.
+    The xdist workers take the session id of the controller, see conftest.
+    """
+
+    def __init__(self, path, base_url):
+        self.path = path
+        self.base_url = base_url
+        self.session = uuid.uuid4().hex
+        self.started_at = time.time()
+        self.environment = environment()
+        self.tests = []
+        self.phases = []
+        self.run_id = None
+
+    @classmethod
+    def from_env(cls):
+        """Build a history from PERF_HISTORY_DB, or None when PERF_HISTORY=false."""
+        if os.getenv('PERF_HISTORY', 'true').lower() == 'false':
+            return None
+        return cls(os.getenv('PERF_HISTORY_DB', DEFAULT_DB), os.getenv('BASE_URL', 'http://localhost:18181'))
+
+    def add_test(self, nodeid, outcome, duration, timings):
+        self.tests.append((nodeid, outcome, duration))
+        self.phases.extend((nodeid, timing.phase, timing.method, timing.duration) for timing in timings)
+
+    def save(self):
+        """Write the run to the database. Returns its id."""
+        if not self.tests:
+            return None
+        with closing(connect(self.path)) as connection, connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started_at, base_url, kytos_version, environment, session) VALUES (?, ?, ?, ?, ?)",
+                (self.started_at, self.base_url, fetch_kytos_version(self.base_url), json.dumps(self.environment),
+                 self.session),
+            )
+            self.run_id = cursor.lastrowid
+            connection.executemany("INSERT INTO tests VALUES (?, ?, ?, ?)",
+                                   [(self.run_id, *test) for test in self.tests])
+            connection.executemany("INSERT INTO phases VALUES (?, ?, ?, ?, ?)",
+                                   [(self.run_id, *phase) for phase in self.phases])
+        return self.run_id
+
+
+def mann_whitney_p(current, baseline):
+    """
+    One-sided p-value of the Mann-Whitney U test that current is slower than
+    baseline, with the normal approximation and the tie correction.
+    """
+    n1, n2 = len(current), len(baseline)
+    ranked = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks, tie_term, i = [0.0] * len(ranked), 0, 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def z_score_p(current, baseline):
+    """
+    One-sided p-value that a few current samples (fewer than a rank test
+    needs) are slower than the baseline: normal tail of the robust z-score of
+    their median against the baseline median and MAD. 0 when they are slower
+    than a baseline without any spread.
+    """
+    center = statistics.median(baseline)
+    spread = 1.4826 * statistics.median(abs(value - center) for value in baseline)
+    if spread <= 0:
+        spread = statistics.pstdev(baseline)
+    excess = statistics.median(current) - center
+    if spread <= 0:
+        return 0.0 if excess > 0 else 1.0
+    return 0.5 * math.erfc(excess / spread / math.sqrt(2))
+
+
+def _durations(connection, query, run_ids):
+    placeholders = ','.join('?' * len(run_ids))
+    samples = {}
+    for key, duration in connection.execute(query.format(placeholders), run_ids):
+        samples.setdefault(key, []).append(duration)
+    return samples
+
+
+def compare(path, run_id=None, baseline_runs=10, alpha=0.05, min_slowdown=0.1, min_samples=5, session=None):
+    """
+    Compare a session (the one of run_id or session, the last one by default)
+    with the previous baseline_runs sessions against the same controller, the
+    same interception profile and the same throttling profiles. The runs of
+    the xdist workers of a session are merged.
+
+    A key with at least min_samples durations on both sides is compared with
+    the Mann-Whitney U test. A key with fewer current durations, e.g. a test
+    or a phase that runs once per session, is compared with the robust
+    z-score of its median against the baseline and must also be slower than
+    every baseline duration. Returns (run_id, [regression dicts]), run_id
+    being the last run of the session.
+    """
+    with closing(connect(path)) as connection:
+        if session is None:
+            row = connection.execute(
+                f"SELECT {SESSION} FROM runs WHERE id = COALESCE(?, (SELECT MAX(id) FROM runs))", (run_id,)
+            ).fetchone()
+            if row is None:
+                return None, []
+            session = row[0]
+        run_ids = [row[0] for row in connection.execute(
+            f"SELECT id FROM runs WHERE {SESSION} = ? ORDER BY id", (session,))]
+        if not run_ids:
+            return None, []
+        run_id = run_ids[-1]
+        base_url, intercept, throttle = connection.execute(
+            "SELECT base_url, json_extract(environment, '$.intercept'), json_extract(environment, '$.throttle') "
+            "FROM runs WHERE id = ?", (run_id,)).fetchone()
+        sessions = [row[0] for row in connection.execute(
+            f"SELECT {SESSION}, MAX(id) AS last FROM runs WHERE id < ? AND {SESSION} != ? AND base_url IS ? "
+            "AND json_extract(environment, '$.intercept') IS ? AND json_extract(environment, '$.throttle') IS ? "
+            "GROUP BY 1 ORDER BY last DESC LIMIT ?",
+            (run_ids[0], session, base_url, intercept, throttle, baseline_runs))]
+        if not sessions:
+            return run_id, []
+        placeholders = ','.join('?' * len(sessions))
+        baseline_ids = [row[0] for row in connection.execute(
+            f"SELECT id FROM runs WHERE {SESSION} IN ({placeholders})", sessions)]
+
+        queries = {
+            'phase': "SELECT workflow, duration FROM phases WHERE run_id IN ({})",
+            'test': "SELECT nodeid, duration FROM tests WHERE outcome = 'passed' AND run_id IN ({})",
+        }
+        regressions = []
+        for kind, query in queries.items():
+            current = _durations(connection, query, run_ids)
+            baseline = _durations(connection, query, baseline_ids)
+            for key, samples in current.items():
+                reference = baseline.get(key, [])
+                if len(reference) < min_samples:
+                    continue
+                current_median, baseline_median = statistics.median(samples), statistics.median(reference)
+                if baseline_median <= 0 or current_median < baseline_median * (1 + min_slowdown):
+                    continue
+                if len(samples) >= min_samples:
+                    method, p_value = 'mann-whitney', mann_whitney_p(samples, reference)
+                elif min(samples) > max(reference):
+                    method, p_value = 'z-score', z_score_p(samples, reference)
+                else:
+                    continue
+                if p_value < alpha:
+                    regressions.append({
+                        'kind': kind, 'key': key, 'current': current_median, 'baseline': baseline_median,
+                        'slowdown': current_median / baseline_median - 1, 'p_value': p_value, 'method': method,
+                    })
+    regressions.sort(key=lambda regression: regression['slowdown'], reverse=True)
+    return run_id, regressions
+
+
+def report_lines(regressions):
+    return [
+        f"{r['kind']:<5} {r['key']}: {r['current']:.2f}s vs {r['baseline']:.2f}s "
+        f"({r['slowdown']:+.0%}, {r['method']} p={r['p_value']:.3f})"
+        for r in regressions
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performance history of the Kytos UI end-to-end tests")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    report = subparsers.add_parser('report', help="compare a run with the rolling baseline of the previous runs")
+    report.add_argument('--db', default=os.getenv('PERF_HISTORY_DB', DEFAULT_DB))
+    report.add_argument('--run', type=int, help="a run id of the session, the last session by default")
+    report.add_argument('--baseline', type=int, default=10, help="number of previous sessions in the baseline")
+    report.add_argument('--alpha', type=float, default=0.05, help="significance level")
+    report.add_argument('--min-slowdown', type=float, default=0.1, help="smallest relative slowdown reported")
+    args = parser.parse_args(argv)
+
+    run_id, regressions = compare(args.db, args.run, args.baseline, args.alpha, args.min_slowdown)
+    if run_id is None:
+        print(f"No run recorded in {args.db}")
+        return 1
+    print(f"Run {run_id}: {len(regressions)} significant slowdown(s)")
+    for line in report_lines(regressions):
+        print(line)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+import os
+import re
+import sys
+import json
+import time
+import threading
+from collections import Counter
+from pathlib import Path
+from tests.utils.timing import qualname
+
+TESTS_DIR = Path(__file__).parent.parent
+
+# Where the time of a sample goes, see HarnessProfiler.categorize
+CATEGORIES = ('webdriver', 'http', 'sleep', 'python')
+
+# Modules whose frames mean the test is blocked on chromedriver or on a NApp API
+WEBDRIVER_MODULES = (f"{os.sep}selenium{os.sep}",)
+HTTP_MODULES = (f"{os.sep}requests{os.sep}", f"{os.sep}urllib3{os.sep}", f"{os.sep}http{os.sep}client.py",
+                f"{os.sep}socket.py", f"{os.sep}ssl.py")
+
+_real_sleep = time.sleep
+
+
+def _sleep(seconds):
+    """time.sleep while profiling, a Python frame the sampler can see."""
+    _real_sleep(seconds)
+
+
+def _frame_name(frame):
+    return f"{Path(frame.f_code.co_filename).stem}:{qualname(frame)}"
+
+
+def _page_method(frame):
+    """Class.method of a page-object frame, None for any other frame."""
+    filename = frame.f_code.co_filename
+    if not filename.endswith('_page.py') or not filename.startswith(str(TESTS_DIR)):
+        return None
+    return qualname(frame)
+
+
+class HarnessProfiler:
+    """
+    Sampling profiler of the Python side of the tests.
+
+    A thread samples the stack of the test thread every interval. Each sample
+    is charged to the innermost page-object method on the stack and to what
+    the test was doing: waiting on a WebDriver command, on an HTTP request,
+    sleeping, or running Python code of its own. time.sleep is swapped for a
+    Python function while profiling, so sleeps are visible to the sampler.
+
+    Every test gets a folded stack file (<nodeid>.folded, one
+    "frame;frame;frame milliseconds" line per stack) and all of them are
+    summed into all.folded, ready for flamegraph.pl or speedscope.
+    """
+
+    def __init__(self, output_dir, interval=0.005):
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.stacks = Counter()
+        self.totals = Counter()
+        self.attribution = {}
+        self.nodeid = None
+        self._test_stacks = None
+        self._test_attribution = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._target = None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            os.getenv('HARNESS_PROFILE_DIR', 'reports/profiles'),
+            int(os.getenv('HARNESS_PROFILE_INTERVAL_MS', '5')) / 1000,
+        )
+
+    @staticmethod
+    def categorize(frames):
+        """Category of a stack given as a list of frames, innermost first."""
+        filenames = [frame.f_code.co_filename for frame in frames]
+        if any(module in filename for filename in filenames for module in WEBDRIVER_MODULES):
+            return 'webdriver'
+        if frames and frames[0].f_code is _sleep.__code__:
+            return 'sleep'
+        if any(module in filename for filename in filenames for module in HTTP_MODULES):
+            return 'http'
+        return 'python'
+
+    def start(self, nodeid):
+        """Start sampling the calling thread for a test."""
+        self.nodeid = nodeid
+        self._test_stacks = Counter()
+        self._test_attribution = Counter()
+        self._target = threading.get_ident()
+        self._stop.clear()
+        time.sleep = _sleep
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and write the folded stacks of the test."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        time.sleep = _real_sleep
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r'[^\w.-]+', '_', self.nodeid)
+        self._write_folded(self.output_dir / f"{name}.folded", self._test_stacks)
+        self.stacks.update(self._test_stacks)
+        attribution = self.attribution[self.nodeid] = {}
+        for (method, category), seconds in self._test_attribution.items():
+            attribution.setdefault(method, dict.fromkeys(CATEGORIES, 0.0))[category] += seconds
+            self.totals[(method, category)] += seconds
+
+    def _sample(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight, last = now - last, now
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            # Drop the pytest frames above the first frame of the tests directory
+            outermost = max((i for i, frame in enumerate(frames)
+                             if frame.f_code.co_filename.startswith(str(TESTS_DIR))), default=len(frames) - 1)
+            frames = frames[:outermost + 1]
+            method = next((name for name in map(_page_method, frames) if name), '(outside page objects)')
+            self._test_stacks[';'.join(_frame_name(frame) for frame in reversed(frames))] += weight
+            self._test_attribution[(method, self.categorize(frames))] += weight
+
+    @staticmethod
+    def _write_folded(path, stacks):
+        lines = [f"{stack} {round(seconds * 1000)}" for stack, seconds in sorted(stacks.items())
+                 if round(seconds * 1000) > 0]
+        path.write_text('\n'.join(lines) + '\n' if lines else '')
+
+    def save(self):
+        """Write the aggregate folded stacks and the attribution of every test."""
+        if not self.attribution:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._write_folded(self.output_dir / 'all.folded', self.stacks)
+        (self.output_dir / 'attribution.json').write_text(json.dumps(self.attribution, indent=2))
+
+    def report_lines(self, limit=15):
+        """Time per page-object method over the run, split by category, slowest first."""
+        methods = {}
+        for (method, category), seconds in self.totals.items():
+            methods.setdefault(method, Counter())[category] += seconds
+        total = sum(self.totals.values())
+        if not total:
+            return []
+        by_category = Counter()
+        for categories in methods.values():
+            by_category.update(categories)
+        lines = [f"{total:.1f}s sampled: " + ", ".join(
+            f"{category} {by_category[category] / total:.0%}" for category in CATEGORIES)]
+        lines.append(f"{'':<50}" + "".join(f"{header:>11}" for header in ('total', *CATEGORIES)))
+        ranked = sorted(methods.items(), key=lambda item: sum(item[1].values()), reverse=True)
+        for method, categories in ranked[:limit]:
+            cells = [sum(categories.values()), *(categories[category] for category in CATEGORIES)]
+            lines.append(f"{method:<50}" + "".join(f"{cell:>10.2f}s" for cell in cells))
+        return lines
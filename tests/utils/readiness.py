@@ -0,0 +1,179 @@
+import json
+import time
+import statistics
+from pathlib import Path
+from tests.utils.timing import PHASES
+
+# How long the required fields must stay enabled and in place to count as interactive
+STABLE_MS = 300
+
+# Installed before the NApp button is clicked: remembers the click time, wakes
+# up the readiness check on every DOM mutation and keeps the long tasks.
+READINESS_OBSERVER_SCRIPT = """
+if (window.__kytosReadiness) {
+    window.__kytosReadiness.observer.disconnect();
+    if (window.__kytosReadiness.longTaskObserver) window.__kytosReadiness.longTaskObserver.disconnect();
+}
+const state = window.__kytosReadiness = {clickedAt: null, listeners: [], longTasks: []};
+state.observer = new MutationObserver(() => state.listeners.forEach(listener => listener()));
+state.observer.observe(document.body, {subtree: true, childList: true, attributes: true});
+performance.setResourceTimingBufferSize(1000);
+try {
+    state.longTaskObserver = new PerformanceObserver(list => list.getEntries().forEach(
+        entry => state.longTasks.push([entry.startTime, entry.duration])));
+    state.longTaskObserver.observe({type: 'longtask'});
+} catch (e) {
+    state.longTaskObserver = null;
+}
+document.addEventListener('click', () => {
+    if (state.clickedAt === null) state.clickedAt = performance.now();
+}, {capture: true, once: true});
+"""
+
+# Resolves once every required field became enabled and stayed so (same node,
+# same box) for stableMs, with the milliseconds from the click to that moment
+# (interactive), to the end of the last UI component fetched after the click
+# (fetch), from there to interactive (compile), the long tasks in between and
+# the components (/ui/ resources). Resolves with null after timeoutMs.
+WAIT_INTERACTIVE_SCRIPT = """
+const [locators, timeoutMs, stableMs, done] = arguments;
+const state = window.__kytosReadiness;
+const startedAt = performance.now();
+const find = ([by, value]) => {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    if (by === 'id') return document.getElementById(value);
+    if (by === 'class name') return document.getElementsByClassName(value)[0] || null;
+    return document.querySelector(value);
+};
+const describe = el => {
+    if (!el) return '-';
+    const box = el.getBoundingClientRect();
+    return `${el.disabled}:${el.readOnly}:${box.x},${box.y},${box.width},${box.height}`;
+};
+const usable = el => el && el.isConnected && !el.disabled && !el.readOnly && el.getClientRects().length > 0;
+const report = (clickedAt, readyAt) => {
+    const components = performance.getEntriesByType('resource')
+        .filter(entry => entry.startTime >= clickedAt && entry.name.includes('/ui/'))
+        .map(entry => ({url: entry.name, duration: entry.duration, bytes: entry.transferSize,
+                        size: entry.decodedBodySize, end: entry.responseEnd - clickedAt}));
+    const interactive = Math.max(readyAt - clickedAt, 0);
+    const fetch = Math.min(components.reduce((last, component) => Math.max(last, component.end), 0), interactive);
+    const longTasks = (state ? state.longTasks : [])
+        .filter(([start]) => start >= clickedAt && start <= readyAt)
+        .reduce((sum, [, duration]) => sum + duration, 0);
+    return {interactive, fetch, compile: interactive - fetch, long_tasks: longTasks, components};
+};
+
+let fields = [], signature = null, readyAt = null, timer = null, finished = false;
+const finish = result => {
+    if (finished) return;
+    finished = true;
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    if (state) state.listeners = state.listeners.filter(listener => listener !== check);
+    done(result);
+};
+const check = () => {
+    if (finished) return;
+    const current = locators.map(find);
+    const currentSignature = current.map(describe).join('|');
+    const ready = current.every(usable);
+    const now = performance.now();
+    if (currentSignature !== signature || current.some((el, i) => el !== fields[i])) {
+        fields = current;
+        signature = currentSignature;
+        readyAt = ready ? now : null;
+    }
+    clearTimeout(timer);
+    if (readyAt === null) return;
+    if (now - readyAt >= stableMs) {
+        const clickedAt = state && state.clickedAt !== null ? state.clickedAt : startedAt;
+        finish(report(clickedAt, readyAt));
+    } else {
+        timer = setTimeout(check, stableMs - (now - readyAt));
+    }
+};
+const deadline = setTimeout(() => finish(null), timeoutMs);
+if (state) state.listeners.push(check);
+check();
+"""
+
+
+class ComponentLoadLog:
+    """
+    Component loads of the NApps over the run: for every opening of a NApp,
+    the time to fetch its UI components and to compile and render them. The
+    first opening of a NApp in a browser is told apart from the repeat ones,
+    which may use the HTTP cache.
+    """
+
+    def __init__(self):
+        self.loads = []
+        self._opened = set()
+
+    def record(self, napp, session, load):
+        key = (session, napp)
+        self.loads.append(dict(load, napp=napp, open='repeat' if key in self._opened else 'first'))
+        self._opened.add(key)
+
+    def report_lines(self, heaviest=3):
+        """Medians per NApp on first and repeat opening, and its heaviest components."""
+        lines = []
+        for napp in sorted({load['napp'] for load in self.loads}):
+            loads = [load for load in self.loads if load['napp'] == napp]
+            for kind in ('first', 'repeat'):
+                opened = [load for load in loads if load['open'] == kind]
+                if not opened:
+                    continue
+                median = {key: statistics.median(load[key] for load in opened) / 1000
+                          for key in ('interactive', 'fetch', 'compile', 'long_tasks')}
+                transferred = statistics.median(sum(c['bytes'] or 0 for c in load['components']) for load in opened)
+                lines.append(
+                    f"{napp:<12} {kind:<6} x{len(opened):<3} interactive {median['interactive']:.2f}s = fetch "
+                    f"{median['fetch']:.2f}s + compile/render {median['compile']:.2f}s (long tasks "
+                    f"{median['long_tasks']:.2f}s), {transferred / 1024:.0f}kB transferred"
+                )
+            components = {}
+            for load in loads:
+                if load['open'] == 'first':
+                    for component in load['components']:
+                        components.setdefault(component['url'], []).append(component)
+            ranked = sorted(components.items(), key=lambda item: max(c['duration'] for c in item[1]), reverse=True)
+            for url, fetched in ranked[:heaviest]:
+                lines.append(f"{'':<12} {max(c['duration'] for c in fetched):>7.0f}ms "
+                             f"{max(c['size'] or 0 for c in fetched) / 1024:>6.0f}kB  {url}")
+        return lines
+
+    def write_report(self, path):
+        """Dump every component load as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.loads, indent=2))
+
+
+COMPONENT_LOADS = ComponentLoadLog()
+
+
+def click_until_interactive(driver, button, locators, timeout, napp):
+    """
+    Click a NApp button and wait until the required fields of its form are
+    enabled and stable. The time to interactive is recorded as the
+    'interactive' phase of the NApp, split into the component_fetch and
+    component_compile phases, and the component load in COMPONENT_LOADS.
+    Returns it in seconds, None on timeout.
+    """
+    driver.execute_script(READINESS_OBSERVER_SCRIPT)
+    start = time.perf_counter()
+    button.click()
+    load = driver.execute_async_script(
+        WAIT_INTERACTIVE_SCRIPT, [list(locator) for locator in locators], timeout * 1000, STABLE_MS)
+    if load is None:
+        return None
+    interactive = load['interactive'] / 1000
+    PHASES.record('interactive', napp, start, interactive)
+    PHASES.record('component_fetch', napp, start, load['fetch'] / 1000)
+    PHASES.record('component_compile', napp, start, load['compile'] / 1000)
+    COMPONENT_LOADS.record(napp, getattr(driver, 'session_id', None), load)
+    return interactive
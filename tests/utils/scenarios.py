@@ -0,0 +1,85 @@
+import copy
+import json
+import datetime
+from functools import lru_cache
+from pathlib import Path
+import pytest
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+SCENARIOS_DIR = Path(__file__).parent.parent / 'scenarios'
+
+# Keys describing a case rather than the data given to the page object
+META_KEYS = ('id', 'xfail')
+
+# The format required by the maintenance NApp is 'yyyy-mm-ddThh:mm:ss+0000'
+WINDOW_TIME_FORMATS = {'datetime': "%Y-%m-%dT%H:%M:%S+0000", 'date': "%Y-%m-%d"}
+
+# Set while a test is recorded or replayed, see CassetteRecorder
+_frozen_now = None
+
+
+@lru_cache(maxsize=None)
+def _load(napp):
+    for suffix in ('.yaml', '.yml', '.json'):
+        path = SCENARIOS_DIR / f"{napp}{suffix}"
+        if path.exists():
+            break
+    else:
+        raise FileNotFoundError(f"No scenario file for {napp} in {SCENARIOS_DIR}")
+
+    if path.suffix == '.json':
+        return json.loads(path.read_text())
+    if yaml is None:
+        raise ImportError(f"PyYAML is required to load {path.name}")
+    return yaml.safe_load(path.read_text())
+
+
+def load_scenarios(napp):
+    """
+    Scenario definitions of a NApp, from tests/scenarios/<napp>.yaml (or .json).
+    The file is parsed once per process; every call returns a fresh copy.
+    """
+    return copy.deepcopy(_load(napp))
+
+
+def scenario_cases(napp, group):
+    """One pytest.param per case of a scenario group, to be used with @pytest.mark.parametrize."""
+    params = []
+    for case in load_scenarios(napp)[group]:
+        data = {key: value for key, value in case.items() if key not in META_KEYS}
+        marks = [pytest.mark.xfail(reason=case['xfail'])] if case.get('xfail') else []
+        params.append(pytest.param(data, id=case['id'], marks=marks))
+    return params
+
+
+def scenario_group(napp, group):
+    """Data of every case of a scenario group but the expected failures, for a test submitting them together."""
+    return [{key: value for key, value in case.items() if key not in META_KEYS}
+            for case in load_scenarios(napp)[group] if not case.get('xfail')]
+
+
+def freeze_clock(timestamp):
+    """Make scenario_now() return the given timestamp, or the real time again with None."""
+    global _frozen_now
+    _frozen_now = None if timestamp is None else datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+
+def scenario_now():
+    """Time the relative scenario times are computed from."""
+    return _frozen_now or datetime.datetime.now(datetime.timezone.utc)
+
+
+def build_window(window, now=None):
+    """Turn the relative times of a maintenance window scenario into start_time/end_time."""
+    now = now or scenario_now()
+    data = {key: value for key, value in window.items()
+            if key not in ('start_in_hours', 'end_in_hours', 'start_format', 'end_format')}
+    for field in ('start', 'end'):
+        when = now + datetime.timedelta(hours=window[f"{field}_in_hours"])
+        time_format = WINDOW_TIME_FORMATS[window.get(f"{field}_format", 'datetime')]
+        data[f"{field}_time"] = when.strftime(time_format)
+    return data
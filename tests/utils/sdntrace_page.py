@@ -1,12 +1,32 @@
 import time
 import requests
+from functools import partial
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
+from tests.utils.verification import verify_concurrently
+from tests.utils.timing import timed_phase
+from tests.utils.base_page import BasePage
 
-class SDNTRACEPage:
+# Optional trace fields of the form, grouped as in the sdntrace API payload
+TRACE_FIELDS = {
+    'eth': ('dl_vlan', 'dl_type', 'dl_src', 'dl_dst'),
+    'ip': ('nw_src', 'nw_dst', 'nw_proto', 'nw_tos'),
+    'tp': ('tp_src', 'tp_dst'),
+}
+# Trace fields given as integers to the API, the others are addresses
+INTEGER_TRACE_FIELDS = {'dl_vlan', 'dl_type', 'nw_proto', 'nw_tos', 'tp_src', 'tp_dst'}
+
+# (dpid, port) of every row of the "View All Traces" table, in one round trip
+TRACE_TABLE_SCRIPT = """
+const [rowsXPath] = arguments;
+const rows = document.evaluate(rowsXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const cell = (row, column) => row.cells.length > column ? row.cells[column].innerText.trim() : null;
+return Array.from({length: rows.snapshotLength}, (_, i) => rows.snapshotItem(i))
+    .map(row => [cell(row, 1), cell(row, 4)]);
+"""
+
+class SDNTRACEPage(BasePage):
     """
     Page Object Model for the management page in Kytos UI.
     Encapsulates all UI interactions and locators.
@@ -39,23 +59,16 @@ class SDNTRACEPage:
         'reset_button': (By.XPATH, "//button[contains(., 'Reset') and not(@disabled)]"),
         'view_all_traces_button': (By.XPATH, "//button[contains(., 'View All Traces') and not(@disabled)]"),
         
-        # Messages
-        'form_message_title': (By.CLASS_NAME, "notification-text notification-title"),
-        'form_message_description': (By.CLASS_NAME, "notification-text notification-description"),
-        'validation_error': (By.CSS_SELECTOR, ".validation-error, [class*='error']"),
-
         # Table element for verification
         'trace_table_first_row_dpid': (By.XPATH,"//*[@id='k-info-wrapper-id']/div/div/div[1]/div/div/table/tbody/tr[1]/td[2]"),
-        'trace_table_first_row_port': (By.XPATH,"//*[@id='k-info-wrapper-id']/div/div/div[1]/div/div/table/tbody/tr[1]/td[5]")
+        'trace_table_first_row_port': (By.XPATH,"//*[@id='k-info-wrapper-id']/div/div/div[1]/div/div/table/tbody/tr[1]/td[5]"),
+        'trace_table_rows': (By.XPATH, "//*[@id='k-info-wrapper-id']/div/div/div[1]/div/div/table/tbody/tr"),
     }
 
-    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int):
-        self.driver = driver
-        self.base_url = base_url
-        self.api_base_url = api_url
-        self.wait = WebDriverWait(driver, default_timeout)
-        self.default_timeout = default_timeout
+    # Fields that must be usable for the form to be interactive
+    REQUIRED_FIELDS = ('dpid', 'port')
 
+    @timed_phase('navigate')
     def navigate_to_sdntrace_form(self):
         """Navigate from homepage to SDNTrace form."""
         self.driver.get(self.base_url)
@@ -64,22 +77,16 @@ class SDNTRACEPage:
         time.sleep(3)
         
         # Click the SDNTrace button to open the form
-        mef_button = self.wait.until(EC.element_to_be_clickable(self.SELECTORS['sdntrace_button']))
-        mef_button.click()
-        
-        # Wait for the form to appear
-        time.sleep(2)
-        
-        # Verify that form elements are now visible
-        form_elements = self.driver.find_elements(By.CSS_SELECTOR, "input[class='k-input'], textarea, select")
-        
-        if len(form_elements) > 0:
-            print(f"✅ Successfully opened form with {len(form_elements)} form elements")
+        # and wait for its required fields to be usable instead of a fixed delay
+        interactive = self._open_napp('sdntrace_button', 'sdntrace')
+        if interactive is not None:
+            print(f"✅ Successfully opened form, interactive after {interactive:.2f}s")
             return True
         else:
-            print("❌ No form elements found after clicking the button")
+            print("❌ Required fields not usable after clicking the button")
             return False
 
+    @timed_phase('fill')
     def fill_form(self, data):
         """Fill the form with provided data."""
         
@@ -104,54 +111,77 @@ class SDNTRACEPage:
                 except NoSuchElementException:
                     print(f"{field} not found")
         
+    @timed_phase('submit', opens='submit_to_visible')
     def submit_form(self):
         """Submit the form."""
         submit_button = self.driver.find_element(*self.SELECTORS['submit_button'])
         submit_button.click()
         time.sleep(2)
 
-    def get_form_messages(self):
-        """Get success/error messages from the form."""
-        messages = {}
+    @staticmethod
+    def trace_payload(data):
+        """sdntrace API payload of a trace described like the form data."""
+        trace = {'switch': {'dpid': data['dpid'], 'in_port': int(data['port'])}}
+        for section, fields in TRACE_FIELDS.items():
+            values = {field: data[field] for field in fields if data.get(field)}
+            if values:
+                trace[section] = {field: int(value) if field in INTEGER_TRACE_FIELDS else value
+                                  for field, value in values.items()}
+        return {'trace': trace}
 
-        try:
-            success_element = self.driver.find_element(*self.SELECTORS['form_message_title'])
-            messages['success'] = success_element.text
-        except NoSuchElementException:
-            messages['success'] = None
-        
-        try:
-            error_element = self.driver.find_element(*self.SELECTORS['error_message'])
-            messages['error'] = error_element.text
-            pass
-        except NoSuchElementException:
-            messages['error'] = None
-        
-        try:
-            validation_elements = self.driver.find_elements(*self.SELECTORS['validation_error'])
-            messages['validation_errors'] = [elem.text for elem in validation_elements]
-        except NoSuchElementException:
-            messages['validation_errors'] = []
-        
-        return messages
+    def start_trace_via_api(self, data):
+        """Start a trace through the API, without the form. Returns the trace id or None."""
+        response = requests.put(self.api_base_url, json=self.trace_payload(data), timeout=self.default_timeout)
+        if response.status_code in [200, 201, 202]:
+            return response.json().get('result', {}).get('trace_id')
+        print(f"Trace refused: {response.status_code} {response.text}")
+        return None
+
+    def trace_ids_via_api(self):
+        """Ids of the traces the API has now, to tell them from the ones started afterwards."""
+        response = requests.get(self.api_base_url, timeout=self.default_timeout)
+        response.raise_for_status()
+        return set(response.json())
+
+    def find_traces_via_api(self, dpid, port, known=()):
+        """
+        Single API lookup of a trace, ignoring the trace ids in known. Returns
+        the (dpid, port) of all those traces or None if it is not there.
+        """
+        response = requests.get(self.api_base_url, timeout=self.default_timeout)
+        if response.status_code == 200:
+            traces = response.json()
+            traces = [(entry["dpid"], entry["port"]) for trace_id, data in traces.items() if trace_id not in known
+                      for entry in data["result"] if "dpid" in entry]
+            if (dpid, int(port)) in traces:
+                return traces
+        return None
 
+    @timed_phase('verify', closes='submit_to_visible')
     def verify_traces_via_api(self, dpid, port):
         """Verify trace via API."""
         start_time = time.time()
         while time.time() - start_time < self.default_timeout:
             try:
-                response = requests.get(self.api_base_url)
-                if response.status_code == 200:
-                    traces = response.json()
-                    traces = [(entry["dpid"], entry["port"]) for _, data in traces.items() for entry in data["result"] if "dpid" in entry]
-                    if (dpid, int(port)) in traces:
-                        return traces
+                traces = self.find_traces_via_api(dpid, port)
+                if traces is not None:
+                    return traces
                 time.sleep(2)
             except Exception as e:
                 print(f"API check error: {e}")
                 time.sleep(2)
         return None
 
+    @timed_phase('verify', closes='submit_to_visible')
+    def verify_all_traces_via_api(self, endpoints, known=()):
+        """
+        Verify several traces at once, sharing one timeout. endpoints is a list
+        of (dpid, port), the traces whose id is in known do not count.
+        """
+        probes = [partial(self.find_traces_via_api, dpid, port, known) for dpid, port in endpoints]
+        return verify_concurrently(probes, self.default_timeout)
+
+    @timed_phase('list')
     def click_view_all_traces(self):
         """Clicks the 'View All Traces' button."""
         list_button = self.driver.find_element(*self.SELECTORS['view_all_traces_button'])
@@ -166,4 +196,8 @@ class SDNTRACEPage:
     def get_first_port_from_table(self):
         """Gets the first trace in the table."""
         trace_dpid = self.driver.find_element(*self.SELECTORS['trace_table_first_row_port'])
-        return trace_dpid.text
\ No newline at end of file
+        return trace_dpid.text
+
+    def get_traces_from_table(self):
+        """Gets the (dpid, port) of every trace in the table."""
+        return [tuple(row) for row in self.driver.execute_script(TRACE_TABLE_SCRIPT, self.SELECTORS['trace_table_rows'][1])]
@@ -1,15 +1,73 @@
 import os
 import time
-import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.keys import Keys
+from tests.utils.base_page import BasePage
+from tests.utils.topology import TopologySnapshot
+from tests.utils.timing import timed_phase
+
+
+# Bulk read of a status table: one round trip for every cell of every row
+TABLE_ROWS_SCRIPT = """
+const rows = document.querySelectorAll(`table[data-test='${arguments[0]}'] tbody tr`);
+return Array.from(rows, row => Array.from(row.querySelectorAll('td'), cell => cell.innerText.trim()));
+"""
+
+# Set a filter input, let the UI re-render and read the filtered rows back, in one round trip
+APPLY_FILTER_SCRIPT = """
+const [xpath, value, table, done] = arguments;
+const input = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+input.value = value;
+for (const type of ['input', 'keyup', 'change']) {
+    input.dispatchEvent(new Event(type, {bubbles: true}));
+}
+requestAnimationFrame(() => setTimeout(() => {
+    const rows = document.querySelectorAll(`table[data-test='${table}'] tbody tr`);
+    done(Array.from(rows, row => Array.from(row.querySelectorAll('td'), cell => cell.innerText.trim())));
+}, 0));
+"""
+
+# Whether the page is still the dashboard opened with this token
+DASHBOARD_OPEN_SCRIPT = """
+return window.__kytosDashboard === arguments[0] && !!document.querySelector("table[data-test='switch_table']");
+"""
+
+PANELS_XPATH = "//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div"
+
+# Status tables: the panel holding them, their topology entries and, for
+# each filter, the (filter header position, cell index) of its column.
+TABLES = {
+    'switch': {
+        'panel': f"{PANELS_XPATH}/div[1]", 'entries': 'switches',
+        'cells': 6, 'filters': {'name': (1, 1), 'status': (2, 2), 'enabled': (4, 4)},
+    },
+    'link': {
+        'panel': f"{PANELS_XPATH}/div[2]", 'entries': 'links',
+        'cells': 6, 'filters': {'name': (1, 1), 'status': (2, 2), 'enabled': (4, 4)},
+    },
+    'interface': {
+        'panel': f"{PANELS_XPATH}/div[3]", 'entries': 'interfaces',
+        'cells': 7, 'filters': {'name': (1, 1), 'status': (3, 3), 'enabled': (5, 5)},
+    },
+}
+
+
+def filter_matches(cell, value):
+    """The status tables keep the rows whose column contains the filter value, ignoring case."""
+    return value.lower() in cell.lower()
+
+
+def filter_fields(entry_id, entry):
+    """What the name, status and enabled filters of a table are applied to, for one topology entry."""
+    return {
+        'name': (entry.get('metadata') or {}).get('name') or entry.get('name') or entry_id,
+        'status': str(entry.get('status', '')),
+        'enabled': str(entry.get('enabled', '')).lower(),
+    }
 
 
-class StatusmenuPage:
+class StatusmenuPage(BasePage):
     """
     Page Object Model for the Status menu page in Kytos UI.
     Encapsulates all UI interactions and locators.
@@ -19,18 +77,15 @@ class StatusmenuPage:
         'statusmenu_button': (By.CSS_SELECTOR, 'button[data-test="main-button"][title="Status Menu"]')
     }
 
-    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int):
-        self.driver = driver
-        self.base_url = base_url
-        self.api_base_url = api_url
-        self.wait = WebDriverWait(driver, default_timeout)
-        self.default_timeout = default_timeout
-
-    def _find(self, locator_name):
-        """Helper to find an element by locator name."""
-        by, value = self.SELECTORS[locator_name]
-        return self.wait.until(EC.presence_of_element_located((by, value)))
+    def __init__(self, driver: WebDriver, base_url: str, api_url: str, default_timeout: int,
+                 topology: TopologySnapshot = None):
+        super().__init__(driver, base_url, api_url, default_timeout)
+        self.filter_sample_size = int(os.getenv('FILTER_SAMPLE_SIZE', '5'))
+        self.topology = topology or TopologySnapshot.from_env(default_timeout)
+        self._dashboard = None
+        self._rows = {}
 
+    @timed_phase('navigate')
     def navigate_to_statusmenu(self):
         """Navigate from homepage to Status menu form."""
         print("Navigating to Status Menu...")
@@ -48,272 +103,99 @@ class StatusmenuPage:
 
         return True
 
-    def check_switches(self):
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='switch_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
+    def open_dashboard(self):
+        """
+        Open the status menu, unless the browser still shows the one opened
+        before. The checks share it: the rows of each table are read once per
+        opening, and the filter checks leave the tables as they found them.
+        """
+        if self._dashboard is not None and self.driver.execute_script(DASHBOARD_OPEN_SCRIPT, self._dashboard):
+            return True
+        self._rows = {}
+        if not self.navigate_to_statusmenu():
+            return False
+        self._dashboard = f"{time.time()}"
+        self.driver.execute_script("window.__kytosDashboard = arguments[0];", self._dashboard)
+        return True
 
-        num_switches_ui=len(rows)
+    def _table_rows(self, table):
+        """Text of every cell of every row of a status table, read once per opening of the dashboard."""
+        if table not in self._rows:
+            self._rows[table] = self.driver.execute_script(TABLE_ROWS_SCRIPT, f"{table}_table")
+        return self._rows[table]
 
+    def _fetch_topology(self, kind):
+        """Topology entries of a table, from the topology snapshot."""
         try:
-            response = requests.get(os.getenv('API_SWITCHES_URL'))
-            if response.status_code == 200:
-                switches = response.json()
+            return self.topology.entries(TABLES[kind]['entries'])
         except Exception as e:
             print(f"API check error: {e}")
+            return None
+
+    def _check_count(self, kind):
+        rows = self._table_rows(kind)
+        entries = self._fetch_topology(kind)
+        if entries is None:
+            return False
+        print(f"Number of {kind}s: {len(entries)}")
+        return len(rows) == len(entries)
+
+    def _filter_values(self, kind, column, fields):
+        """Filter values to try for a column, taken from the topology."""
+        if column == 'enabled':
+            return ['true', 'false']
+        if column == 'status':
+            statuses = {entry['status'].lower() for entry in fields}
+            return sorted((statuses - {''}) | {'up'})
+        values = [os.getenv(f"{kind}_filter_value")]
+        values += list(dict.fromkeys(entry['name'] for entry in fields if entry['name']))[:self.filter_sample_size]
+        return [value for value in values if value]
+
+    def _check_filters(self, kind):
+        """
+        Apply many values to each filter of a table and compare the column of
+        the rows shown with the entries of the topology the filter should keep.
+        """
+        spec = TABLES[kind]
+        entries = self._fetch_topology(kind)
+        if entries is None:
+            return False
+        fields = [filter_fields(entry_id, entry) for entry_id, entry in entries.items()]
+        consistent = True
+        for column, (header, cell) in spec['filters'].items():
+            xpath = f"{spec['panel']}/div/div[2]/table/thead/tr[2]/th[{header}]/input"
+            for value in self._filter_values(kind, column, fields):
+                shown = self.driver.execute_async_script(APPLY_FILTER_SCRIPT, xpath, value, f"{kind}_table")
+                assert all(len(row) == spec['cells'] for row in shown), \
+                    f"Expected {spec['cells']} tds in every {kind} row"
+                expected = sorted(entry[column].lower() for entry in fields if filter_matches(entry[column], value))
+                if sorted(row[cell].lower() for row in shown) != expected:
+                    print(f"❌ {kind} {column} filter '{value}': {len(shown)} rows shown, {len(expected)} expected")
+                    consistent = False
+            # Clear the filter before moving on to the next one
+            self.driver.execute_async_script(APPLY_FILTER_SCRIPT, xpath, '', f"{kind}_table")
+        return consistent
+
+    @timed_phase('check')
+    def check_switches(self):
+        return self._check_count('switch')
 
-        # Get count of switches
-        num_switches_api = len(switches['switches'])
-        print(f"Number of switches: {num_switches_api}")
-
-        if num_switches_ui==num_switches_api:
-            return True
-
+    @timed_phase('filter')
     def check_switches_filters(self):
-        switchName_Filter=self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[1]/div/div[2]/table/thead/tr[2]/th[1]/input")
-        switchName_Filter.click()
-        filter_test_value=os.getenv('switch_filter_value')
-        switchName_Filter.send_keys(filter_test_value)
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='switch_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_switches_filter = len(rows)
-        name_flag=0
-        if num_switches_filter==0:
-            name_flag=1
-        else:
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 6, f"Expected 6 tds, found {len(cells)}"
-                print(cells[1].text)
-                if cells[1].text==filter_test_value:
-                    name_flag=1
-
-        for _ in range(len(filter_test_value)):
-            switchName_Filter.send_keys(Keys.BACKSPACE)
-
-        switchStatus_Filter=self.driver.find_element(By.XPATH, "//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[1]/div/div[2]/table/thead/tr[2]/th[2]/input")
-        switchStatus_Filter.click()
-        switchStatus_Filter.send_keys('up')
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='switch_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_switches_filter = len(rows)
-        status_flag = 0
-        if num_switches_filter == 0:
-            status_flag = 1
-        else:
-            status_flag = 1
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 6, f"Expected 6 tds, found {len(cells)}"
-                print(cells[2].text)
-                if cells[2].text != 'UP':
-                    status_flag = 0
-
-        for _ in range(2):
-            switchStatus_Filter.send_keys(Keys.BACKSPACE)
-
-        switchEnabled_Filter=self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[1]/div/div[2]/table/thead/tr[2]/th[4]/input")
-        switchEnabled_Filter.click()
-        switchEnabled_Filter.send_keys('true')
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='switch_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_switches_filter = len(rows)
-        enabled_flag = 0
-        if num_switches_filter == 0:
-            enabled_flag = 1
-        else:
-            enabled_flag = 1
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 6, f"Expected 6 tds, found {len(cells)}"
-                print(cells[4].text)
-                if cells[4].text != 'true':
-                    enabled_flag = 0
-
-        switch_table=self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[1]/label")
-        switch_table.click()
-        time.sleep(2)
-
-        if name_flag==1 and status_flag==1 and enabled_flag==1:
-            return True
+        return self._check_filters('switch')
 
+    @timed_phase('check')
     def check_links(self):
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='link_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-
-        num_links_ui = len(rows)
-
-        try:
-            response = requests.get(os.getenv('API_LINKS_URL'))
-            if response.status_code == 200:
-                links = response.json()
-        except Exception as e:
-            print(f"API check error: {e}")
-
-        # Get count of links
-        num_links_api = len(links['links'])
-        print(f"Number of links: {num_links_api}")
-
-        if num_links_ui == num_links_api:
-            return True
+        return self._check_count('link')
 
+    @timed_phase('filter')
     def check_links_filters(self):
-        linkName_Filter = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/table/thead/tr[2]/th[1]/input")
-        linkName_Filter.click()
-        filter_test_value = os.getenv('link_filter_value')
-        linkName_Filter.send_keys(filter_test_value)
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='link_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_links_filter = len(rows)
-        name_flag = 0
-        if num_links_filter == 0:
-            name_flag = 1
-        else:
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 6, f"Expected 6 tds, found {len(cells)}"
-                print(cells[1].text)
-                if cells[1].text == filter_test_value:
-                    name_flag = 1
-
-        for _ in range(len(filter_test_value)):
-            linkName_Filter.send_keys(Keys.BACKSPACE)
-
-        linkStatus_Filter = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/table/thead/tr[2]/th[2]/input")
-        linkStatus_Filter.click()
-        linkStatus_Filter.send_keys('up')
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='link_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_links_filter = len(rows)
-        status_flag = 0
-        if num_links_filter == 0:
-            status_flag = 1
-        else:
-            status_flag = 1
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 6, f"Expected 6 tds, found {len(cells)}"
-                print(cells[2].text)
-                if cells[2].text != 'UP':
-                    status_flag = 0
-
-        for _ in range(2):
-            linkStatus_Filter.send_keys(Keys.BACKSPACE)
-
-        linkEnabled_Filter = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/table/thead/tr[2]/th[4]/input")
-        linkEnabled_Filter.click()
-        linkEnabled_Filter.send_keys('true')
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='link_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_links_filter = len(rows)
-        enabled_flag = 0
-        if num_links_filter == 0:
-            enabled_flag = 1
-        else:
-            enabled_flag = 1
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 6, f"Expected 6 tds, found {len(cells)}"
-                print(cells[4].text)
-                if cells[4].text != 'true':
-                    enabled_flag = 0
+        return self._check_filters('link')
 
-        link_table = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[2]/label")
-        link_table.click()
-        time.sleep(2)
-
-        if name_flag == 1 and status_flag == 1 and enabled_flag == 1:
-            return True
+    @timed_phase('check')
     def check_interfaces(self):
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='interface_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-
-        num_interfaces_ui = len(rows)
-
-        try:
-            response = requests.get(os.getenv('API_INTERFACES_URL'))
-            if response.status_code == 200:
-                interfaces = response.json()
-        except Exception as e:
-            print(f"API check error: {e}")
-
-        # Get count of interfaces
-        num_interfaces_api = len(interfaces['interfaces'])
-        print(f"Number of interfaces: {num_interfaces_api}")
-
-        if num_interfaces_ui == num_interfaces_api:
-            return True
+        return self._check_count('interface')
 
+    @timed_phase('filter')
     def check_interfaces_filters(self):
-        interfaceNode_Filter = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[3]/div/div[2]/table/thead/tr[2]/th[1]/input")
-        interfaceNode_Filter.click()
-        filter_test_value = os.getenv('interface_filter_value')
-        interfaceNode_Filter.send_keys(filter_test_value)
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='interface_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_interface_filter = len(rows)
-        name_flag = 0
-        if num_interface_filter == 0:
-            name_flag = 1
-        else:
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 7, f"Expected 7 tds, found {len(cells)}"
-                print(cells[1].text)
-                if cells[1].text == filter_test_value:
-                    name_flag = 1
-
-        for _ in range(len(filter_test_value)):
-            interfaceNode_Filter.send_keys(Keys.BACKSPACE)
-
-        interfaceStatus_Filter = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[3]/div/div[2]/table/thead/tr[2]/th[3]/input")
-        interfaceStatus_Filter.click()
-        interfaceStatus_Filter.send_keys('up')
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='interface_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_interface_filter = len(rows)
-        status_flag = 0
-        if num_interface_filter == 0:
-            status_flag = 1
-        else:
-            status_flag = 1
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 7, f"Expected 7 tds, found {len(cells)}"
-                print(cells[3].text)
-                if cells[3].text != 'UP':
-                    status_flag = 0
-
-        for _ in range(2):
-            interfaceStatus_Filter.send_keys(Keys.BACKSPACE)
-
-        interfaceEnabled_Filter = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[3]/div/div[2]/table/thead/tr[2]/th[5]/input")
-        interfaceEnabled_Filter.click()
-        interfaceEnabled_Filter.send_keys('true')
-
-        table = self.driver.find_element(By.XPATH, "//table[@data-test='interface_table']")
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
-        num_interface_filter = len(rows)
-        enabled_flag = 0
-        if num_interface_filter == 0:
-            enabled_flag = 1
-        else:
-            enabled_flag = 1
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                assert len(cells) == 7, f"Expected 7 tds, found {len(cells)}"
-                print(cells[5].text)
-                if cells[5].text != 'true':
-                    enabled_flag = 0
-
-        interface_table = self.driver.find_element(By.XPATH,"//*[@id='app']/div[1]/div/div[2]/div/div[2]/div/div[2]/div/div[3]/label")
-        interface_table.click()
-        time.sleep(2)
-
-        if name_flag == 1 and status_flag == 1 and enabled_flag == 1:
-            return True
\ No newline at end of file
+        return self._check_filters('interface')
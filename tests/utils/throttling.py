@@ -0,0 +1,51 @@
+from tests.utils.scenarios import load_scenarios
+
+# Profile name meaning the browser runs unthrottled
+NO_THROTTLING = 'none'
+
+
+def load_profiles():
+    """Throttling profiles of tests/scenarios/throttling.yaml, plus the unthrottled one."""
+    return {NO_THROTTLING: {}, **load_scenarios('throttling')}
+
+
+def apply_profile(driver, settings):
+    """Apply network and CPU throttling to a browser, an empty profile removes it."""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
+        'offline': False,
+        'latency': settings.get('latency_ms', 0),
+        'downloadThroughput': settings['download_kbps'] * 1000 / 8 if 'download_kbps' in settings else -1,
+        'uploadThroughput': settings['upload_kbps'] * 1000 / 8 if 'upload_kbps' in settings else -1,
+    })
+    driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': settings.get('cpu_slowdown', 1)})
+    if 'window_size' in settings:
+        width, height = settings['window_size']
+        driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride',
+                               {'width': width, 'height': height, 'deviceScaleFactor': 0, 'mobile': False})
+    else:
+        driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+
+
+class Throttler:
+    """
+    Keeps the browser of the driver fixture under the throttling profile of
+    the running test. A profile is only applied when it changes, and again
+    to every new browser (see RecyclableDriver.start_listeners).
+    """
+
+    def __init__(self, profiles):
+        self.profiles = profiles
+        self.profile = NO_THROTTLING
+
+    def attach(self, driver):
+        if self.profile != NO_THROTTLING:
+            apply_profile(driver, self.profiles[self.profile])
+
+    def use(self, profile, driver=None):
+        """Switch to a profile; driver is the running browser, None if it is not started yet."""
+        if profile == self.profile:
+            return
+        self.profile = profile
+        if driver is not None:
+            apply_profile(driver, self.profiles[profile])
@@ -0,0 +1,134 @@
+import time
+import functools
+import threading
+from collections import namedtuple
+
+PhaseTiming = namedtuple('PhaseTiming', 'phase method start duration')
+
+
+class SLOWarning(UserWarning):
+    """A page-object phase exceeded its budget in a test with @pytest.mark.slo(strict=False)."""
+
+
+def qualname(frame):
+    """
+    Class.method of a frame. co_qualname is new in Python 3.11, before it the
+    class is taken from the self (or cls) argument of the frame, if any.
+    """
+    code = frame.f_code
+    if hasattr(code, 'co_qualname'):
+        return code.co_qualname
+    if code.co_argcount and code.co_varnames[0] in ('self', 'cls'):
+        owner = frame.f_locals.get(code.co_varnames[0])
+        if owner is not None:
+            owner = owner if isinstance(owner, type) else type(owner)
+            return f"{owner.__name__}.{code.co_name}"
+    return code.co_name
+
+
+def _found(result):
+    """Whether a page-object result means the resource is visible."""
+    if isinstance(result, list):
+        return bool(result) and all(item is not None for item in result)
+    return bool(result)
+
+
+class PhaseLog:
+    """
+    Durations of the page-object phases of the running test.
+
+    Besides the phases of the decorated methods, a span can be opened by one
+    method and closed by another one, e.g. submit_to_visible goes from the
+    first submit_form to the verification that finds the resource.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.timings = []
+
+    def reset(self):
+        with self._lock:
+            self.timings = []
+        self._local.__dict__.clear()
+
+    @property
+    def _stack(self):
+        return self._local.__dict__.setdefault('stack', [])
+
+    @property
+    def _spans(self):
+        return self._local.__dict__.setdefault('spans', {})
+
+    @property
+    def current_step(self):
+        """Page-object method running in this thread, if any."""
+        return self._stack[-1] if self._stack else None
+
+    def steps(self):
+        """Step stack of this thread, for another thread to read its current step."""
+        return self._stack
+
+    def push_step(self, method):
+        self._stack.append(method)
+
+    def pop_step(self):
+        self._stack.pop()
+
+    def record(self, phase, method, start, duration):
+        with self._lock:
+            self.timings.append(PhaseTiming(phase, method, start, duration))
+
+    def durations(self, phase):
+        return [timing.duration for timing in self.timings if timing.phase == phase]
+
+    def open_span(self, name, method):
+        self._spans.setdefault(name, (time.perf_counter(), method))
+
+    def close_span(self, name, method):
+        """Record a span as the workflow from the method that opened it to this one."""
+        span = self._spans.pop(name, None)
+        if span is not None:
+            start, opener = span
+            workflow = f"{opener}→{method.rsplit('.', 1)[-1]}"
+            self.record(name, workflow, start, time.perf_counter() - start)
+
+
+PHASES = PhaseLog()
+
+
+def timed_phase(phase, opens=None, closes=None):
+    """
+    Decorator timing a page-object method as a phase of the running test.
+
+    opens starts a span when the method is called; closes ends it when the
+    method returns a result meaning the resource is visible.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            qualname = f"{type(self).__name__}.{method.__name__}"
+            if opens:
+                PHASES.open_span(opens, qualname)
+            PHASES.push_step(qualname)
+            start = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                PHASES.pop_step()
+                PHASES.record(phase, qualname, start, time.perf_counter() - start)
+            if closes and _found(result):
+                PHASES.close_span(closes, qualname)
+            return result
+        return wrapper
+    return decorator
+
+
+def slo_violations(budgets, phase_log=PHASES):
+    """Messages for every phase whose slowest run went over its budget, in seconds."""
+    violations = []
+    for phase, budget in budgets.items():
+        durations = phase_log.durations(phase)
+        if durations and max(durations) > budget:
+            violations.append(f"{phase} took {max(durations):.2f}s, budget is {budget:.2f}s")
+    return violations
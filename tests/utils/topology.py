@@ -0,0 +1,89 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+# Topology endpoints: kind -> (environment variable, default url)
+TOPOLOGY_ENDPOINTS = {
+    'switches': ('API_SWITCHES_URL', 'http://localhost:18181/api/kytos/topology/v3/switches'),
+    'links': ('API_LINKS_URL', 'http://localhost:18181/api/kytos/topology/v3/links'),
+    'interfaces': ('API_INTERFACES_URL', 'http://localhost:18181/api/kytos/topology/v3/interfaces'),
+}
+
+
+class TopologySnapshot:
+    """
+    Switches, links and interfaces of the controller, fetched concurrently on
+    first use and kept until invalidate() is called.
+
+    The topology API already keys switches by dpid, interfaces by interface id
+    and links by link id; the snapshot adds the interfaces of each switch and
+    the switches by name.
+    """
+
+    def __init__(self, urls, timeout, payload_for=None):
+        self.urls = urls
+        self.timeout = timeout
+        # Serves the payload of a url instead of the controller, see ApiInterceptor
+        self.payload_for = payload_for
+        self._lock = threading.Lock()
+        self._data = None
+
+    @classmethod
+    def from_env(cls, timeout, payload_for=None):
+        urls = {kind: os.getenv(env_var, default) for kind, (env_var, default) in TOPOLOGY_ENDPOINTS.items()}
+        return cls(urls, timeout, payload_for)
+
+    def _get(self, kind):
+        payload = self.payload_for(self.urls[kind]) if self.payload_for else None
+        if payload is not None:
+            return payload[kind]
+        response = requests.get(self.urls[kind], timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()[kind]
+
+    def _fetch(self):
+        with ThreadPoolExecutor(max_workers=len(self.urls)) as executor:
+            data = dict(zip(self.urls, executor.map(self._get, self.urls)))
+
+        data['interfaces_by_switch'] = {}
+        for interface_id, interface in data['interfaces'].items():
+            dpid = interface.get('switch') or interface_id.rsplit(':', 1)[0]
+            data['interfaces_by_switch'].setdefault(dpid, {})[interface_id] = interface
+        data['switches_by_name'] = {}
+        for dpid, switch in data['switches'].items():
+            name = (switch.get('metadata') or {}).get('name') or switch.get('name')
+            if name:
+                data['switches_by_name'][name] = switch
+        return data
+
+    @property
+    def data(self):
+        with self._lock:
+            if self._data is None:
+                self._data = self._fetch()
+            return self._data
+
+    def invalidate(self):
+        """Drop the snapshot, the next lookup fetches the topology again."""
+        with self._lock:
+            self._data = None
+
+    def entries(self, kind):
+        """All the switches, links or interfaces, keyed by their id."""
+        return self.data[kind]
+
+    def switch(self, dpid):
+        return self.data['switches'].get(dpid)
+
+    def switch_by_name(self, name):
+        return self.data['switches_by_name'].get(name)
+
+    def interface(self, interface_id):
+        return self.data['interfaces'].get(interface_id)
+
+    def interfaces_of(self, dpid):
+        return self.data['interfaces_by_switch'].get(dpid, {})
+
+    def link(self, link_id):
+        return self.data['links'].get(link_id)
@@ -0,0 +1,182 @@
+"""
+sdntrace over the whole fabric at once.
+
+Every (dpid, port) of the topology is traced through the sdntrace API, with at
+most --workers traces in flight. Each trace is polled until its result is
+complete, and a sample of the completed traces is then looked up in the
+"View All Traces" table of the UI:
+
+    python -m tests.utils.trace_fanout run [--workers 16] [--sample 10] [--switches DPID,...]
+                                           [--include-disabled] [--output PATH]
+
+It reports the completion latency (p50/p95/max) and the failure rate of the
+traces of each switch, and the sampled traces missing from the UI.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+import requests
+from tests.utils.bench import BenchClient, latency_stats, stats_line
+from tests.utils.browser import start_chrome_driver
+from tests.utils.sdntrace_page import SDNTRACEPage
+from tests.utils.topology import TopologySnapshot
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent.parent / '.env')
+except ImportError:
+    pass
+
+# OpenFlow local port of a switch, not a traceable port
+LOCAL_PORT = 4294967294
+
+# Entry types of a trace result that end the trace
+FINAL_TYPES = ('last', 'loop', 'error')
+
+POLL_INTERVAL = 0.2
+
+
+def trace_endpoints(snapshot, switches=None, include_disabled=False):
+    """(dpid, port) of every interface of the topology, sorted, optionally of some switches only."""
+    endpoints = set()
+    for interface_id, interface in snapshot.entries('interfaces').items():
+        dpid = interface.get('switch') or interface_id.rsplit(':', 1)[0]
+        port = interface.get('port_number')
+        if port is None or port == LOCAL_PORT or (switches and dpid not in switches):
+            continue
+        if not include_disabled and not interface.get('enabled', True):
+            continue
+        endpoints.add((dpid, int(port)))
+    return sorted(endpoints)
+
+
+class TraceClient(BenchClient):
+    """Concurrent sdntrace requests, each polled until the trace ends."""
+
+    def _result(self, trace_id):
+        """Result entries of a trace, None while it is still running."""
+        response = self.session.get(f"{self.api_url.rstrip('/')}/{trace_id}", timeout=self.timeout)
+        if response.status_code != 200:
+            return None
+        result = response.json().get('result')
+        # A running trace has no result list yet, a finished one ends with a final entry
+        if isinstance(result, list) and result and result[-1].get('type') in FINAL_TYPES:
+            return result
+        return None
+
+    def trace(self, endpoint):
+        """Start a trace and wait for its result. Returns what happened, with its latency."""
+        dpid, port = endpoint
+        outcome = {'dpid': dpid, 'port': port, 'trace_id': None, 'latency': None, 'error': None}
+        start = time.perf_counter()
+        try:
+            response = self.session.put(self.api_url, json=SDNTRACEPage.trace_payload({'dpid': dpid, 'port': port}),
+                                        timeout=self.timeout)
+            if response.status_code not in [200, 201, 202]:
+                outcome['error'] = f"refused: {response.status_code}"
+                return outcome
+            trace_id = outcome['trace_id'] = response.json().get('result', {}).get('trace_id')
+            while time.perf_counter() - start < self.timeout:
+                result = self._result(trace_id)
+                if result is not None:
+                    outcome['latency'] = time.perf_counter() - start
+                    outcome['hops'] = sum(1 for entry in result if entry.get('type') == 'trace')
+                    if result[-1].get('type') == 'error':
+                        outcome['error'] = f"trace error: {result[-1].get('message', 'no message')}"
+                    return outcome
+                time.sleep(POLL_INTERVAL)
+            outcome['error'] = "not complete before the timeout"
+        except (requests.RequestException, ValueError) as e:
+            outcome['error'] = repr(e)
+        return outcome
+
+
+def verify_sample(config, outcomes, size):
+    """Look up a random sample of the completed traces in the "View All Traces" table."""
+    completed = [outcome for outcome in outcomes if outcome['error'] is None]
+    sample = random.sample(completed, min(size, len(completed)))
+    if not sample:
+        return {'sampled': 0, 'missing': []}
+    driver = start_chrome_driver(config.timeout)
+    try:
+        sdntrace_page = SDNTRACEPage(driver, config.base_url, config.api_url, config.timeout)
+        sdntrace_page.navigate_to_sdntrace_form()
+        sdntrace_page.click_view_all_traces()
+        listed = set(sdntrace_page.get_traces_from_table())
+    finally:
+        driver.quit()
+    missing = [(outcome['dpid'], outcome['port']) for outcome in sample
+               if (outcome['dpid'], str(outcome['port'])) not in listed]
+    return {'sampled': len(sample), 'listed': len(listed), 'missing': missing}
+
+
+def summarize(outcomes, wall_time):
+    """Latency distribution and failure rate of the traces of each switch, and of all of them."""
+    by_switch = {}
+    for outcome in outcomes:
+        by_switch.setdefault(outcome['dpid'], []).append(outcome)
+
+    return {
+        'total': dict(latency_stats(outcomes, wall_time), wall_time=wall_time),
+        'switches': {dpid: latency_stats(group) for dpid, group in sorted(by_switch.items())},
+    }
+
+
+def report_lines(summary, verification):
+    total = summary['total']
+    lines = [f"{total['count']} traces in {total['wall_time']:.1f}s: {stats_line(total)}"]
+    # Worst switches first: failures, then slowest p95
+    ranked = sorted(summary['switches'].items(),
+                    key=lambda item: (item[1]['error_rate'], item[1]['p95'] or 0), reverse=True)
+    for dpid, switch in ranked:
+        lines.append(f"  {dpid}: {switch['count']:>4} traces, {stats_line(switch)}")
+    if verification['sampled']:
+        lines.append(f"UI: {verification['sampled'] - len(verification['missing'])} of "
+                     f"{verification['sampled']} sampled traces in the table ({verification['listed']} rows)")
+        for dpid, port in verification['missing']:
+            lines.append(f"  missing from the table: {dpid} port {port}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="sdntrace of every switch port at once")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run = subparsers.add_parser('run', help="trace every (dpid, port) of the topology")
+    run.add_argument('--workers', type=int, default=16, help="traces in flight at once")
+    run.add_argument('--sample', type=int, default=10, help="completed traces looked up in the UI, 0 for none")
+    run.add_argument('--switches', help="comma separated dpids, all the switches by default")
+    run.add_argument('--include-disabled', action='store_true', help="also trace the disabled interfaces")
+    run.add_argument('--output', help="write the outcomes and the summary as JSON")
+    args = parser.parse_args(argv)
+
+    config = argparse.Namespace(
+        base_url=os.getenv('BASE_URL', 'http://localhost:18181'),
+        api_url=os.getenv('API_SDNTRACE_URL', 'http://localhost:18181/api/amlight/sdntrace/v1/trace/'),
+        timeout=int(os.getenv('DEFAULT_TIMEOUT', '10')),
+    )
+    switches = set(args.switches.split(',')) if args.switches else None
+    endpoints = trace_endpoints(TopologySnapshot.from_env(config.timeout), switches, args.include_disabled)
+    if not endpoints:
+        print("No interface to trace in the topology")
+        return 1
+
+    print(f"Tracing {len(endpoints)} ports with {args.workers} traces in flight...")
+    client = TraceClient(config.api_url, config.timeout, args.workers)
+    outcomes, wall_time = client.run(client.trace, endpoints)
+    summary = summarize(outcomes, wall_time)
+    verification = verify_sample(config, outcomes, args.sample)
+    for line in report_lines(summary, verification):
+        print(line)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(
+            {'summary': summary, 'verification': verification, 'outcomes': outcomes}, indent=2))
+    return 0 if not summary['total']['error_rate'] and not verification['missing'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import asyncio
+
+
+async def _poll(probe, deadline, interval):
+    """Call a blocking probe in a worker thread until it returns a result or the deadline passes."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            result = await asyncio.to_thread(probe)
+        except Exception as e:
+            print(f"API check error: {e}")
+            result = None
+        if result is not None:
+            return result
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(interval, remaining))
+
+
+async def verify_all(probes, timeout, interval=2):
+    """
+    Poll every probe concurrently with one shared deadline.
+
+    A probe is a callable doing a single API lookup and returning None while
+    the resource is not there yet. Returns the results in the order of the
+    probes, None for the ones that timed out.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    return await asyncio.gather(*(_poll(probe, deadline, interval) for probe in probes))
+
+
+def verify_concurrently(probes, timeout, interval=2):
+    """Synchronous entry point of verify_all for the tests."""
+    return asyncio.run(verify_all(probes, timeout, interval))